@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: benchmarks/bench_load.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Eager vs streaming load of a large tasks.json.
+
+For each size a file is generated once, then each mode runs in a fresh
+subprocess so peak RSS is measured in isolation. "first screen" is the time
+until the controller holds enough tasks to draw the first screenful (the
+whole file for the eager path, the first chunk when streaming); "total" is
+the time until every task is loaded.
+
+Usage:
+PYTHONPATH=src python benchmarks/bench_load.py [--sizes 10000,100000,...]
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task
+from todo_list_tk.storage import JsonStore, save_tasks
+
+FIRST_SCREEN = 50
+
+
+def measure(path: Path, streaming: bool) -> dict:
+    start = time.perf_counter()
+    c = Controller(JsonStore(path), streaming=streaming)
+    while len(c) < FIRST_SCREEN and c.load_next_chunk():
+        pass
+    first = time.perf_counter() - start
+    c.load_all()
+    total = time.perf_counter() - start
+    return {"first": first, "total": total, "rss_mb": peak_rss_mb(), "tasks": len(c)}
+
+
+def peak_rss_mb() -> float:
+    # Linux keeps ru_maxrss across fork/exec, so prefer this process image's own high-water mark.
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+
+def run_child(path: Path, streaming: bool) -> dict:
+    cmd = [sys.executable, __file__, "--child", str(path)] + (["--streaming"] if streaming else [])
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True, env=os.environ).stdout
+    return json.loads(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Eager vs streaming load benchmark")
+    parser.add_argument("--sizes", default="10000,100000,500000")
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--streaming", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(measure(args.child, args.streaming)))
+        return
+
+    print(f"{'tasks':>8}  {'mode':>6}  {'first screen (ms)':>17}  {'total (ms)':>10}  {'peak RSS (MB)':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tasks.json"
+        for n in (int(s) for s in args.sizes.split(",")):
+            save_tasks((Task(id=f"{i:032x}", title=f"Task number {i}") for i in range(n)), path)
+            for streaming in (False, True):
+                r = run_child(path, streaming)
+                mode = "stream" if streaming else "eager"
+                print(
+                    f"{n:>8}  {mode:>6}  {r['first'] * 1e3:>17.1f}  "
+                    f"{r['total'] * 1e3:>10.1f}  {r['rss_mb']:>13.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
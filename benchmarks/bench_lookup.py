@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: benchmarks/bench_lookup.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Microbenchmark: per-operation cost of id lookups and toggles in
+`Controller` for stores of 1k to 1M tasks. With the id index both should
+stay flat as the store grows.
+
+Usage:
+PYTHONPATH=src python benchmarks/bench_lookup.py [--sizes 1000,10000,...]
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task
+from todo_list_tk.storage import MemoryStore
+
+OPS = 20_000
+
+
+def bench(n: int) -> tuple[float, float]:
+    c = Controller(MemoryStore(Task(id=f"{i:032x}", title=f"Task {i}") for i in range(n)))
+    ids = [f"{random.randrange(n):032x}" for _ in range(OPS)]
+
+    start = time.perf_counter()
+    for task_id in ids:
+        c.get(task_id)
+    lookup = (time.perf_counter() - start) / OPS
+
+    start = time.perf_counter()
+    for task_id in ids:
+        c.toggle_task(task_id)
+    toggle = (time.perf_counter() - start) / OPS
+    return lookup, toggle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Controller lookup microbenchmark")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    args = parser.parse_args()
+
+    print(f"{'tasks':>10}  {'get (ns/op)':>12}  {'toggle (ns/op)':>15}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        lookup, toggle = bench(n)
+        print(f"{n:>10}  {lookup * 1e9:>12.0f}  {toggle * 1e9:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
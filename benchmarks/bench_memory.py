@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: benchmarks/bench_memory.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Memory per task and access cost of a `Controller` holding its tasks in a
+`TaskDict` vs the compact `TaskTable` (`compact=True`).
+
+Usage:
+PYTHONPATH=src python benchmarks/bench_memory.py [--sizes 100000,1000000]
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from bench_suite import synthetic_tasks
+from todo_list_tk.controller import Controller
+from todo_list_tk.storage import MemoryStore, load_tasks, save_tasks
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Controller memory benchmark")
+    parser.add_argument("--sizes", default="100000,1000000")
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8}  {'table':>8}  {'bytes/task':>10}  {'init (s)':>9}  {'get (us)':>9}  {'scan (ms)':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tasks.json"
+        for n in (int(s) for s in args.sizes.split(",")):
+            tasks = synthetic_tasks(n)
+            save_tasks(tasks, path)
+            ids = [t.id for t in tasks[:: max(1, n // 10_000)]]
+            del tasks
+            for compact in (False, True):
+                # Load inside the trace so the controller owns every task it holds.
+                gc.collect()
+                tracemalloc.start()
+                store = MemoryStore(load_tasks(path))
+                start = time.perf_counter()
+                c = Controller(store, compact=compact)
+                init_s = time.perf_counter() - start
+                store.tasks = []
+                gc.collect()
+                held = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+                get_s = timed(lambda c=c, ids=ids: [c.get(i) for i in ids])
+                scan_s = timed(lambda c=c: sum(t.done for t in c.view("all")))
+                print(
+                    f"{n:>8}  {'compact' if compact else 'dict':>8}  {held / n:>10.0f}  {init_s:>9.2f}  "
+                    f"{get_s / len(ids) * 1e6:>9.2f}  {scan_s * 1e3:>10.1f}"
+                )
+                c.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: benchmarks/bench_server.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Load test for the local JSON API server (`todo_list_tk.server`).
+
+Starts the server in a subprocess on a free localhost port over a
+synthetic store (pinned to one CPU where the OS allows it), then drives it
+from `--clients` keep-alive connections. Each client syncs the way a widget
+would: it pages `/tasks` with `If-None-Match`, follows `/changes` from the
+generation it last saw, and now and then toggles a task. Reports
+throughput, latency percentiles and the status mix.
+
+Usage:
+PYTHONPATH=src python benchmarks/bench_server.py [--tasks 100000] [--clients 300]
+    [--requests 200] [--write-ratio 0.02] [--backend journal]
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from bench_suite import synthetic_tasks
+from todo_list_tk.storage import save_tasks
+
+
+async def request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, target: str,
+    body: Optional[bytes] = None, etag: Optional[str] = None,
+) -> Tuple[int, Optional[str], bytes]:
+    head = f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body or b'')}\r\n"
+    if etag:
+        head += f"If-None-Match: {etag}\r\n"
+    writer.write(head.encode() + b"\r\n" + (body or b""))
+    status = int((await reader.readline()).split()[1])
+    length, tag = 0, None
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+        elif name.lower() == "etag":
+            tag = value.strip()
+    return status, tag, await reader.readexactly(length)
+
+
+async def client(
+    port: int, ids: List[str], n: int, write_ratio: float, rng: random.Random,
+    latencies: List[float], statuses: Counter,
+) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    etags: Dict[str, str] = {}
+    generation = 0
+    try:
+        for k in range(n):
+            roll = rng.random()
+            if roll < write_ratio:
+                method, target, body = "PATCH", f"/tasks/{rng.choice(ids)}", json.dumps({"done": k % 2 == 0}).encode()
+            elif roll < 0.5:
+                method, target, body = "GET", f"/changes?since={generation}", None
+            else:
+                method, target, body = "GET", f"/tasks?offset={rng.randrange(5) * 100}&limit=100", None
+            start = time.perf_counter()
+            status, tag, payload = await request(reader, writer, method, target, body, etags.get(target))
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if tag:
+                etags[target] = tag
+            if target.startswith("/changes") and status == 200:
+                generation = json.loads(payload)["generation"]
+    finally:
+        writer.close()
+
+
+def start_server(home: Path, backend: str) -> Tuple[subprocess.Popen, int]:
+    env = dict(os.environ, TODO_LIST_TK_HOME=str(home), PYTHONPATH=os.pathsep.join(sys.path))
+
+    def one_cpu() -> None:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "todo_list_tk.server", "--port", "0", "--path", str(home / "tasks.json"),
+         "--backend", backend],
+        env=env, stdout=subprocess.PIPE, text=True, preexec_fn=one_cpu if os.name == "posix" else None,
+    )
+    line = proc.stdout.readline()  # type: ignore[union-attr]
+    if not line.startswith("Serving on"):
+        proc.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    return proc, int(line.rsplit(":", 1)[1])
+
+
+async def run(port: int, ids: List[str], args: argparse.Namespace) -> Tuple[float, List[float], Counter]:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(port, ids, args.requests, args.write_ratio, random.Random(i), latencies, statuses)
+        for i in range(args.clients)
+    ))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local JSON API load test")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=200, help="per client")
+    parser.add_argument("--write-ratio", type=float, default=0.02)
+    parser.add_argument("--backend", default="journal", help="server storage backend")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp)
+        tasks = synthetic_tasks(args.tasks)
+        save_tasks(tasks, home / "tasks.json")
+        ids = [t.id for t in tasks[:500]]
+        proc, port = start_server(home, args.backend)
+        try:
+            elapsed, latencies, statuses = asyncio.run(run(port, ids, args))
+        finally:
+            proc.terminate()
+            proc.wait(10)
+    latencies.sort()
+    pct = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1e3
+    print(f"{args.clients} clients x {args.requests} requests over {args.tasks} tasks ({args.backend})")
+    print(f"throughput  {len(latencies) / elapsed:,.0f} req/s ({elapsed:.1f} s)")
+    print(f"latency ms  p50 {pct(0.5):.2f}  p90 {pct(0.9):.2f}  p99 {pct(0.99):.2f}  max {latencies[-1] * 1e3:.2f}")
+    print("statuses    " + "  ".join(f"{s}: {n}" for s, n in sorted(statuses.items())))
+
+
+if __name__ == "__main__":
+    main()
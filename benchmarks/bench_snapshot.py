@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: benchmarks/bench_snapshot.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+File size and save/load speed of the JSON file vs the binary snapshot,
+plus the cost of opening a snapshot and decoding a single task.
+
+Usage:
+PYTHONPATH=src python benchmarks/bench_snapshot.py [--sizes 10000,100000,...]
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from todo_list_tk.binary_store import BinarySnapshot, load_binary, save_binary
+from todo_list_tk.model import Task, Priority
+from todo_list_tk.storage import load_tasks, save_tasks
+
+
+def make_tasks(n: int) -> list[Task]:
+    rng = random.Random(n)
+    priorities = list(Priority)
+    return [
+        Task(
+            id=f"{i:032x}",
+            title=f"Task number {rng.randrange(n // 4 + 1)}",
+            done=rng.random() < 0.3,
+            priority=rng.choice(priorities),
+            due=f"2026-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}" if rng.random() < 0.2 else None,
+        )
+        for i in range(n)
+    ]
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON vs binary snapshot benchmark")
+    parser.add_argument("--sizes", default="10000,100000,500000")
+    args = parser.parse_args()
+
+    print(
+        f"{'tasks':>8}  {'format':>6}  {'size (KB)':>10}  {'save (ms)':>10}  "
+        f"{'load (ms)':>10}  {'open+get (ms)':>13}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path, bin_path = Path(tmp) / "tasks.json", Path(tmp) / "tasks.bin"
+        for n in (int(s) for s in args.sizes.split(",")):
+            tasks = make_tasks(n)
+            rows = [
+                ("json", json_path, lambda tasks=tasks: save_tasks(tasks, json_path),
+                 lambda: load_tasks(json_path), None),
+                ("binary", bin_path, lambda tasks=tasks: save_binary(tasks, bin_path),
+                 lambda: load_binary(bin_path), lambda n=n: BinarySnapshot(bin_path)[n // 2]),
+            ]
+            for name, path, save, load, get in rows:
+                save_s = timed(save)
+                load_s = timed(load)
+                get_ms = f"{timed(get) * 1e3:>13.2f}" if get else f"{'-':>13}"
+                print(
+                    f"{n:>8}  {name:>6}  {path.stat().st_size / 1024:>10.0f}  "
+                    f"{save_s * 1e3:>10.1f}  {load_s * 1e3:>10.1f}  {get_ms}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: benchmarks/bench_suite.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Benchmark suite over synthetic task stores of 10k to 1M tasks.
+
+Covers storage throughput (`save_tasks`, `load_tasks`, streaming
+`iter_tasks`), per-call latency of every `Controller` mutation against the
+memory, journal and SQLite stores, filter views and search, and headless
+`App.refresh` cost. The UI benchmarks need a display (run under
+`xvfb-run` on CI) and are recorded as skipped without one.
+
+Every run writes a JSON results file. `--compare` checks a run against an
+earlier file and exits non-zero if anything slowed down by more than
+`--threshold`. `test_bench_suite.py` runs the same benchmarks under pytest.
+
+Usage:
+PYTHONPATH=src python benchmarks/bench_suite.py [--sizes 10000,100000] [--only controller]
+    [--output results.json] [--compare baseline.json] [--threshold 0.25]
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task, Priority
+from todo_list_tk.storage import MemoryStore, TaskStore, iter_tasks, load_tasks, save_tasks
+
+DEFAULT_SIZES = (10_000, 100_000)
+DEFAULT_OUTPUT = Path(__file__).with_name("results") / "latest.json"
+MUTATION_OPS = 2_000
+# Stores with O(1) per-commit cost; a whole-file JSON store would be measuring `save_tasks` again.
+MUTATION_STORES = ("memory", "journal", "sqlite")
+
+
+@dataclass
+class Result:
+    name: str
+    size: int
+    ops: int
+    seconds: float
+    skipped: Optional[str] = None
+
+    @property
+    def per_op_us(self) -> float:
+        return self.seconds / self.ops * 1e6 if self.ops else 0.0
+
+
+Bench = Callable[[int, Path], List[Result]]
+BENCHMARKS: Dict[str, Bench] = {}
+
+
+def benchmark(name: str) -> Callable[[Bench], Bench]:
+    def register(fn: Bench) -> Bench:
+        BENCHMARKS[name] = fn
+        return fn
+
+    return register
+
+
+# --- data ---
+def synthetic_tasks(n: int, seed: int = 0) -> List[Task]:
+    """`n` tasks with realistic titles, ~30% done, mixed priorities and some due dates."""
+    rng = random.Random(seed)
+    words = ["buy", "call", "email", "fix", "review", "plan", "book", "pay", "clean", "write",
+             "groceries", "report", "dentist", "invoice", "garden", "slides", "car", "taxes"]
+    priorities = list(Priority)
+    base = datetime(2025, 1, 1)
+    tasks = []
+    for i in range(n):
+        created = (base + timedelta(minutes=i)).isoformat(timespec="seconds")
+        due = base + timedelta(days=rng.randrange(-30, 365))
+        tasks.append(
+            Task(
+                id=f"{i:032x}",
+                title=" ".join(rng.choices(words, k=rng.randint(2, 5))) + f" #{i}",
+                done=rng.random() < 0.3,
+                created_at=created,
+                updated_at=created,
+                priority=rng.choice(priorities),
+                due=due.date().isoformat() if rng.random() < 0.25 else None,
+            )
+        )
+    return tasks
+
+
+def make_store(kind: str, tasks: List[Task], tmp: Path) -> TaskStore:
+    if kind == "memory":
+        return MemoryStore(tasks)
+    if kind == "journal":
+        from todo_list_tk.journal import JournalStore
+
+        path = tmp / f"journal-{len(tasks)}.json"
+        save_tasks(tasks, path)
+        return JournalStore(path, fsync=False)
+    if kind == "sqlite":
+        from todo_list_tk.sqlite_store import SQLiteStore
+
+        store = SQLiteStore(tmp / f"tasks-{len(tasks)}.sqlite3")
+        store.commit(tasks, upserted=tasks)
+        return store
+    raise ValueError(kind)
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+# --- storage ---
+@benchmark("storage")
+def bench_storage(n: int, tmp: Path) -> List[Result]:
+    tasks = synthetic_tasks(n)
+    path = tmp / f"storage-{n}.json"
+    return [
+        Result("storage.save_tasks", n, n, timed(lambda: save_tasks(tasks, path))),
+        Result("storage.load_tasks", n, n, timed(lambda: load_tasks(path))),
+        Result("storage.iter_tasks", n, n, timed(lambda: sum(len(c) for c in iter_tasks(path)))),
+    ]
+
+
+# --- controller ---
+@benchmark("controller")
+def bench_controller(n: int, tmp: Path) -> List[Result]:
+    results = []
+    tasks = synthetic_tasks(n)
+    priorities = list(Priority)
+    for kind in MUTATION_STORES:
+        store = make_store(kind, tasks, tmp)
+        c = Controller(store)
+        rng = random.Random(1)
+        ids = [tasks[rng.randrange(n)].id for _ in range(MUTATION_OPS)]
+        ops: Dict[str, Callable[[], object]] = {
+            "add_task": lambda c=c: [c.add_task(f"New task {i}") for i in range(MUTATION_OPS)],
+            "toggle_task": lambda c=c, ids=ids: [c.toggle_task(i) for i in ids],
+            "rename_task": lambda c=c, ids=ids: [c.rename_task(i, f"Renamed {i}") for i in ids],
+            "set_priority": lambda c=c, ids=ids: [
+                c.set_priority(i, priorities[k % 3]) for k, i in enumerate(ids)
+            ],
+            "delete_task": lambda c=c, ids=ids: [c.delete_task(i) for i in dict.fromkeys(ids)],
+        }
+        for op, fn in ops.items():
+            count = len(dict.fromkeys(ids)) if op == "delete_task" else MUTATION_OPS
+            results.append(Result(f"controller.{op}[{kind}]", n, count, timed(fn)))
+        c.close()
+    return results
+
+
+@benchmark("queries")
+def bench_queries(n: int, tmp: Path) -> List[Result]:
+    c = Controller(MemoryStore(synthetic_tasks(n)))
+    results = [
+        Result("controller.init", n, n, timed(lambda: Controller(MemoryStore(c.tasks)))),
+    ]
+    for name in ("all", "active", "done"):
+        results.append(Result(f"controller.filtered[{name}]", n, 1, timed(
+            lambda name=name: c.filtered(None if name == "all" else name == "done")
+        )))
+    view = c.view("active")
+    results.append(Result("controller.view[active][screen]", n, 1000, timed(
+        lambda: [view[k * 7 % len(view) : k * 7 % len(view) + 30] for k in range(1000)]
+    )))
+    queries = ["buy", "gro", "call dent", "report #1", "zzz"]
+    c.search("warm up")  # builds the index once
+    results.append(Result("controller.search", n, len(queries) * 20, timed(
+        lambda: [c.search(q, limit=1000) for _ in range(20) for q in queries]
+    )))
+    results.append(Result("controller.clear_completed", n, 1, timed(c.clear_completed)))
+    return results
+
+
+# --- UI ---
+@benchmark("ui")
+def bench_ui(n: int, tmp: Path) -> List[Result]:
+    names = ["ui.refresh", "ui.set_filter", "ui.toggle_roundtrip"]
+    try:
+        import tkinter as tk
+    except ImportError as ex:
+        return [Result(name, n, 0, 0.0, skipped=f"no tkinter: {ex}") for name in names]
+    try:
+        root = tk.Tk()
+    except tk.TclError as ex:  # no display to open
+        return [Result(name, n, 0, 0.0, skipped=f"no display: {ex}") for name in names]
+    try:
+        from todo_list_tk.ui import App
+
+        root.geometry("640x800")
+        app = App(root, store=MemoryStore(synthetic_tasks(n)))
+        app.controller.load_all()
+        root.update()
+        reps = 200
+        ids = [t.id for t in app.controller.view("all")[:reps]]
+
+        def refresh() -> None:
+            for _ in range(reps):
+                app.refresh()
+                root.update_idletasks()
+
+        def switch() -> None:
+            for k in range(reps):
+                app._set_filter(("all", "active", "done")[k % 3])
+                root.update_idletasks()
+
+        def toggle() -> None:
+            for task_id in ids:
+                app.controller.toggle_task(task_id)
+                root.update_idletasks()
+
+        results = [
+            Result("ui.refresh", n, reps, timed(refresh)),
+            Result("ui.set_filter", n, reps, timed(switch)),
+            Result("ui.toggle_roundtrip", n, len(ids), timed(toggle)),
+        ]
+        app.close()
+        return results
+    finally:
+        root.destroy()
+
+
+# --- running ---
+def run(sizes: Sequence[int], only: Sequence[str] = ()) -> List[Result]:
+    results: List[Result] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            for name, fn in BENCHMARKS.items():
+                if not only or name in only:
+                    results.extend(fn(n, Path(tmp)))
+    return results
+
+
+def write_results(results: List[Result], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"meta": _meta(), "results": [dict(asdict(r), per_op_us=r.per_op_us) for r in results]}
+    path.write_text(json.dumps(data, indent=2), "utf-8")
+
+
+def read_results(path: Path) -> List[Result]:
+    data = json.loads(Path(path).read_text("utf-8"))
+    return [
+        Result(r["name"], r["size"], r["ops"], r["seconds"], r.get("skipped"))
+        for r in data["results"]
+    ]
+
+
+def compare(baseline: List[Result], current: List[Result], threshold: float) -> List[str]:
+    """Human-readable regressions: per-op time up by more than `threshold` (0.25 = 25%)."""
+    before = {(r.name, r.size): r for r in baseline if not r.skipped}
+    regressions = []
+    for r in current:
+        old = before.get((r.name, r.size))
+        if r.skipped or old is None or not old.per_op_us:
+            continue
+        ratio = r.per_op_us / old.per_op_us
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{r.name} @ {r.size}: {old.per_op_us:.2f} -> {r.per_op_us:.2f} us/op (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def _meta() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False,
+            cwd=Path(__file__).parent, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": commit,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="To-Do List benchmark suite")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--only", default="", help=f"comma-separated subset of {list(BENCHMARKS)}")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path, help="earlier results file to check against")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    results = run(sizes, [s for s in args.only.split(",") if s])
+    print(f"{'benchmark':<36}  {'tasks':>8}  {'ops':>6}  {'us/op':>12}")
+    for r in results:
+        value = f"skipped ({r.skipped})" if r.skipped else f"{r.per_op_us:>12.2f}"
+        print(f"{r.name:<36}  {r.size:>8}  {r.ops:>6}  {value}")
+    write_results(results, args.output)
+    print(f"results written to {args.output}")
+
+    if args.compare:
+        regressions = compare(read_results(args.compare), results, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: benchmarks/test_bench_suite.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Runs `bench_suite` under pytest (not part of the default `tests/` run).
+Sizes come from `TODO_LIST_TK_BENCH_SIZES` (default 10000); results are
+written to `TODO_LIST_TK_BENCH_OUTPUT` (default benchmarks/results/latest.json).
+
+Usage:
+PYTHONPATH=src pytest benchmarks
+TODO_LIST_TK_BENCH_SIZES=10000,100000,1000000 PYTHONPATH=src pytest benchmarks
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+import bench_suite
+from bench_suite import BENCHMARKS, Result
+
+SIZES = [int(s) for s in os.environ.get("TODO_LIST_TK_BENCH_SIZES", "10000").split(",")]
+OUTPUT = Path(os.environ.get("TODO_LIST_TK_BENCH_OUTPUT", bench_suite.DEFAULT_OUTPUT))
+
+
+@pytest.fixture(scope="module")
+def collected() -> Iterator[List[Result]]:
+    results: List[Result] = []
+    yield results
+    bench_suite.write_results(results, OUTPUT)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark(name: str, size: int, tmp_path: Path, collected: List[Result]):
+    results = BENCHMARKS[name](size, tmp_path)
+    collected.extend(results)
+    if all(r.skipped for r in results):
+        pytest.skip(results[0].skipped)
+    assert all(r.skipped or (r.ops > 0 and r.seconds > 0) for r in results)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: archive.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Cold storage for completed tasks.
+
+`Controller.archive_completed` moves done tasks out of the store into an
+archive directory next to it (`tasks.archive/` beside `tasks.json`), so the
+store, its saves and the UI only pay for the active set. Tasks are
+bucketed by the month they were last changed (completed) into segments,
+`<YYYY-MM>.jsonl.gz`, that are only ever appended to: each append adds one
+gzip member of JSON lines, fsynced before the tasks leave the store.
+`index.json` records each segment's task count and size, so the archive's
+length and any page's position are known without decompressing anything;
+a segment whose size does not match is recounted, and a torn member at its
+end (a crash mid-append) is cut off before the next append.
+
+`ArchiveView` pages through the archive newest first, decompressing only
+the segments the requested rows fall in (a few stay cached), and
+`Archive.search` scans segments newest first until it has enough matches.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import os
+import re
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import metrics
+from .locking import FileLock, lock_path_for
+from .model import Task
+from .search import tokenize
+from .storage import atomic_write_text, task_from_dict, task_to_dict
+
+# If set above 0, done tasks unchanged for this many days are archived when the app starts.
+# Off by default: archiving cannot be undone, so it is never done without asking.
+ARCHIVE_DAYS = float(os.environ.get("TODO_LIST_TK_ARCHIVE_DAYS", "0"))
+ARCHIVE_SCHEMA_VERSION = 1
+
+_SEGMENT_SUFFIX = ".jsonl.gz"
+_MONTH = re.compile(r"\d{4}-\d\d", re.ASCII)
+_UNDATED = "undated"  # sorts after every month, so it is paged last
+_CACHE_SEGMENTS = 4
+
+
+def archive_dir_for(path: Path) -> Path:
+    return Path(path).with_suffix(".archive")
+
+
+def open_archive(store: object) -> Optional["Archive"]:
+    """The archive next to a file-backed store, or None (e.g. for `MemoryStore`)."""
+    path = getattr(store, "path", None)
+    return Archive(archive_dir_for(path)) if path is not None else None
+
+
+class Archive:
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._index_path = self.directory / "index.json"
+        self._segments: Optional[Dict[str, Dict[str, int]]] = None  # bucket -> {"count", "size"}
+        self._order: List[str] = []  # buckets, newest first
+        self._starts: List[int] = [0]  # position of each bucket's first task, then the total
+        self._cache: "OrderedDict[str, List[Task]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        self._index()
+        return self._starts[-1]
+
+    def refresh(self) -> None:
+        """Forget what was read, e.g. after another process appended."""
+        self._segments = None
+        self._cache.clear()
+
+    # --- writing ---
+    @metrics.timed("archive.append")
+    def append(self, tasks: Iterable[Task]) -> int:
+        """Append `tasks` to their segments durably; returns how many were written."""
+        buckets: Dict[str, List[Task]] = {}
+        for t in tasks:
+            buckets.setdefault(bucket_of(t), []).append(t)
+        if not buckets:
+            return 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with FileLock(lock_path_for(self._index_path)):
+            segments = self._read_index()  # another process may have appended meanwhile
+            for bucket, items in buckets.items():
+                path = self._segment_path(bucket)
+                lines = "".join(json.dumps(task_to_dict(t), ensure_ascii=False) + "\n" for t in items)
+                data = gzip.compress(lines.encode("utf-8"))
+                with open(path, "ab") as fh:
+                    entry = segments.setdefault(bucket, {"count": 0, "size": 0})
+                    fh.truncate(entry["size"])  # drop a torn member left by a crash
+                    fh.write(data)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                entry["count"] += len(items)
+                entry["size"] += len(data)
+                self._cache.pop(bucket, None)
+                metrics.count("archive.bytes_written", len(data))
+            atomic_write_text(
+                self._index_path,
+                json.dumps({"version": ARCHIVE_SCHEMA_VERSION, "segments": segments}, indent=2),
+                fsync=True,
+            )
+        self._set_index(segments)
+        return sum(len(items) for items in buckets.values())
+
+    # --- reading ---
+    def buckets(self) -> List[Tuple[str, int]]:
+        """`(bucket, task count)` per segment, newest first."""
+        segments = self._index()
+        return [(b, segments[b]["count"]) for b in self._order]
+
+    def page(self, start: int, stop: int) -> List[Task]:
+        """Archived tasks at positions `start:stop`, newest first."""
+        self._index()
+        stop = min(stop, len(self))
+        out: List[Task] = []
+        i = bisect.bisect_right(self._starts, start) - 1
+        while start < stop and 0 <= i < len(self._order):
+            tasks = self._load(self._order[i])
+            first = self._starts[i]
+            out.extend(tasks[start - first : stop - first])
+            start = first + len(tasks)
+            i += 1
+        return out
+
+    @metrics.timed("archive.search")
+    def search(self, query: str, limit: Optional[int] = None) -> List[Task]:
+        """Archived tasks whose title matches every word of `query` (prefixes allowed), newest first."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        found: List[Task] = []
+        self._index()
+        for bucket in self._order:
+            for line in reversed(self._lines(bucket)):
+                # Cheap test on the raw line before parsing it: every term must occur somewhere.
+                folded = line.casefold()
+                if not all(term in folded for term in terms):
+                    continue
+                t = task_from_dict(json.loads(line))
+                tokens = tokenize(t.title)
+                if all(any(tok.startswith(term) for tok in tokens) for term in terms):
+                    found.append(t)
+                    if limit is not None and len(found) >= limit:
+                        return found
+        return found
+
+    # --- internals ---
+    def _segment_path(self, bucket: str) -> Path:
+        return self.directory / f"{bucket}{_SEGMENT_SUFFIX}"
+
+    def _index(self) -> Dict[str, Dict[str, int]]:
+        if self._segments is None:
+            self._set_index(self._read_index())
+        return self._segments  # type: ignore[return-value]
+
+    def _set_index(self, segments: Dict[str, Dict[str, int]]) -> None:
+        self._segments = segments
+        self._order = sorted((b for b in segments if segments[b]["count"]), key=_bucket_key, reverse=True)
+        self._starts = [0]
+        for b in self._order:
+            self._starts.append(self._starts[-1] + segments[b]["count"])
+
+    def _read_index(self) -> Dict[str, Dict[str, int]]:
+        try:
+            data: Dict[str, Any] = json.loads(self._index_path.read_text("utf-8"))
+            segments: Dict[str, Dict[str, int]] = data.get("segments", {})
+        except (OSError, ValueError):
+            segments = {}
+        on_disk = {p.name[: -len(_SEGMENT_SUFFIX)]: p for p in self.directory.glob(f"*{_SEGMENT_SUFFIX}")}
+        for bucket in list(segments):
+            if bucket not in on_disk:
+                del segments[bucket]
+        for bucket, path in on_disk.items():
+            entry = segments.get(bucket)
+            if entry is None or entry.get("size") != path.stat().st_size:
+                # Appended to without the index being updated (or the index was lost): recount.
+                members, size = _read_members(path.read_bytes())
+                count = sum(m.count(b"\n") for m in members)
+                segments[bucket] = {"count": count, "size": size}
+        return segments
+
+    def _lines(self, bucket: str) -> List[str]:
+        segment = self._index()[bucket]
+        members, _ = _read_members(self._segment_path(bucket).read_bytes()[: segment["size"]])
+        return b"".join(members).decode("utf-8").splitlines()
+
+    def _load(self, bucket: str) -> List[Task]:
+        tasks = self._cache.get(bucket)
+        if tasks is not None:
+            self._cache.move_to_end(bucket)
+            return tasks
+        with metrics.timer("archive.load_segment"):
+            tasks = [task_from_dict(json.loads(line)) for line in self._lines(bucket)]
+        tasks.reverse()  # last archived first
+        tasks.sort(key=lambda t: t.updated_at, reverse=True)
+        self._cache[bucket] = tasks
+        if len(self._cache) > _CACHE_SEGMENTS:
+            self._cache.popitem(last=False)
+        return tasks
+
+
+class ArchiveView(Sequence[Task]):
+    """Read-only view of archived tasks, newest first; segments are read as rows are asked for."""
+
+    name = "archive"
+
+    def __init__(self, archive: Optional[Archive]) -> None:
+        self._archive = archive
+
+    def __len__(self) -> int:
+        return len(self._archive) if self._archive is not None else 0
+
+    def __getitem__(self, i):  # type: ignore[override]
+        n = len(self)
+        if isinstance(i, slice):
+            start, stop, step = i.indices(n)
+            if step != 1:
+                return [self[k] for k in range(start, stop, step)]
+            return self._archive.page(start, stop) if self._archive is not None and start < stop else []
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return self._archive.page(i, i + 1)[0]  # type: ignore[union-attr]
+
+    def __iter__(self) -> Iterator[Task]:
+        if self._archive is not None:
+            for bucket, _ in self._archive.buckets():
+                yield from self._archive._load(bucket)
+
+    def matches(self, t: Task) -> bool:
+        return False  # tasks in the store are never archived ones
+
+    def repositions(self, before: Optional[Task], after: Optional[Task]) -> bool:
+        return after is None  # a removed task may have just been archived
+
+
+def bucket_of(t: Task) -> str:
+    month = t.updated_at[:7]
+    return month if _MONTH.fullmatch(month) else _UNDATED
+
+
+def _bucket_key(bucket: str) -> Tuple[bool, str]:
+    return (bucket != _UNDATED, bucket)
+
+
+def _read_members(data: bytes) -> Tuple[List[bytes], int]:
+    """Decompressed gzip members of `data`, and the length of the complete ones."""
+    members: List[bytes] = []
+    pos = 0
+    while pos < len(data):
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            chunk = d.decompress(data[pos:])
+        except zlib.error:
+            break
+        if not d.eof:
+            break
+        members.append(chunk)
+        pos = len(data) - len(d.unused_data)
+    return members, pos
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: binary_store.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Compact binary snapshot format.
+
+Layout (all integers little-endian):
+
+    header   magic "TDLB", u16 version, u16 reserved, u32 task count,
+             u32 string count, u32 string blob length, u32 crc32 of the rest
+    records  one fixed-size record per task, in order
+    offsets  (string count + 1) u32 offsets into the string blob
+    strings  UTF-8 string blob
+
+A record holds string-table indexes for id, title and due, both timestamps
+as int64 seconds since the epoch, one flags byte packing `done`, the
+priority and field-presence bits, and (since version 2) the rank's string
+index and (since version 3) those of the repeat rule and its completions.
+Identical strings (repeated titles, due
+dates) are stored once. Timestamps that do not round-trip through the
+integer form are kept in the string table instead, so nothing is lost.
+
+`BinarySnapshot` maps the file and decodes tasks on demand, so opening a
+large snapshot or reading a single task does not parse the rest.
+
+Usage:
+python -m todo_list_tk.binary_store import tasks.json tasks.bin
+python -m todo_list_tk.binary_store export tasks.bin tasks.json
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import metrics
+from .model import Task, Priority
+from .storage import (
+    LOAD_CHUNK_SIZE,
+    SharedFileStore,
+    atomic_write_bytes,
+    iter_tasks,
+    save_tasks,
+)
+
+MAGIC = b"TDLB"
+BINARY_SCHEMA_VERSION = 3
+
+_HEADER = struct.Struct("<4sHHIIII")
+# id, title, due (string indexes), created_at, updated_at, flags, then the string
+# indexes of rank, repeat and repeat_done
+_RECORD = struct.Struct("<IIIqqBIII")
+_RECORDS = {1: struct.Struct("<IIIqqB"), 2: struct.Struct("<IIIqqBI"), 3: _RECORD}
+_FIELDS = 9
+_OFFSET = struct.Struct("<I")
+
+_DONE = 0x01
+_PRIORITY_SHIFT = 1  # two bits
+_HAS_DUE = 0x08
+_CREATED_STR = 0x10
+_UPDATED_STR = 0x20
+_HAS_RANK = 0x40
+_HAS_REPEAT = 0x80  # repeat_done is then stored too, "" standing for None
+
+_PRIORITIES = tuple(Priority)
+_PRIORITY_INDEX = {p: i for i, p in enumerate(_PRIORITIES)}
+_EPOCH = datetime(1970, 1, 1)
+
+
+def binary_path_for(json_path: Path) -> Path:
+    return Path(json_path).with_suffix(".bin")
+
+
+# --- encoding ---
+def encode_tasks(tasks: Iterable[Task]) -> bytes:
+    strings: Dict[str, int] = {}
+
+    def intern(s: str) -> int:
+        i = strings.get(s)
+        if i is None:
+            i = strings[s] = len(strings)
+        return i
+
+    def timestamp(s: str, flag: int) -> tuple[int, int]:
+        seconds = _encode_timestamp(s)
+        return (intern(s), flag) if seconds is None else (seconds, 0)
+
+    records = []
+    for t in tasks:
+        created, created_flag = timestamp(t.created_at, _CREATED_STR)
+        updated, updated_flag = timestamp(t.updated_at, _UPDATED_STR)
+        flags = (
+            (_DONE if t.done else 0)
+            | _PRIORITY_INDEX[Priority(t.priority)] << _PRIORITY_SHIFT
+            | (_HAS_DUE if t.due is not None else 0)
+            | created_flag
+            | updated_flag
+            | (_HAS_RANK if t.rank is not None else 0)
+            | (_HAS_REPEAT if t.repeat is not None else 0)
+        )
+        due = intern(t.due) if t.due is not None else 0
+        rank = intern(t.rank) if t.rank is not None else 0
+        repeat = repeat_done = 0
+        if t.repeat is not None:
+            repeat, repeat_done = intern(t.repeat), intern(t.repeat_done or "")
+        records.append(_RECORD.pack(
+            intern(t.id), intern(t.title), due, created, updated, flags, rank, repeat, repeat_done
+        ))
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    body = b"".join(
+        (b"".join(records), struct.pack(f"<{len(offsets)}I", *offsets), b"".join(encoded))
+    )
+    header = _HEADER.pack(
+        MAGIC, BINARY_SCHEMA_VERSION, 0, len(records), len(strings), offsets[-1], zlib.crc32(body)
+    )
+    return header + body
+
+
+def _encode_timestamp(s: str) -> Optional[int]:
+    try:
+        dt = datetime.fromisoformat(s)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is not None or dt.microsecond or dt.isoformat(timespec="seconds") != s:
+        return None
+    return (dt - _EPOCH) // timedelta(seconds=1)
+
+
+# --- decoding ---
+class BinarySnapshot(Sequence[Task]):
+    """Read-only, memory-mapped view of a snapshot; tasks are decoded on access."""
+
+    def __init__(self, path: Path, *, verify: bool = True) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            size = fh.seek(0, 2)
+            if size < _HEADER.size:
+                raise ValueError(f"{self.path}: not a task snapshot")
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, count, nstrings, blob_len, crc = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path}: not a task snapshot")
+            if version > BINARY_SCHEMA_VERSION:
+                raise ValueError(f"{self.path}: unsupported snapshot version {version}")
+            self._count = count
+            self._record = _RECORDS.get(version, _RECORD)
+            # Older records lack the trailing string indexes; pad them with zeros.
+            self._padding = (0,) * (_FIELDS - (len(self._record.format) - 1))
+            self._nstrings = nstrings
+            self._strings: Optional[List[str]] = None
+            self._offsets_at = _HEADER.size + count * self._record.size
+            self._strings_at = self._offsets_at + (nstrings + 1) * _OFFSET.size
+            if self._strings_at + blob_len != size:
+                raise ValueError(f"{self.path}: truncated snapshot")
+            if verify and zlib.crc32(memoryview(self._mm)[_HEADER.size :]) != crc:
+                raise ValueError(f"{self.path}: checksum mismatch")
+        except BaseException:
+            self._mm.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._count)
+            if step != 1:
+                return [self._decode(k) for k in range(start, stop, step)]
+            return self.decode_range(start, stop)
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("snapshot index out of range")
+        return self._decode(i)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self.decode_range(0, self._count))
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "BinarySnapshot":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def decode_range(self, start: int, stop: int) -> List[Task]:
+        """Bulk-decode tasks `start:stop`, sharing one decoded string table."""
+        stop = min(stop, self._count)
+        if stop <= start:
+            return []
+        strings = self._string_table()
+        timestamps: Dict[int, str] = {}
+
+        def ts(seconds: int) -> str:
+            s = timestamps.get(seconds)
+            if s is None:
+                s = timestamps[seconds] = _decode_timestamp(seconds)
+            return s
+
+        size = self._record.size
+        records = self._mm[_HEADER.size + start * size : _HEADER.size + stop * size]
+        return [
+            Task(
+                strings[id_],
+                strings[title],
+                bool(flags & _DONE),
+                strings[created] if flags & _CREATED_STR else ts(created),
+                strings[updated] if flags & _UPDATED_STR else ts(updated),
+                _PRIORITIES[(flags >> _PRIORITY_SHIFT) & 0x03],
+                strings[due] if flags & _HAS_DUE else None,
+                strings[rank] if flags & _HAS_RANK else None,
+                strings[repeat] if flags & _HAS_REPEAT else None,
+                strings[repeat_done] or None if flags & _HAS_REPEAT else None,
+            )
+            for (
+                id_, title, due, created, updated, flags, rank, repeat, repeat_done
+            ) in self._unpack(records)
+        ]
+
+    def _unpack(self, records: bytes) -> Iterable[Tuple[int, ...]]:
+        if not self._padding:
+            return self._record.iter_unpack(records)
+        padding = self._padding
+        return (r + padding for r in self._record.iter_unpack(records))
+
+    def _string_table(self) -> List[str]:
+        if self._strings is None:
+            n = self._nstrings + 1
+            offsets = struct.unpack_from(f"<{n}I", self._mm, self._offsets_at)
+            blob = self._mm[self._strings_at :]
+            text = blob.decode("utf-8")
+            # Pure ASCII: byte offsets are character offsets, so slice the decoded text.
+            source = text if len(text) == len(blob) else blob
+            strings = [source[a:b] for a, b in zip(offsets, offsets[1:])]
+            if source is blob:
+                strings = [b.decode("utf-8") for b in strings]  # type: ignore[union-attr]
+            self._strings = strings  # type: ignore[assignment]
+        return self._strings  # type: ignore[return-value]
+
+    def string(self, index: int) -> str:
+        if self._strings is not None:
+            return self._strings[index]
+        start, end = struct.unpack_from("<2I", self._mm, self._offsets_at + index * _OFFSET.size)
+        return self._mm[self._strings_at + start : self._strings_at + end].decode("utf-8")
+
+    def _decode(self, i: int) -> Task:
+        start = _HEADER.size + i * self._record.size
+        (id_, title, due, created, updated, flags, rank, repeat, repeat_done), = self._unpack(
+            self._mm[start : start + self._record.size]
+        )
+        string = self.string
+        return Task(
+            id=string(id_),
+            title=string(title),
+            done=bool(flags & _DONE),
+            created_at=string(created) if flags & _CREATED_STR else _decode_timestamp(created),
+            updated_at=string(updated) if flags & _UPDATED_STR else _decode_timestamp(updated),
+            priority=_PRIORITIES[(flags >> _PRIORITY_SHIFT) & 0x03],
+            due=string(due) if flags & _HAS_DUE else None,
+            rank=string(rank) if flags & _HAS_RANK else None,
+            repeat=string(repeat) if flags & _HAS_REPEAT else None,
+            repeat_done=string(repeat_done) or None if flags & _HAS_REPEAT else None,
+        )
+
+
+def _decode_timestamp(seconds: int) -> str:
+    return (_EPOCH + timedelta(seconds=seconds)).isoformat(timespec="seconds")
+
+
+# --- files ---
+@metrics.timed("storage.save_binary")
+def save_binary(tasks: Iterable[Task], path: Path, *, fsync: bool = False) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, encode_tasks(tasks), fsync=fsync)
+
+
+@metrics.timed("storage.load_binary")
+def load_binary(path: Path) -> List[Task]:
+    if not Path(path).exists():
+        return []
+    with BinarySnapshot(path) as snap:
+        return list(snap)
+
+
+def import_json(json_path: Path, bin_path: Path) -> int:
+    """Convert a JSON task file into a binary snapshot. Returns tasks written."""
+    tasks = [t for chunk in iter_tasks(Path(json_path)) for t in chunk]
+    save_binary(tasks, Path(bin_path))
+    return len(tasks)
+
+
+def export_json(bin_path: Path, json_path: Path) -> int:
+    """Write a binary snapshot back out in the JSON format. Returns tasks written."""
+    tasks = load_binary(Path(bin_path))
+    save_tasks(tasks, Path(json_path))
+    return len(tasks)
+
+
+class BinaryStore(SharedFileStore):
+    """Whole-file store using the binary snapshot format.
+
+    Shares `SharedFileStore`'s locking and merge-on-conflict; the generation
+    counter is not persisted in this format and only counts this process's
+    writes.
+    """
+
+    def iter_load(self, chunk_size: int = LOAD_CHUNK_SIZE) -> Iterator[List[Task]]:
+        signature = self._stat()
+        disk: Dict[str, Task] = {}
+        if signature is not None:
+            with BinarySnapshot(self.path) as snap:
+                for start in range(0, len(snap), chunk_size):
+                    chunk = snap.decode_range(start, start + chunk_size)
+                    disk.update((t.id, t) for t in chunk)
+                    yield chunk
+        self._disk, self._signature = disk, signature
+        self._pending.clear()
+
+    def _read(self) -> Tuple[List[Task], int]:
+        return load_binary(self.path), self.generation
+
+    def _write(self, tasks: Iterable[Task], generation: int) -> None:
+        save_binary(tasks, self.path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert between JSON and binary task snapshots")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="JSON file -> binary snapshot")
+    imp.add_argument("src", type=Path)
+    imp.add_argument("dst", type=Path)
+    exp = sub.add_parser("export", help="binary snapshot -> JSON file")
+    exp.add_argument("src", type=Path)
+    exp.add_argument("dst", type=Path)
+    args = parser.parse_args(argv)
+    convert = import_json if args.command == "import" else export_json
+    print(f"{convert(args.src, args.dst)} task(s) written to {args.dst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: cli.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Headless command-line front-end for scripts, cron jobs and SSH sessions.
+
+Works on the same store as the desktop app through `Controller`, and never
+imports tkinter. Task ids may be abbreviated to any unique prefix. Bulk
+import reads JSON Lines or CSV as a stream and saves once at the end; a bad
+record aborts the whole import.
+
+Usage:
+todo-list add "Buy milk" "Call mom" [--priority high]
+todo-list list [--filter active] [--format jsonl]
+todo-list toggle 3f2a
+todo-list delete 3f2a 9c1e
+todo-list search groceries [--filter archive]
+todo-list archive [--days 30]
+todo-list --list work add "Write report"
+todo-list lists [--create NAME]
+todo-list repeat 3f2a weekdays
+todo-list upcoming [--limit 20]
+todo-list import tasks.csv
+todo-list export - --format jsonl
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from contextlib import contextmanager
+from dataclasses import fields
+from datetime import timedelta
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from .controller import Controller
+from .lists import DEFAULT_LIST, ListManifest
+from .model import Task, Priority
+from .recurrence import format_when
+from .storage import DEFAULT_DIR, DEFAULT_PATH, task_from_dict, task_to_dict
+from .utils import new_id
+from .views import FILTERS
+
+FIELDS = [f.name for f in fields(Task)]
+FORMATS = ("jsonl", "csv")
+LIST_FILTERS = FILTERS + ("overdue", "archive")
+_TRUE = {"1", "true", "yes", "y", "x"}
+
+
+class CliError(Exception):
+    pass
+
+
+# --- records ---
+def task_from_record(record: Dict[str, Any]) -> Task:
+    """Task from an imported record: missing fields get defaults, unknown ones are ignored."""
+    d = {k: v for k, v in record.items() if k in FIELDS and v not in (None, "")}
+    if "title" not in d or not str(d["title"]).strip():
+        raise ValueError(f"record without a title: {record!r}")
+    d["title"] = str(d["title"]).strip()
+    d.setdefault("id", new_id())
+    if isinstance(d.get("done"), str):
+        d["done"] = d["done"].strip().lower() in _TRUE
+    if isinstance(d.get("priority"), str):
+        d["priority"] = d["priority"].strip().lower()
+    return task_from_dict(d)
+
+
+def read_records(fh: IO[str], fmt: str) -> Iterator[Dict[str, Any]]:
+    if fmt == "csv":
+        yield from csv.DictReader(fh)
+        return
+    for lineno, line in enumerate(fh, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as ex:
+                raise ValueError(f"line {lineno}: {ex}") from None
+
+
+def write_records(fh: IO[str], tasks: Iterable[Task], fmt: str) -> int:
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(fh, fieldnames=FIELDS)
+        writer.writeheader()
+        for t in tasks:
+            d = task_to_dict(t)
+            d["done"] = int(t.done)
+            writer.writerow(d)
+            count += 1
+        return count
+    for t in tasks:
+        fh.write(json.dumps(task_to_dict(t), ensure_ascii=False))
+        fh.write("\n")
+        count += 1
+    return count
+
+
+# --- commands ---
+def cmd_add(c: Controller, args: argparse.Namespace) -> None:
+    with c.batch():
+        for title in args.titles:
+            t = c.add_task(title)
+            if args.priority:
+                t = c.set_priority(t.id, Priority(args.priority))
+            print(t.id)
+
+
+def cmd_list(c: Controller, args: argparse.Namespace) -> None:
+    tasks = c.view(args.filter)
+    _print_tasks(tasks[: args.limit] if args.limit else tasks, args.format)
+
+
+def cmd_search(c: Controller, args: argparse.Namespace) -> None:
+    _print_tasks(c.search(" ".join(args.query), limit=args.limit, within=args.filter), args.format)
+
+
+def cmd_toggle(c: Controller, args: argparse.Namespace) -> None:
+    ids = [_resolve(c, prefix) for prefix in args.ids]
+    _print_tasks(c.toggle_many(ids), "text")
+
+
+def cmd_delete(c: Controller, args: argparse.Namespace) -> None:
+    ids = [_resolve(c, prefix) for prefix in args.ids]
+    print(f"Deleted {c.delete_many(ids)} task(s)")
+
+
+def cmd_repeat(c: Controller, args: argparse.Namespace) -> None:
+    _print_tasks([c.set_repeat(_resolve(c, args.id), " ".join(args.rule))], "text")
+
+
+def cmd_upcoming(c: Controller, args: argparse.Namespace) -> None:
+    for occurrence in c.upcoming(args.limit):
+        t = c.get(occurrence.task_id)
+        print(f"{format_when(occurrence.at)}  {t.id[:8]}  {t.title}  (#{occurrence.index})")
+
+
+def cmd_archive(c: Controller, args: argparse.Namespace) -> None:
+    if c.archive is None:
+        raise CliError("this storage backend has no archive")
+    older_than = timedelta(days=args.days) if args.days > 0 else None
+    print(f"Archived {c.archive_completed(older_than)} task(s)")
+
+
+def cmd_import(c: Controller, args: argparse.Namespace) -> None:
+    fmt = args.format or _guess_format(args.file)
+    with _open(args.file, "r") as fh:
+        count = c.put_tasks(task_from_record(r) for r in read_records(fh, fmt))
+    print(f"Imported {count} task(s)", file=sys.stderr)
+
+
+def cmd_export(c: Controller, args: argparse.Namespace) -> None:
+    fmt = args.format or _guess_format(args.file)
+    with _open(args.file, "w") as fh:
+        count = write_records(fh, c.view(args.filter), fmt)
+    print(f"Exported {count} task(s)", file=sys.stderr)
+
+
+def cmd_lists(c: Controller, args: argparse.Namespace) -> None:
+    lists = c.lists
+    if lists is None:
+        raise CliError("no lists")
+    if args.create:
+        print(lists.create(args.create).id)
+        return
+    for info in lists:
+        total, active = (c.stats.total, c.stats.active) if info.id == c.list_id else (info.total, info.active)
+        print(f"{info.id:<16} {info.name}  ({active} active / {total} total)")
+
+
+# --- helpers ---
+def _manifest(args: argparse.Namespace) -> ListManifest:
+    path = args.path or DEFAULT_PATH
+    return ListManifest(path.parent if args.path else DEFAULT_DIR, path, args.backend)
+
+
+def _resolve(c: Controller, prefix: str) -> str:
+    if prefix in c:
+        return prefix
+    # Linear scan, but only on the abbreviated-id path of a one-shot command.
+    found = [t.id for t in c.view("all") if t.id.startswith(prefix)]
+    if not found:
+        raise CliError(f"no task with id {prefix!r}")
+    if len(found) > 1:
+        raise CliError(f"id prefix {prefix!r} is ambiguous ({len(found)} tasks)")
+    return found[0]
+
+
+def _print_tasks(tasks: Iterable[Task], fmt: str) -> None:
+    if fmt != "text":
+        write_records(sys.stdout, tasks, fmt)
+        return
+    for t in tasks:
+        mark = "x" if t.done else " "
+        due = f"  due {t.due}" if t.due else ""
+        repeat = f"  repeats {t.repeat}" if t.repeat else ""
+        print(f"{t.id[:8]}  [{mark}] {t.title}  ({Priority(t.priority).value}){due}{repeat}")
+
+
+def _guess_format(path: str) -> str:
+    return "csv" if Path(path).suffix.lower() == ".csv" else "jsonl"
+
+
+@contextmanager
+def _open(path: str, mode: str) -> Iterator[IO[str]]:
+    """Open `path` for text I/O, with "-" meaning stdin/stdout (left open on exit)."""
+    if path == "-":
+        yield sys.stdin if mode == "r" else sys.stdout
+        return
+    with open(path, mode, encoding="utf-8", newline="") as fh:
+        yield fh
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="todo-list", description="Headless To-Do List")
+    parser.add_argument(
+        "--path", type=Path, help="tasks.json location (default: TODO_LIST_TK_PATH)"
+    )
+    parser.add_argument("--backend", help="storage backend (default: TODO_LIST_TK_STORAGE)")
+    parser.add_argument("--list", help="list id or name (default: the default list)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("add", help="add one task per argument")
+    p.add_argument("titles", nargs="+")
+    p.add_argument("--priority", choices=[x.value for x in Priority])
+    p.set_defaults(func=cmd_add)
+
+    for name, func, help_ in (
+        ("list", cmd_list, "list tasks"),
+        ("search", cmd_search, "search task titles"),
+    ):
+        p = sub.add_parser(name, help=help_)
+        if name == "search":
+            p.add_argument("query", nargs="+")
+        p.add_argument("--filter", choices=LIST_FILTERS, default="all")
+        p.add_argument("--format", choices=("text",) + FORMATS, default="text")
+        p.add_argument("--limit", type=int)
+        p.set_defaults(func=func)
+
+    for name, func, help_ in (
+        ("toggle", cmd_toggle, "toggle tasks done/active"),
+        ("delete", cmd_delete, "delete tasks"),
+    ):
+        p = sub.add_parser(name, help=help_)
+        p.add_argument("ids", nargs="+", metavar="ID")
+        p.set_defaults(func=func)
+
+    p = sub.add_parser("archive", help="move completed tasks to the archive")
+    p.add_argument("--days", type=float, default=0, help="only tasks completed at least this many days ago")
+    p.set_defaults(func=cmd_archive)
+
+    p = sub.add_parser("repeat", help="repeat a task from its due date (no rule: stop repeating)")
+    p.add_argument("id", metavar="ID")
+    p.add_argument(
+        "rule", nargs="*",
+        help="daily, weekdays, weekly, every 2 weeks, monthly, yearly or FREQ=...",
+    )
+    p.set_defaults(func=cmd_repeat)
+
+    p = sub.add_parser("upcoming", help="list the next occurrences of repeating tasks")
+    p.add_argument("--limit", type=int, default=20)
+    p.set_defaults(func=cmd_upcoming)
+
+    p = sub.add_parser("lists", help="show the task lists, or create one")
+    p.add_argument("--create", metavar="NAME")
+    p.set_defaults(func=cmd_lists)
+
+    p = sub.add_parser("import", help="import tasks from JSON Lines or CSV ('-' for stdin)")
+    p.add_argument("file")
+    p.add_argument("--format", choices=FORMATS, help="default: from the file extension, else jsonl")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("export", help="export tasks as JSON Lines or CSV ('-' for stdout)")
+    p.add_argument("file")
+    p.add_argument("--format", choices=FORMATS, help="default: from the file extension, else jsonl")
+    p.add_argument("--filter", choices=LIST_FILTERS, default="all")
+    p.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        lists = _manifest(args)
+        list_id = lists.find(args.list).id if args.list else None
+        # Nothing to undo in one shot; opening a list here does not make it the app's current one.
+        c = Controller(lists=lists, list_id=list_id or DEFAULT_LIST, history_steps=0)
+    except KeyError as ex:
+        print(f"todo-list: no list {ex}", file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as ex:
+        print(f"todo-list: {ex}", file=sys.stderr)
+        return 1
+    try:
+        args.func(c, args)
+    except (CliError, OSError, ValueError, TypeError) as ex:
+        print(f"todo-list: {ex}", file=sys.stderr)
+        return 1
+    finally:
+        c.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,70 +6,819 @@ Project: To-Do List (Tkinter)
 File: controller.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-10-25
-Updated: 2025-10-25
+Updated: 2026-10-18
 License: MIT License (see LICENSE file for details)
 ===========================================================================
 
 Description:
 Application controller mediating between UI and storage/model.
 
+Tasks are kept in an `id -> Task` table for O(1) lookups (`TaskDict`, or
+the column-wise `TaskTable` with `compact=True`). Each task also gets an
+insertion sequence number from the table that orders the maintained filter
+views ("all", "active", "done"); those views and the `TaskStats` counters are
+updated on every mutation, so nothing has to rescan the store to render.
+Other derived indexes (the `DueScheduler` of upcoming deadlines, the title
+`SearchIndex` built on first search) register in `_indexes` and receive
+every `update(before, after)` as well.
+
+Views in another sort order (`view(name, order)`) are built on first use
+and then maintained the same way, by removing the task's old key and
+inserting its new one. `move_task` places a task in the manual order by
+giving it a rank between its new neighbours, so a reorder writes one task;
+tasks never placed by hand count as ranked by their creation time (only
+tasks that tie on it, such as older imports, may need ranks of their own).
+
+Every mutation goes through `_put` / `_remove`, which record a
+`(task_id, before, after)` change. Outside of a batch the change is saved
+right away; inside `with controller.batch():` changes accumulate and are
+saved once on exit, or reverted together if anything raises.
+
+Once a top-level operation (or batch) is saved, its changes are published to
+subscribers as a list of `TaskEvent`s, so views can patch only what changed.
+Rolled-back changes are never published.
+
+Each saved operation is also recorded in a bounded `History`, so `undo()`
+and `redo()` can replay its inverse, again as a single batch and one save.
+
+With `async_writes=True` saves are handed to a `BackgroundWriter` thread
+instead, so callers never block on disk; write failures are reported through
+`on_save_error` (called from the writer thread).
+
+With `streaming=True` the controller starts empty and `load_next_chunk()`
+pulls tasks from the store a chunk at a time (publishing them as "added"
+events), so a UI can draw the first screen before a large file is fully
+parsed. Changes made while loading are applied and published immediately,
+but only written once loading finishes: a store that rewrites the whole
+file must never see a partially loaded task set.
+
+Recurring tasks stay one row each (see recurrence.py): toggling one
+completes its next occurrence, and `upcoming()` / `occurrences()` generate
+occurrences across all of them from the `RecurrenceIndex`.
+
+`archive_completed()` moves done tasks into the store's `Archive` (cold,
+compressed segments next to the store file); `view("archive")` and
+`search(..., within="archive")` page through it without loading it.
+
+With a `ListManifest` (`lists=`), the controller works on one named list at
+a time: `open_list()` switches to another list's store, loading it (or, with
+`streaming=True`, starting to stream it) only when first opened. The last
+few lists used stay in memory with their views, indexes, undo history and
+writer, so switching back is instant; the least recently used is closed
+beyond `list_cache`. Only lists with changes are ever written, and their
+task counts go to the manifest.
+
+`reload_external()` pulls in changes other processes made to the store's
+file (for stores with `poll_changes`) and publishes them like local ones.
+
 ===========================================================================
 """
 from __future__ import annotations
 
-from typing import List
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from . import metrics
+from .archive import Archive, ArchiveView, open_archive
+from .events import Listener, TaskEvent
+from .history import HISTORY_BYTES, HISTORY_STEPS, Entry, History, Step
+from .lists import LIST_CACHE, ListManifest
 from .model import Task, Priority
-from .storage import load_tasks, save_tasks
+from .scheduler import DueScheduler
+from .search import SearchIndex
+from .storage import LOAD_CHUNK_SIZE, TaskStore, open_store
+from .tables import COMPACT, TaskDict, TaskTable
 from .utils import new_id
+from .ranks import created_rank, created_seconds, rank_between, ranks_between, time_rank
+from .recurrence import Occurrence, RecurrenceIndex
+from .views import (
+    FILTERS, Filter, Order, OverdueView, TaskStats, TaskView, manual_rank, matches, order_key,
+)
+from .writer import DEFAULT_WRITE_DELAY_MS, BackgroundWriter
+
+Change = Tuple[str, Optional[Task], Optional[Task]]
+# Everything that belongs to one list; swapped out as a whole by `open_list`.
+_SHARD_STATE = (
+    "list_id", "store", "archive", "_history", "_writer", "_loader", "_deferred", "_load_failed",
+    "_tasks", "_stats", "_scheduler", "_recurring", "_search", "_indexes", "_overdue", "_views",
+)
 
 
 class Controller:
-    def __init__(self) -> None:
-        self.tasks: List[Task] = load_tasks()
+    def __init__(
+        self,
+        store: Optional[TaskStore] = None,
+        *,
+        async_writes: bool = False,
+        write_delay_ms: int = DEFAULT_WRITE_DELAY_MS,
+        on_save_error: Optional[Callable[[BaseException], None]] = None,
+        streaming: bool = False,
+        chunk_size: int = LOAD_CHUNK_SIZE,
+        compact: bool = COMPACT,
+        history_steps: int = HISTORY_STEPS,
+        history_bytes: int = HISTORY_BYTES,
+        archive: Optional[Archive] = None,
+        lists: Optional[ListManifest] = None,
+        list_id: Optional[str] = None,
+        list_cache: int = LIST_CACHE,
+    ) -> None:
+        self.lists = lists
+        self.list_id: Optional[str] = None
+        if lists is not None:
+            self.list_id = list_id or lists.current
+            if store is None:
+                store = lists.open_store(self.list_id)
+        self._history_limits = (history_steps, history_bytes)
+        self._replaying: Optional[str] = None  # "undo" / "redo" while one is being saved
+        self._compact = compact
+        self._streaming = (streaming, chunk_size)
+        self._changes: List[Change] = []
+        self._batch_depth = 0
+        self._listeners: List[Listener] = []
+        self._writer_args = (write_delay_ms / 1000, on_save_error) if async_writes else None
+        self._shards: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # list id -> state
+        self._list_cache = max(1, list_cache)
+        self._open_shard(store if store is not None else open_store(), archive)
+
+    @property
+    def tasks(self) -> List[Task]:
+        return list(self._views["all", "added"])
+
+    @tasks.setter
+    def tasks(self, tasks: Iterable[Task]) -> None:
+        self._reset(tasks)
+
+    def get(self, task_id: str) -> Task:
+        return self._tasks[task_id]
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Call `listener(events)` after each saved operation. Returns an unsubscribe function."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    # --- loading ---
+    @property
+    def loading(self) -> bool:
+        """True until a streaming load has delivered every task."""
+        return self._loader is not None
+
+    @metrics.timed("controller.load_chunk")
+    def load_next_chunk(self) -> bool:
+        """Apply the next chunk of a streaming load; return False once loading is done.
+
+        If reading the store fails the error propagates and the controller
+        stays in the loading state for good, so nothing is ever written over
+        the file it could not read.
+        """
+        if self._loader is None or self._load_failed:
+            return False
+        try:
+            chunk = next(self._loader, None)
+        except BaseException:
+            self._load_failed = True
+            raise
+        if chunk is None:
+            self._finish_loading()
+            return False
+        changes: List[Change] = []
+        for t in chunk:
+            before = self._tasks.get(t.id)
+            self._apply(t.id, before, t)
+            changes.append((t.id, before, t))
+        self._publish(changes)
+        return True
+
+    def load_all(self) -> None:
+        while self.load_next_chunk():
+            pass
+
+    @metrics.timed("controller.reload_external")
+    def reload_external(self) -> int:
+        """Apply tasks changed on disk by someone else; returns how many tasks changed.
+
+        A task is taken from disk only if it differs from ours and is at least
+        as new by `updated_at`, so local edits still waiting to be written are
+        never reverted. Nothing is saved: the changes came from the store.
+        """
+        poll = getattr(self.store, "poll_changes", None)
+        if poll is None or self.loading or self._batch_depth:
+            return 0
+        found = poll()
+        if not found:
+            return 0
+        upserted, removed = found
+        changes: List[Change] = []
+        for t in upserted:
+            cur = self._tasks.get(t.id)
+            if cur is None or (t != cur and t.updated_at >= cur.updated_at):
+                self._apply(t.id, cur, t)
+                changes.append((t.id, cur, t))
+        for old in removed:
+            cur = self._tasks.get(old.id)
+            if cur is not None and cur.updated_at <= old.updated_at:
+                self._apply(old.id, cur, None)
+                self._tasks.forget(old.id)
+                changes.append((old.id, cur, None))
+        self._publish(changes)
+        return len(changes)
 
     # --- CRUD ---
+    @metrics.timed("controller.add_task")
     def add_task(self, title: str) -> Task:
-        title = title.strip()
-        if not title:
-            raise ValueError("Task title cannot be empty")
-        t = Task(id=new_id(), title=title)
-        self.tasks.append(t)
-        save_tasks(self.tasks)
+        [t] = self._add([title])
+        self._save()
         return t
 
+    def _add(self, titles: Iterable[str]) -> List[Task]:
+        tasks = []
+        for title in titles:
+            title = title.strip()
+            if not title:
+                raise ValueError("Task title cannot be empty")
+            tasks.append(Task(id=new_id(), title=title))
+        start = 0
+        while start < len(tasks):
+            created_at = tasks[start].created_at
+            end = start + 1
+            while end < len(tasks) and tasks[end].created_at == created_at:
+                end += 1
+            self._rank_new(tasks, start, end)
+            for t in tasks[start:end]:
+                self._put(t)
+            start = end
+        return tasks
+
+    def _rank_new(self, tasks: List[Task], start: int, end: int) -> None:
+        """Give new tasks `tasks[start:end]`, created in the same second, distinct manual ranks.
+
+        Tasks never placed by hand sort by creation second (`views.manual_rank`),
+        so tasks created in the same second would tie, and nothing could be
+        dropped between them without ranking them first. The first task of a
+        second keeps the implicit rank; later ones get ranks spread over the
+        rest of that second, after any task already there.
+        """
+        seconds = created_seconds(tasks[start].created_at)
+        if seconds is None:
+            return
+        lo, hi = created_rank(tasks[start].created_at), time_rank(seconds + 1)
+        manual = self._views.get(("all", "manual"))
+        if manual is not None:  # moves may have put tasks anywhere in this second
+            i = manual.keys.bisect_left((hi,))
+            last = manual[i - 1] if i else None
+        else:
+            added = self._views[("all", "added")]
+            last = added[len(added) - 1] if len(added) else None
+        last_rank = manual_rank(last) if last is not None else None
+        if last_rank is not None and lo <= last_rank < hi:
+            lo = last_rank
+        else:
+            start += 1  # nothing in this second yet
+        for i, rank in zip(range(start, end), ranks_between(lo, hi, end - start)):
+            tasks[i] = replace(tasks[i], rank=rank)
+
+    @metrics.timed("controller.toggle_task")
     def toggle_task(self, task_id: str) -> Task:
-        idx = self._index(task_id)
-        self.tasks[idx] = self.tasks[idx].toggle()
-        save_tasks(self.tasks)
-        return self.tasks[idx]
+        t = self._put(self.get(task_id).toggle())
+        self._save()
+        return t
 
+    @metrics.timed("controller.rename_task")
     def rename_task(self, task_id: str, new_title: str) -> Task:
-        idx = self._index(task_id)
-        self.tasks[idx] = self.tasks[idx].rename(new_title)
-        save_tasks(self.tasks)
-        return self.tasks[idx]
+        t = self._put(self.get(task_id).rename(new_title))
+        self._save()
+        return t
 
+    @metrics.timed("controller.delete_task")
     def delete_task(self, task_id: str) -> None:
-        idx = self._index(task_id)
-        del self.tasks[idx]
-        save_tasks(self.tasks)
+        self._remove(task_id)
+        self._save()
 
+    @metrics.timed("controller.clear_completed")
     def clear_completed(self) -> int:
-        before = len(self.tasks)
-        self.tasks = [t for t in self.tasks if not t.done]
-        save_tasks(self.tasks)
-        return before - len(self.tasks)
+        removed = [t.id for t in self._views["done", "added"]]
+        with self.batch():
+            for task_id in removed:
+                self._remove(task_id)
+        return len(removed)
+
+    @metrics.timed("controller.archive_completed")
+    def archive_completed(self, older_than: Optional[timedelta] = None) -> int:
+        """Move done tasks unchanged for `older_than` (any age if None) to the archive.
+
+        The archive is written (and synced) before the tasks leave the store,
+        so a failure in between leaves a copy in both rather than in neither.
+        Archiving is not undoable: it clears the undo history.
+        """
+        if self.archive is None or self.loading:
+            return 0
+        if self._batch_depth:
+            raise RuntimeError("cannot archive inside a batch")
+        cutoff = (datetime.utcnow() - older_than).isoformat(timespec="seconds") if older_than is not None else None
+        done = [t for t in self._views["done", "added"] if cutoff is None or t.updated_at < cutoff]
+        if not done:
+            return 0
+        self.archive.append(done)
+        with self.batch():
+            for t in done:
+                self._remove(t.id)
+        self._history.clear()
+        return len(done)
+
+    @metrics.timed("controller.set_due")
+    def set_due(self, task_id: str, due: Optional[str]) -> Task:
+        t = self._put(self.get(task_id).set_due(due))
+        self._save()
+        return t
+
+    @metrics.timed("controller.set_repeat")
+    def set_repeat(self, task_id: str, rule: Optional[str]) -> Task:
+        """Make a task recur by `rule` (see recurrence.py); empty or None makes it one-off."""
+        t = self._put(self.get(task_id).set_repeat(rule))
+        self._save()
+        return t
+
+    @metrics.timed("controller.complete_occurrence")
+    def complete_occurrence(self, task_id: str, index: int, done: bool = True) -> Task:
+        t = self._put(self.get(task_id).complete_occurrence(index, done))
+        self._save()
+        return t
+
+    @metrics.timed("controller.move_task")
+    def move_task(self, task_id: str, before_id: Optional[str] = None, within: Filter = "all") -> Task:
+        """Move a task just before `before_id` (None: to the end) in the manual order of `within`.
+
+        Only the moved task gets a new rank, between its new neighbours' ranks
+        (a task never placed by hand counts as ranked by its creation time;
+        see `views.manual_rank`). Dropped at the end, it stays before tasks
+        created later. Only among tasks that tie, created in the same second
+        and never placed by hand (imports), do the tied tasks on the shorter
+        side of the drop position get ranks as well, in the same save.
+        """
+        if within == "overdue":
+            raise ValueError("the overdue filter has no manual order")
+        self.get(task_id)  # fail before anything changes
+        view = self.view(within, "manual")
+        if before_id is None:
+            pos = len(view)
+        else:
+            pos = view.keys.bisect_left(view.key(self.get(before_id), self._tasks.seq(before_id)))
+        lo = view[pos - 1].id if pos else None
+        hi = view[pos].id if pos < len(view) else None
+        if task_id in (lo, hi):
+            return self.get(task_id)  # already there
+        lo_rank = manual_rank(self.get(lo)) if lo else None
+        if hi:
+            hi_rank: Optional[str] = manual_rank(self.get(hi))
+        else:
+            # Below the next second's rank: later tasks, even those added in this second, follow.
+            now = created_seconds(datetime.utcnow().isoformat(timespec="seconds"))
+            next_rank = time_rank(now + 1)  # type: ignore[operator]
+            hi_rank = next_rank if (lo_rank or "") < next_rank else None
+        with self.batch():
+            if hi_rank is not None and not (lo_rank or "") < hi_rank:
+                lo_rank, hi_rank = self._split_tie(hi_rank, lo, hi, task_id)  # type: ignore[arg-type]
+            return self._put(self.get(task_id).set_rank(rank_between(lo_rank, hi_rank)))
+
+    def _split_tie(
+        self, tie: str, lo: Optional[str], hi: str, skip: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Rank the tasks tied at `tie` on one side of the `lo`/`hi` gap; returns its new bounds.
 
+        Implicit placement, so `updated_at` is left alone: it still says when
+        the user last changed the task (archiving and the "updated" order rely
+        on it).
+        """
+        view = self.view("all", "manual")
+        start = view.keys.bisect_left((tie,))
+        end = view.keys.bisect_left((tie, float("inf")))
+        gap = view.keys.bisect_left(view.key(self.get(hi), self._tasks.seq(hi)))
+        before = [t for t in view[start:gap] if t.id != skip] if lo is not None else []
+        after = [t for t in view[gap:end] if t.id != skip]
+        if before and len(before) <= len(after):
+            prev = manual_rank(view[start - 1]) if start else None
+            for t, rank in zip(before, ranks_between(prev, tie, len(before))):
+                self._put(replace(t, rank=rank))
+            return manual_rank(self.get(lo)), tie  # type: ignore[arg-type]
+        following = manual_rank(view[end]) if end < len(view) else None
+        for t, rank in zip(after, ranks_between(tie, following, len(after))):
+            self._put(replace(t, rank=rank))
+        return tie, manual_rank(self.get(hi))
+
+    @metrics.timed("controller.set_priority")
     def set_priority(self, task_id: str, p: Priority) -> Task:
-        idx = self._index(task_id)
-        self.tasks[idx] = self.tasks[idx].set_priority(p)
-        save_tasks(self.tasks)
-        return self.tasks[idx]
+        t = self._put(self.get(task_id).set_priority(p))
+        self._save()
+        return t
+
+    # --- history ---
+    @property
+    def can_undo(self) -> bool:
+        return self._history.can_undo
+
+    @property
+    def can_redo(self) -> bool:
+        return self._history.can_redo
+
+    @metrics.timed("controller.undo")
+    def undo(self) -> bool:
+        """Revert the last saved operation; returns False if there was none."""
+        return self._replay("undo")
+
+    @metrics.timed("controller.redo")
+    def redo(self) -> bool:
+        """Re-apply the last undone operation; returns False if there was none."""
+        return self._replay("redo")
+
+    def _replay(self, direction: str) -> bool:
+        if self._batch_depth:
+            raise RuntimeError(f"cannot {direction} inside a batch")
+        step = self._history.pop_undo() if direction == "undo" else self._history.pop_redo()
+        if step is None:
+            return False
+        self._replaying = direction
+        try:
+            with self.batch():
+                for task_id, before, _, seq in reversed(step):
+                    if before is None:
+                        if task_id in self._tasks:
+                            self._remove(task_id)
+                    else:
+                        if task_id not in self._tasks:
+                            self._tasks.reserve(task_id, seq)
+                        # A fresh timestamp, so merges and other windows treat it as the newest edit.
+                        self._put(before.touch())
+        except BaseException:
+            self._history.push_back(step, redo=direction == "redo")
+            raise
+        finally:
+            self._replaying = None
+        return True
+
+    # --- bulk ---
+    @contextmanager
+    def batch(self) -> Iterator["Controller"]:
+        """Group mutations into one save; revert all of them if the block raises."""
+        mark = len(self._changes)
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            self._rollback(mark)
+            raise
+        self._batch_depth -= 1
+        self._save()
+
+    @metrics.timed("controller.add_tasks")
+    def add_tasks(self, titles: Iterable[str]) -> List[Task]:
+        with self.batch():
+            return self._add(titles)
+
+    @metrics.timed("controller.put_tasks")
+    def put_tasks(self, tasks: Iterable[Task]) -> int:
+        """Insert or replace whole tasks (e.g. from an import) with a single save."""
+        with self.batch():
+            count = 0
+            for t in tasks:
+                self._put(t)
+                count += 1
+        return count
+
+    @metrics.timed("controller.toggle_many")
+    def toggle_many(self, task_ids: Iterable[str]) -> List[Task]:
+        with self.batch():
+            return [self.toggle_task(task_id) for task_id in task_ids]
+
+    @metrics.timed("controller.delete_many")
+    def delete_many(self, task_ids: Iterable[str]) -> int:
+        with self.batch():
+            count = 0
+            for task_id in task_ids:
+                self.delete_task(task_id)
+                count += 1
+        return count
+
+    @property
+    def saving(self) -> bool:
+        """True while asynchronous writes are still queued or in progress."""
+        return self._writer is not None and self._writer.pending
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        for state in self._shards.values():
+            self._close_shard(state)
+        self._shards.clear()
+        self.load_all()
+        self._close_store()
+        if self.lists is not None:
+            self.lists.save()
+
+    # --- lists ---
+    @metrics.timed("controller.open_list")
+    def open_list(self, list_id: str) -> None:
+        """Make `list_id` the current list, loading it unless it is still in memory.
+
+        With `streaming=True` a list that has to be read from disk starts out
+        `loading`, like the first one. If opening fails, the current list stays.
+        """
+        if self.lists is None:
+            raise RuntimeError("this controller has no lists")
+        if list_id not in self.lists:
+            raise KeyError(list_id)
+        if list_id == self.list_id:
+            return
+        if self._batch_depth:
+            raise RuntimeError("cannot switch lists inside a batch")
+        self._count()
+        previous = self._stash()
+        cached = self._shards.pop(list_id, None)
+        if cached is not None:
+            self._restore(cached)
+        else:
+            try:
+                self._open_shard(self.lists.open_store(list_id), None)
+            except BaseException:
+                self._restore(previous)
+                raise
+        self.list_id = self.lists.current = list_id
+        self._shards[previous["list_id"]] = previous
+        # Evict only once the new list is open, so a failed open leaves the cache as it was.
+        while len(self._shards) >= self._list_cache:
+            self._close_shard(self._shards.popitem(last=False)[1])
+        self.lists.save()
+
+    def delete_list(self, list_id: str) -> None:
+        """Delete a list that is not the current one, with its files."""
+        if self.lists is None:
+            raise RuntimeError("this controller has no lists")
+        if list_id == self.list_id:
+            raise ValueError("cannot delete the open list")
+        state = self._shards.pop(list_id, None)
+        if state is not None:
+            self._close_shard(state)
+        self.lists.remove(list_id)
+
+    # --- queries ---
+    @property
+    def stats(self) -> TaskStats:
+        return self._stats
+
+    def view(self, name: Filter = "all", order: Order = "added") -> TaskView | OverdueView | ArchiveView:
+        """Live view of the tasks matching filter `name`, sorted by `order`.
+
+        "overdue" is always most overdue first and "archive" newest first.
+        Other orders than "added" cost one sort the first time they are asked for.
+        """
+        if name == "overdue":
+            return self._overdue
+        if name == "archive":
+            return ArchiveView(self.archive)
+        view = self._views.get((name, order))
+        if view is None:
+            at = self._tasks.at
+            keys = (order_key(order, at(seq), seq) for seq in self._views[name, "added"].keys)
+            view = self._views[name, order] = TaskView(name, self._task_at, keys, order)
+        return view
+
+    def next_deadline(self) -> Optional[datetime]:
+        """When the next active task falls due, or None if none will."""
+        return self._scheduler.next_deadline()
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Task]:
+        """Tasks that have fallen due since the last call, earliest first."""
+        return [self._tasks[i] for i in self._scheduler.pop_due(now) if i in self._tasks]
+
+    @metrics.timed("controller.upcoming")
+    def upcoming(self, n: int = 10, start: Optional[datetime] = None) -> List[Occurrence]:
+        """The next `n` open occurrences of recurring tasks from `start` (default: now)."""
+        return self._recurring.upcoming(n, start)
+
+    def occurrences(self, start: datetime, end: datetime) -> Iterator[Occurrence]:
+        """Open occurrences of recurring tasks in `[start, end)`, in date order, made lazily."""
+        return self._recurring.between(start, end)
+
+    def count(self, done: Optional[bool] = None) -> int:
+        if done is None:
+            return self._stats.total
+        return self._stats.done if done else self._stats.active
+
+    def filtered(self, done: Optional[bool] = None) -> List[Task]:
+        name: Filter = "all" if done is None else ("done" if done else "active")
+        return list(self._views[name, "added"])
+
+    @metrics.timed("controller.search")
+    def search(self, query: str, limit: Optional[int] = None, within: Filter = "all") -> List[Task]:
+        """Tasks whose title matches every word of `query` (prefixes allowed), best first."""
+        if within == "archive":
+            return self.archive.search(query, limit) if self.archive is not None else []
+        if self._search is None:
+            self._search = SearchIndex(self._tasks.values())
+            self._indexes.append(self._search)
+        ids = self._search.search(query, None if within != "all" else limit)
+        tasks = [self._tasks[i] for i in ids]
+        if within != "all":
+            tasks = [t for t in tasks if matches(within, t)][:limit]
+        return tasks
 
     # --- helpers ---
-    def _index(self, task_id: str) -> int:
-        for i, t in enumerate(self.tasks):
-            if t.id == task_id:
-                return i
-        raise KeyError(task_id)
+    def _open_shard(self, store: TaskStore, archive: Optional[Archive]) -> None:
+        self.store = store
+        self.archive = archive if archive is not None else open_archive(store)
+        self._history = History(*self._history_limits)
+        self._writer: Optional[BackgroundWriter] = None
+        self._loader: Optional[Iterator[List[Task]]] = None
+        self._deferred: Dict[str, Optional[Task]] = {}
+        self._load_failed = False
+        streaming, chunk_size = self._streaming
+        if streaming:
+            self._reset(())
+            self._loader = _iter_load(store, chunk_size)
+        else:
+            self._reset(store.load())
+            self._start_writer()
+
+    def _stash(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _SHARD_STATE}
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _close_shard(self, state: Dict[str, Any]) -> None:
+        """Close a list that is not the current one, writing whatever it still has pending."""
+        current = self._stash()
+        listeners, self._listeners = self._listeners, []  # its events are nobody's business now
+        self._restore(state)
+        try:
+            if self._deferred:
+                self.load_all()  # changes made while it loaded are written once it has loaded
+            self._close_store()
+        finally:
+            self._restore(current)
+            self._listeners = listeners
+
+    def _close_store(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.store.close()
+        self._count()
+
+    def _count(self) -> None:
+        # Only a fully loaded list knows its counts; unchanged counts are not written.
+        if self.lists is not None and self.list_id is not None and not self.loading:
+            self.lists.set_counts(self.list_id, self._stats.total, self._stats.active)
+
+    def _reset(self, tasks: Iterable[Task]) -> None:
+        tasks = list(tasks)
+        self._tasks: TaskDict | TaskTable = TaskTable(tasks) if self._compact else TaskDict(tasks)
+        self._history.clear()  # its sequence numbers refer to the old table
+        # Reading tasks back out of a compact table rebuilds them; use the input unless ids repeat.
+        unique = tasks if len(tasks) == len(self._tasks) else list(self._tasks.values())
+        self._stats = TaskStats()
+        for t in unique:
+            self._stats.add(t)
+        self._scheduler = DueScheduler(unique)
+        self._recurring = RecurrenceIndex(unique)
+        self._search: Optional[SearchIndex] = None
+        self._indexes: List[Any] = [self._stats, self._scheduler, self._recurring]
+        self._overdue = OverdueView(self._stats, self.get)
+        self._views: Dict[Tuple[Filter, Order], TaskView] = {
+            (f, "added"): TaskView(f, self._task_at, self._tasks.rows(f)) for f in FILTERS
+        }
+
+    def _task_at(self, seq: object) -> Task:
+        return self._tasks.at(seq)  # type: ignore[arg-type]
+
+    def _apply(self, task_id: str, before: Optional[Task], after: Optional[Task]) -> None:
+        """Move task `task_id` from state `before` to `after`, keeping indexes in sync."""
+        for index in self._indexes:
+            index.update(before, after)
+        if before is not None:
+            seq = self._tasks.seq(task_id)
+            for view in self._views.values():
+                if view.matches(before):
+                    view.keys.remove(view.key(before, seq))
+        if after is None:
+            self._tasks.vacate(task_id)  # keeps the sequence number until saved
+            return
+        self._tasks[task_id] = after
+        seq = self._tasks.seq(task_id)
+        for view in self._views.values():
+            if view.matches(after):
+                view.keys.add(view.key(after, seq))
+
+    def _put(self, t: Task) -> Task:
+        before = self._tasks.get(t.id)
+        self._apply(t.id, before, t)
+        self._changes.append((t.id, before, t))
+        return t
+
+    def _remove(self, task_id: str) -> Task:
+        t = self._tasks[task_id]
+        self._apply(task_id, t, None)
+        self._changes.append((task_id, t, None))
+        return t
+
+    def _save(self) -> None:
+        """Persist pending changes unless a batch is still open."""
+        if self._batch_depth:
+            return
+        changes, self._changes = self._changes, []
+        final: Dict[str, Optional[Task]] = {}
+        initial: Dict[str, Optional[Task]] = {}
+        for task_id, before, after in changes:
+            initial.setdefault(task_id, before)
+            final[task_id] = after
+        upserted = [t for t in final.values() if t is not None]
+        deleted = [i for i, t in final.items() if t is None and initial[i] is not None]
+        if self._loader is not None:
+            self._deferred.update(final)
+        elif upserted or deleted:
+            try:
+                self._commit(upserted, deleted)
+            except BaseException:
+                self._changes = changes
+                self._rollback(0)
+                raise
+        self._record(initial, final)
+        # Sequence numbers are kept until now so a rollback restores original order.
+        for task_id, t in final.items():
+            if t is None:
+                self._tasks.forget(task_id)
+        self._publish(changes)
+
+    def _record(self, initial: Dict[str, Optional[Task]], final: Dict[str, Optional[Task]]) -> None:
+        step: Step = tuple(
+            Entry(task_id, initial[task_id], after, self._tasks.seq(task_id))
+            for task_id, after in final.items()
+            if initial[task_id] is not after
+        )
+        if self._replaying == "undo":
+            self._history.record_undone(step)
+        elif self._replaying == "redo":
+            self._history.record_redone(step)
+        else:
+            self._history.record(step)
+
+    def _commit(self, upserted: List[Task], deleted: List[str]) -> None:
+        if self._writer is not None:
+            self._writer.submit(upserted, deleted)
+        else:
+            with metrics.timer("controller.commit"):
+                self.store.commit(self._views["all", "added"], upserted=upserted, deleted=deleted)
+
+    def _start_writer(self) -> None:
+        if self._writer_args is not None and self._writer is None:
+            self._writer = BackgroundWriter(
+                self.store, self._tasks.values(), *self._writer_args,
+                mirror=TaskTable() if self._compact else None,
+            )
+
+    def _finish_loading(self) -> None:
+        """Start writing once every task is in memory, beginning with changes made meanwhile."""
+        self._loader = None
+        self._start_writer()
+        deferred, self._deferred = self._deferred, {}
+        upserted = [t for t in deferred.values() if t is not None]
+        # Deleting an id the store never had is a no-op for every backend.
+        deleted = [i for i, t in deferred.items() if t is None]
+        if upserted or deleted:
+            self._commit(upserted, deleted)
+
+    def _publish(self, changes: List[Change]) -> None:
+        if not changes or not self._listeners:
+            return
+        events = [TaskEvent.from_change(*change) for change in changes]
+        for listener in list(self._listeners):
+            listener(events)
+
+    def _rollback(self, mark: int) -> None:
+        """Revert in-memory changes recorded after position `mark`."""
+        for task_id, before, after in reversed(self._changes[mark:]):
+            self._apply(task_id, after, before)
+        del self._changes[mark:]
+
+
+def _iter_load(store: TaskStore, size: int) -> Iterator[List[Task]]:
+    # A generator, so not even opening the file happens before the first chunk is asked for.
+    iter_load = getattr(store, "iter_load", None)
+    if iter_load is not None:
+        yield from iter_load(size)
+        return
+    it = iter(store.load())
+    while chunk := list(islice(it, size)):
+        yield chunk
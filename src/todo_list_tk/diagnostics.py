@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: diagnostics.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Diagnostics window: a live view of the `metrics` timers and counters, with
+buttons to reset them or save them to a JSON file.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Optional
+
+from . import metrics
+
+REFRESH_MS = 1000
+
+
+class DiagnosticsWindow(tk.Toplevel):
+    def __init__(self, master: tk.Misc) -> None:
+        super().__init__(master)
+        self.title("Diagnostics")
+        self._job: Optional[str] = None
+
+        self.text = tk.Text(self, width=90, height=28, font="TkFixedFont", wrap="none")
+        self.text.pack(fill="both", expand=True, padx=8, pady=(8, 0))
+        buttons = ttk.Frame(self, padding=8)
+        buttons.pack(fill="x")
+        ttk.Button(buttons, text="Reset", command=self._reset).pack(side="left")
+        ttk.Button(buttons, text="Save…", command=self._save).pack(side="left", padx=(8, 0))
+        ttk.Button(buttons, text="Close", command=self.destroy).pack(side="right")
+        self.bind("<Escape>", lambda e: self.destroy())
+        self._update()
+
+    def destroy(self) -> None:
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        super().destroy()
+
+    def _update(self) -> None:
+        if metrics.enabled:
+            report = metrics.format_report()
+        else:
+            report = "Metrics are off. Start the app with TODO_LIST_TK_METRICS=1 to record them."
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", report)
+        self.text.configure(state="disabled")
+        self._job = self.after(REFRESH_MS, self._update)
+
+    def _reset(self) -> None:
+        metrics.reset()
+        if self._job is not None:
+            self.after_cancel(self._job)
+        self._update()
+
+    def _save(self) -> None:
+        from tkinter import filedialog, messagebox
+
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".json", initialfile="metrics.json",
+            filetypes=[("JSON", "*.json")],
+        )
+        if not path:
+            return
+        try:
+            metrics.dump(path)
+        except OSError as ex:
+            messagebox.showerror("Save failed", str(ex), parent=self)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: events.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Change events emitted by the controller.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, List, Literal, Optional
+
+from .model import Task
+
+EventKind = Literal["added", "updated", "removed"]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskEvent:
+    kind: EventKind
+    task_id: str
+    task: Optional[Task]  # state after the change; None when removed
+    previous: Optional[Task]  # state before the change; None when added
+
+    @classmethod
+    def from_change(cls, task_id: str, before: Optional[Task], after: Optional[Task]) -> "TaskEvent":
+        if before is None:
+            kind: EventKind = "added"
+        elif after is None:
+            kind = "removed"
+        else:
+            kind = "updated"
+        return cls(kind, task_id, after, before)
+
+
+Listener = Callable[[List[TaskEvent]], None]
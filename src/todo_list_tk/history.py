@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: history.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Bounded undo/redo stacks for the controller.
+
+A step is the net change of one saved operation: per task, the version
+before and after it (None for "did not exist") plus the task's sequence
+number, so an undone delete returns to its place in the list. Tasks are
+immutable, so a step only holds references: the "after" versions are the
+live tasks, and an edit's "before" version shares its strings with them.
+
+Both stacks together are capped by step count and by an estimate of the
+memory only the history keeps alive, evicting the oldest steps first. A
+single step over the memory cap is not kept, and the history before it is
+dropped with it. The default cap holds a clear of ~80k completed tasks.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import os
+import sys
+from collections import deque
+from typing import Deque, NamedTuple, Optional, Tuple
+
+from .model import Task
+
+HISTORY_STEPS = int(os.environ.get("TODO_LIST_TK_UNDO_STEPS", "100"))
+HISTORY_BYTES = int(os.environ.get("TODO_LIST_TK_UNDO_MB", "32")) << 20
+
+_ENTRY_BYTES = 120  # the entry tuple, its fields and the step's slot for it
+
+
+class Entry(NamedTuple):
+    task_id: str
+    before: Optional[Task]
+    after: Optional[Task]
+    seq: int
+
+
+Step = Tuple[Entry, ...]
+
+
+class History:
+    def __init__(self, max_steps: int = HISTORY_STEPS, max_bytes: int = HISTORY_BYTES) -> None:
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self._undo: Deque[Tuple[Step, int]] = deque()
+        self._redo: Deque[Tuple[Step, int]] = deque()
+        self.size = 0  # estimated bytes held by both stacks
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, step: Step) -> None:
+        """A new operation: it becomes undoable and anything undone is dropped."""
+        if step:
+            self._drop(self._redo)
+            self._push(self._undo, step)
+
+    def record_undone(self, step: Step) -> None:
+        """What undoing a step did, which redo replays in reverse."""
+        self._push(self._redo, step)
+
+    def record_redone(self, step: Step) -> None:
+        self._push(self._undo, step)
+
+    def pop_undo(self) -> Optional[Step]:
+        return self._pop(self._undo)
+
+    def pop_redo(self) -> Optional[Step]:
+        return self._pop(self._redo)
+
+    def push_back(self, step: Step, redo: bool = False) -> None:
+        """Return a popped step whose replay failed."""
+        self._push(self._redo if redo else self._undo, step)
+
+    def clear(self) -> None:
+        self._drop(self._undo)
+        self._drop(self._redo)
+
+    def _push(self, stack: Deque[Tuple[Step, int]], step: Step) -> None:
+        if not step or self.max_steps <= 0:
+            return
+        cost = sum(_cost(e) for e in step)
+        if cost > self.max_bytes:
+            # Undoing past a step that was not kept would be inconsistent.
+            self.clear()
+            return
+        stack.append((step, cost))
+        self.size += cost
+        while len(self._undo) + len(self._redo) > self.max_steps or self.size > self.max_bytes:
+            # Oldest first: the bottom of the undo stack, then the far end of the redo stack.
+            for oldest in (self._undo, self._redo):
+                if oldest and oldest[0][0] is not step:
+                    self.size -= oldest.popleft()[1]
+                    break
+            else:
+                break
+
+    def _pop(self, stack: Deque[Tuple[Step, int]]) -> Optional[Step]:
+        if not stack:
+            return None
+        step, cost = stack.pop()
+        self.size -= cost
+        return step
+
+    def _drop(self, stack: Deque[Tuple[Step, int]]) -> None:
+        self.size -= sum(cost for _, cost in stack)
+        stack.clear()
+
+
+def _cost(e: Entry) -> int:
+    """Rough bytes kept alive only by this entry."""
+    cost = _ENTRY_BYTES
+    before, after = e.before, e.after
+    if before is not None:
+        cost += sys.getsizeof(before)
+        if after is None:  # deleted: the history holds the whole task
+            cost += sum(sys.getsizeof(s) for s in (before.id, before.title, before.created_at, before.updated_at))
+        else:  # edited: `replace` shared the unchanged strings
+            cost += sys.getsizeof(before.updated_at)
+            if before.title is not after.title:
+                cost += sys.getsizeof(before.title)
+    return cost
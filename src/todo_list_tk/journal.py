@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: journal.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Append-only journal storage backend.
+
+The snapshot is the regular `tasks.json` file; mutations are appended as
+compact JSON lines to `tasks.json.journal`. Loading replays the journal on
+top of the snapshot, and compaction folds the journal back into a fresh
+snapshot (written atomically) before truncating it. Journal records are
+idempotent, so a crash between the snapshot rename and the truncation only
+replays records that are already part of the snapshot. A torn trailing line
+left by a crash mid-append is discarded on the next load.
+
+Several processes may share the files: appends, loads and compaction run
+under an advisory lock, and compaction folds whatever is on disk (including
+other processes' records) rather than this process's in-memory view.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO
+
+from .locking import LOCK_TIMEOUT, FileLock, lock_path_for
+from .model import Task
+from .storage import DEFAULT_PATH, ensure_storage, load_tasks, save_tasks, task_from_dict, task_to_dict
+
+COMPACT_THRESHOLD = 1000
+
+
+def journal_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".journal")
+
+
+class JournalStore:
+    """Snapshot + append-only log store.
+
+    `compact_threshold` is the number of journal records after which the next
+    commit folds the log into the snapshot. With `fsync=True` every append is
+    flushed to disk before `commit` returns.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_PATH,
+        compact_threshold: int = COMPACT_THRESHOLD,
+        fsync: bool = True,
+        lock_timeout: Optional[float] = LOCK_TIMEOUT,
+    ) -> None:
+        self.path = Path(path)
+        self.journal_path = journal_path_for(self.path)
+        self.lock = FileLock(lock_path_for(self.path), lock_timeout)
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.records = 0
+        self._fh: Optional[TextIO] = None
+
+    # --- store API ---
+    def load(self) -> List[Task]:
+        with self.lock:
+            return self._read_current()
+
+    def commit(
+        self,
+        tasks: Iterable[Task],
+        upserted: Iterable[Task] = (),
+        deleted: Iterable[str] = (),
+    ) -> None:
+        lines = [_dumps({"op": "put", "task": task_to_dict(t)}) for t in upserted]
+        lines += [_dumps({"op": "del", "id": task_id}) for task_id in deleted]
+        if not lines:
+            return
+        with self.lock:
+            fh = self._open()
+            fh.write("".join(line + "\n" for line in lines))
+            fh.flush()
+            if self.fsync:
+                os.fsync(fh.fileno())
+            self.records += len(lines)
+            if self.records >= self.compact_threshold:
+                self._compact(self._read_current())
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot.
+
+        The state is always replayed from disk under the lock, never taken
+        from a caller's copy, so records other processes appended since it
+        was made are not lost.
+        """
+        with self.lock:
+            self._compact(self._read_current())
+
+    def close(self) -> None:
+        self._close_journal()
+
+    # --- helpers ---
+    def _read_current(self) -> List[Task]:
+        ensure_storage(self.path)
+        tasks: Dict[str, Task] = {t.id: t for t in load_tasks(self.path)}
+        self.records = self._replay(tasks)
+        return list(tasks.values())
+
+    def _compact(self, tasks: Iterable[Task]) -> None:
+        save_tasks(tasks, self.path, fsync=self.fsync)
+        self._close_journal()
+        with open(self.journal_path, "w", encoding="utf-8") as fh:
+            if self.fsync:
+                os.fsync(fh.fileno())
+        self.records = 0
+
+    def _open(self) -> TextIO:
+        if self._fh is None:
+            self._fh = open(self.journal_path, "a", encoding="utf-8")
+        return self._fh
+
+    def _close_journal(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _replay(self, tasks: Dict[str, Task]) -> int:
+        """Apply journal records to `tasks`; truncate a torn tail. Returns records applied."""
+        if not self.journal_path.exists():
+            return 0
+        applied = 0
+        good_end = 0
+        with open(self.journal_path, "rb") as fh:
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    rec = json.loads(raw)
+                except ValueError:
+                    break
+                if rec.get("op") == "put":
+                    t = task_from_dict(rec["task"])
+                    tasks[t.id] = t
+                elif rec.get("op") == "del":
+                    tasks.pop(rec["id"], None)
+                applied += 1
+                good_end += len(raw)
+        if good_end != self.journal_path.stat().st_size:
+            with open(self.journal_path, "r+b") as fh:
+                fh.truncate(good_end)
+        return applied
+
+
+def _dumps(rec: dict) -> str:
+    return json.dumps(rec, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: lists.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Named task lists, each stored as its own shard.
+
+The default list ("tasks") is the existing `tasks.json`; every other list
+is a store of its own under `TODO_LIST_TK_HOME/lists/` (`<id>.json`, plus
+whatever files the chosen backend and the archive keep next to it). A small
+manifest, `lists.json`, names the lists and records each one's task counts,
+so a list picker can show every list without opening any shard.
+
+The manifest is rewritten under its lock after re-reading it, so lists
+created by another process are kept; counts are written only when they
+changed. `Controller.open_list` does the loading, caching and evicting of
+shards.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .locking import FileLock, lock_path_for
+from .storage import DEFAULT_DIR, DEFAULT_PATH, TaskStore, atomic_write_text, open_store
+
+# How many lists (the open one included) a controller keeps in memory.
+LIST_CACHE = int(os.environ.get("TODO_LIST_TK_LIST_CACHE", "4"))
+LISTS_SCHEMA_VERSION = 1
+DEFAULT_LIST = "tasks"
+DEFAULT_LIST_NAME = "Tasks"
+
+_NOT_ID = re.compile(r"[^\w-]+")
+
+
+@dataclass
+class ListInfo:
+    id: str
+    name: str
+    total: int = 0
+    active: int = 0
+
+
+class ListManifest:
+    def __init__(
+        self,
+        directory: Path = DEFAULT_DIR,
+        default_path: Path = DEFAULT_PATH,
+        backend: Optional[str] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.path = self.directory / "lists.json"
+        self.default_path = Path(default_path)
+        self.backend = backend
+        self._lists, self._current = self._read()
+        self._recounted: Set[str] = set()  # lists whose counts changed since the last save
+        self._current_changed = False
+
+    def __iter__(self) -> Iterator[ListInfo]:
+        return iter(list(self._lists.values()))
+
+    def __len__(self) -> int:
+        return len(self._lists)
+
+    def __contains__(self, list_id: object) -> bool:
+        return list_id in self._lists
+
+    def __getitem__(self, list_id: str) -> ListInfo:
+        return self._lists[list_id]
+
+    @property
+    def current(self) -> str:
+        """The list to open on start-up: the one opened last."""
+        return self._current
+
+    @current.setter
+    def current(self, list_id: str) -> None:
+        if list_id not in self._lists:
+            raise KeyError(list_id)
+        if list_id != self._current:
+            self._current = list_id
+            self._current_changed = True
+
+    def find(self, key: str) -> ListInfo:
+        """The list with id or name `key` (names compared case-insensitively)."""
+        if key in self._lists:
+            return self._lists[key]
+        found = [info for info in self._lists.values() if info.name.casefold() == key.casefold()]
+        if len(found) != 1:
+            raise KeyError(key)
+        return found[0]
+
+    def path_for(self, list_id: str) -> Path:
+        """The JSON location of a list's store (other backends derive their files from it)."""
+        if list_id == DEFAULT_LIST:
+            return self.default_path
+        return self.directory / "lists" / f"{list_id}.json"
+
+    def open_store(self, list_id: str) -> TaskStore:
+        if list_id not in self._lists:
+            raise KeyError(list_id)
+        return open_store(self.path_for(list_id), self.backend)
+
+    # --- changes ---
+    def create(self, name: str) -> ListInfo:
+        name = _clean_name(name)
+        base = _NOT_ID.sub("-", name.casefold()).strip("-") or "list"
+
+        def add(lists: Dict[str, ListInfo]) -> ListInfo:
+            list_id, n = base, 1
+            while list_id in lists:
+                n += 1
+                list_id = f"{base}-{n}"
+            info = lists[list_id] = ListInfo(list_id, name)
+            return info
+
+        return self._update(add)
+
+    def rename(self, list_id: str, name: str) -> None:
+        name = _clean_name(name)
+
+        def rename(lists: Dict[str, ListInfo]) -> None:
+            lists[list_id].name = name
+
+        self._update(rename)
+
+    def remove(self, list_id: str) -> None:
+        """Drop a list and delete its files. The default list cannot be removed."""
+        if list_id == DEFAULT_LIST:
+            raise ValueError("the default list cannot be deleted")
+
+        def remove(lists: Dict[str, ListInfo]) -> None:
+            lists.pop(list_id, None)
+
+        self._update(remove)
+        # Ids contain no dots, so this matches exactly this list's files.
+        for p in (self.directory / "lists").glob(f"{list_id}.*"):
+            if p.is_dir():
+                shutil.rmtree(p, ignore_errors=True)
+            else:
+                p.unlink(missing_ok=True)
+
+    def set_counts(self, list_id: str, total: int, active: int) -> None:
+        info = self._lists.get(list_id)
+        if info is not None and (info.total, info.active) != (total, active):
+            info.total, info.active = total, active
+            self._recounted.add(list_id)
+
+    def save(self) -> None:
+        """Write changed counts and the current list; a no-op if nothing changed."""
+        if self._recounted or self._current_changed:
+            self._update(lambda lists: None)
+
+    # --- internals ---
+    def _update(self, change: Any) -> Any:
+        """Apply `change(lists)` to the manifest on disk (merged with ours) and write it."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with FileLock(lock_path_for(self.path)):
+            lists, current = self._read()
+            for list_id in self._recounted & lists.keys():
+                info = self._lists[list_id]
+                lists[list_id].total, lists[list_id].active = info.total, info.active
+            if self._current_changed:
+                current = self._current
+            result = change(lists)
+            data = {
+                "version": LISTS_SCHEMA_VERSION,
+                "current": current if current in lists else DEFAULT_LIST,
+                "lists": [asdict(info) for info in lists.values()],
+            }
+            atomic_write_text(self.path, json.dumps(data, ensure_ascii=False, indent=2))
+        self._lists, self._current = lists, data["current"]
+        self._recounted.clear()
+        self._current_changed = False
+        return result
+
+    def _read(self) -> Tuple[Dict[str, ListInfo], str]:
+        try:
+            data: Dict[str, Any] = json.loads(self.path.read_text("utf-8"))
+            entries: List[Dict[str, Any]] = data.get("lists", [])
+            lists = {e["id"]: ListInfo(**e) for e in entries}
+            current = data.get("current", DEFAULT_LIST)
+        except FileNotFoundError:
+            lists, current = {}, DEFAULT_LIST
+        except (OSError, ValueError, TypeError, KeyError) as ex:
+            raise ValueError(f"{self.path}: unreadable list manifest ({ex})") from ex
+        if DEFAULT_LIST not in lists:
+            lists = {DEFAULT_LIST: ListInfo(DEFAULT_LIST, DEFAULT_LIST_NAME), **lists}
+        return lists, current if current in lists else DEFAULT_LIST
+
+
+def _clean_name(name: str) -> str:
+    name = name.strip()
+    if not name:
+        raise ValueError("List name cannot be empty")
+    return name
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: listview.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Virtualized task list widget.
+
+Only the rows that fit in the canvas viewport (plus a small overscan) exist
+as widgets. They are kept in a pool, positioned with canvas window items
+and re-bound to different tasks as the user scrolls, so the cost of
+scrolling or updating does not depend on the total number of tasks.
+
+When `set_reorderable(True)` is on, each row shows a drag handle; dropping a
+row calls `on_move(task_id, before_id)` with the task it was dropped in
+front of (None for the end), and the list redraws from the model's new
+order.
+
+The owner patches the list as tasks change: `update_task` re-renders the one
+row showing a task edited in place, `rows_changed` follows insertions,
+removals and moves, and `set_items` switches to a different sequence.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from . import metrics
+from .model import Task
+from .recurrence import format_when
+
+ROW_HEIGHT = 34
+OVERSCAN = 4
+
+
+class _Row:
+    """A pooled row: frame + drag handle + checkbutton + menu button, bound to one task at a time."""
+
+    def __init__(self, view: "TaskListView") -> None:
+        self.task_id: Optional[str] = None
+        self.key: Optional[Tuple] = None
+        self.frame = ttk.Frame(view.canvas, padding=(4, 6, 4, 6), style="Task.TFrame")
+        self.handle = ttk.Label(self.frame, text="⠿", cursor="fleur")
+        self.handle.bind("<ButtonPress-1>", lambda e: view._drag_start(self), add="+")
+        self.handle.bind("<B1-Motion>", lambda e: view._drag_motion(e.y_root), add="+")
+        self.handle.bind("<ButtonRelease-1>", lambda e: view._drag_end(e.y_root), add="+")
+        self.var = tk.BooleanVar(value=False)
+        self.check = ttk.Checkbutton(
+            self.frame, variable=self.var, command=lambda: view._row_toggled(self)
+        )
+        self.check.pack(side="left", fill="x", expand=True)
+        self.menu_btn = ttk.Button(
+            self.frame, text="⋮", width=2, command=lambda: view._row_menu(self)
+        )
+        self.menu_btn.pack(side="right")
+        if view.reorderable:
+            self.handle.pack(side="left", padx=(0, 4), before=self.check)
+        self.item = view.canvas.create_window(
+            0, 0, window=self.frame, anchor="nw", state="hidden",
+            width=view._width, height=view.row_height,
+        )
+        for w in (self.frame, self.check, self.menu_btn):
+            view._bind_wheel(w)
+            w.bind("<Button-3>", lambda e: view._row_menu(self, e.x_root, e.y_root), add="+")
+        self.check.bind("<FocusIn>", lambda e: view._row_focused(self), add="+")
+        metrics.count("ui.rows_created")
+        metrics.count("ui.widgets_created", 4)
+
+    def show(self, t: Task) -> None:
+        key = (t.id, t.title, t.done, t.priority, t.due, t.repeat, t.repeat_done)
+        if key == self.key:
+            return
+        self.key = key
+        metrics.count("ui.rows_rebound")
+        self.task_id = t.id
+        self.check.configure(text=_row_text(t))
+        self.var.set(t.done)
+
+
+class TaskListView(ttk.Frame):
+    def __init__(
+        self,
+        master: tk.Misc,
+        on_toggle: Callable[[str], None],
+        on_menu: Callable[[str, int, int], None],
+        on_move: Optional[Callable[[str, Optional[str]], None]] = None,
+        row_height: int = ROW_HEIGHT,
+        overscan: int = OVERSCAN,
+    ) -> None:
+        super().__init__(master)
+        self.on_toggle = on_toggle
+        self.on_menu = on_menu
+        self.on_move = on_move
+        self.reorderable = False
+        self._drag_id: Optional[str] = None
+        self.row_height = row_height
+        self.overscan = overscan
+        self.selected_id: Optional[str] = None
+        self._items: Sequence[Task] = ()
+        self._rows: List[_Row] = []
+        self._width = 1
+        self._layout_pending = False
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, yscrollincrement=row_height)
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yview)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scroll.pack(side="right", fill="y")
+        self.canvas.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.canvas)
+        self._drop_line = self.canvas.create_line(0, 0, 0, 0, width=2, state="hidden")
+
+    # --- public API ---
+    def set_items(self, items: Sequence[Task]) -> None:
+        """Show `items` (any sequence supporting len() and indexing)."""
+        self._items = items
+        self.rows_changed()
+
+    def rows_changed(self) -> None:
+        """Rows were inserted into, removed from or moved within the items shown.
+
+        Resizes the scroll region and re-binds the rows on screen; a row still
+        showing the same task as before is left as it is.
+        """
+        total = len(self._items) * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, self._width, total))
+        max_top = max(0, total - self.canvas.winfo_height())
+        if self.canvas.canvasy(0) > max_top:
+            self.canvas.yview_moveto(max_top / total if total else 0)
+        self._layout()
+
+    def update_task(self, t: Task) -> None:
+        """Re-render the row currently showing `t`, if any."""
+        for row in self._rows:
+            if row.task_id == t.id:
+                row.show(t)
+                return
+
+    def focused_task_id(self) -> Optional[str]:
+        try:
+            focus = self.focus_get()
+        except KeyError:  # focus is on a widget tkinter does not know (e.g. a popup menu)
+            focus = None
+        for row in self._rows:
+            if row.task_id is not None and focus is row.check:
+                return row.task_id
+        return self.selected_id
+
+    def select(self, task_id: str) -> None:
+        self.selected_id = task_id
+        for row in self._rows:
+            if row.task_id == task_id and self.canvas.itemcget(row.item, "state") != "hidden":
+                row.check.focus_set()
+                return
+
+    def set_reorderable(self, on: bool) -> None:
+        """Show or hide the rows' drag handles."""
+        on = on and self.on_move is not None
+        if on == self.reorderable:
+            return
+        self.reorderable = on
+        for row in self._rows:
+            if on:
+                row.handle.pack(side="left", padx=(0, 4), before=row.check)
+            else:
+                row.handle.pack_forget()
+
+    # --- layout ---
+    @metrics.timed("ui.layout")
+    def _layout(self) -> None:
+        self._layout_pending = False
+        rh = self.row_height
+        height = max(self.canvas.winfo_height(), rh)
+        top = int(self.canvas.canvasy(0))
+        first = max(0, top // rh - self.overscan)
+        needed = height // rh + 1 + 2 * self.overscan
+        while len(self._rows) < needed:
+            self._rows.append(_Row(self))
+
+        n = len(self._items)
+        for k, row in enumerate(self._rows):
+            idx = first + k
+            if k < needed and idx < n:
+                row.show(self._items[idx])
+                self.canvas.coords(row.item, 0, idx * rh)
+                self.canvas.itemconfigure(row.item, state="normal")
+            elif self.canvas.itemcget(row.item, "state") != "hidden":
+                self.canvas.itemconfigure(row.item, state="hidden")
+                row.task_id = row.key = None
+
+    def _schedule_layout(self) -> None:
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.after_idle(self._layout)
+
+    def _on_yview(self, first: str, last: str) -> None:
+        self.scroll.set(first, last)
+        self._schedule_layout()
+
+    def _on_resize(self, event: tk.Event) -> None:
+        self._width = event.width
+        for row in self._rows:
+            self.canvas.itemconfigure(row.item, width=event.width, height=self.row_height)
+        self.canvas.configure(scrollregion=(0, 0, event.width, len(self._items) * self.row_height))
+        self._schedule_layout()
+
+    # --- row callbacks ---
+    def _row_toggled(self, row: _Row) -> None:
+        if row.task_id is not None:
+            self.selected_id = row.task_id
+            self.on_toggle(row.task_id)
+
+    def _row_focused(self, row: _Row) -> None:
+        if row.task_id is not None:
+            self.selected_id = row.task_id
+
+    def _row_menu(self, row: _Row, x: Optional[int] = None, y: Optional[int] = None) -> None:
+        if row.task_id is None:
+            return
+        self.selected_id = row.task_id
+        if x is None or y is None:
+            x = row.menu_btn.winfo_rootx()
+            y = row.menu_btn.winfo_rooty() + row.menu_btn.winfo_height()
+        self.on_menu(row.task_id, x, y)
+
+    # --- drag to reorder ---
+    def _drag_start(self, row: _Row) -> None:
+        if self.reorderable and row.task_id is not None:
+            self._drag_id = self.selected_id = row.task_id
+
+    def _drag_motion(self, y_root: int) -> None:
+        if self._drag_id is None:
+            return
+        local = y_root - self.canvas.winfo_rooty()
+        if local < self.row_height // 2:
+            self._scroll_units(-1)
+        elif local > self.canvas.winfo_height() - self.row_height // 2:
+            self._scroll_units(1)
+        y = self._drop_index(y_root) * self.row_height
+        self.canvas.coords(self._drop_line, 0, y, self._width, y)
+        self.canvas.itemconfigure(self._drop_line, state="normal")
+        self.canvas.tag_raise(self._drop_line)
+
+    def _drag_end(self, y_root: int) -> None:
+        task_id, self._drag_id = self._drag_id, None
+        self.canvas.itemconfigure(self._drop_line, state="hidden")
+        if task_id is None or self.on_move is None:
+            return
+        idx = self._drop_index(y_root)
+        before_id = self._items[idx].id if idx < len(self._items) else None
+        if before_id != task_id and not (idx and self._items[idx - 1].id == task_id):
+            self.on_move(task_id, before_id)
+
+    def _drop_index(self, y_root: int) -> int:
+        """Position a row dropped at screen height `y_root` would take (the gap nearest to it)."""
+        y = self.canvas.canvasy(y_root - self.canvas.winfo_rooty())
+        return max(0, min(len(self._items), int(y + self.row_height / 2) // self.row_height))
+
+    # --- scrolling ---
+    def _bind_wheel(self, widget: tk.Misc) -> None:
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", lambda e: self._scroll_units(-1), add="+")
+        widget.bind("<Button-5>", lambda e: self._scroll_units(1), add="+")
+
+    def _on_wheel(self, event: tk.Event) -> None:
+        delta = event.delta if abs(event.delta) < 120 else event.delta // 120
+        self._scroll_units(-delta)
+
+    def _scroll_units(self, units: int) -> None:
+        self.canvas.yview_scroll(units, "units")
+
+
+def _row_text(t: Task) -> str:
+    if t.repeat and not t.done:
+        # Checking a recurring task completes this occurrence; the row then shows the next.
+        at = t.due_at()
+        return f"{t.title}   · ↻ next {format_when(at)}" if at else t.title
+    return f"{t.title}   · due {t.due}" if t.due else t.title
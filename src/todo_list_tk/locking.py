@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: locking.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Cross-process advisory file lock.
+
+Uses `flock` on POSIX and `msvcrt.locking` on Windows, on a dedicated
+`<file>.lock` next to the data file (the data file itself is replaced on
+every save, so it cannot carry the lock). Only processes that take the lock
+are coordinated; it is advisory.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import IO, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+LOCK_TIMEOUT = float(os.environ.get("TODO_LIST_TK_LOCK_TIMEOUT", "10"))
+_POLL = 0.005
+
+
+def lock_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".lock")
+
+
+class FileLock:
+    """Exclusive lock on `path`; raises `TimeoutError` after `timeout` seconds (None waits forever).
+
+    Also serializes threads of this process, which `flock` alone would not.
+    """
+
+    def __init__(self, path: Path, timeout: Optional[float] = LOCK_TIMEOUT) -> None:
+        self.path = Path(path)
+        self.timeout = timeout
+        self._thread_lock = threading.Lock()
+        self._fh: Optional[IO[bytes]] = None
+
+    def acquire(self) -> None:
+        if not self._thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise TimeoutError(f"timed out waiting for {self.path}")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fh = open(self.path, "a+b")
+            try:
+                self._lock(fh)
+            except BaseException:
+                fh.close()
+                raise
+            self._fh = fh
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+                else:
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                fh.close()
+                self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+    def _lock(self, fh: IO[bytes]) -> None:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        if fcntl is not None and deadline is None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            return
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"timed out waiting for {self.path}") from None
+                time.sleep(_POLL)
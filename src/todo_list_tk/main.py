@@ -6,7 +6,7 @@ Project: To-Do List (Tkinter)
 File: main.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-10-25
-Updated: 2025-10-25
+Updated: 2026-10-18
 License: MIT License (see LICENSE file for details)
 ===========================================================================
 
@@ -14,23 +14,71 @@ Description:
 Application entry‑point & __main__ module.
 
 Usage:
-python -m todo_list_tk
+python -m todo_list_tk [--profile-startup]
 # or
-todo-list-tk
+todo-list-tk [--profile-startup]
 
 ===========================================================================
 """
 from __future__ import annotations
 
-import tkinter as tk
+import argparse
+import sys
+import time
+from typing import IO, List, Optional, Sequence, Tuple
 
-from .ui import App
 
+class StartupProfile:
+    """Wall-clock time spent in each startup phase, from `main()` onwards."""
 
-def main() -> None:
+    def __init__(self) -> None:
+        self.start = self.last = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self, stream: IO[str]) -> None:
+        width = max(len(name) for name, _ in self.phases)
+        print("startup profile (ms):", file=stream)
+        for name, seconds in self.phases:
+            print(f"  {name:<{width}}  {seconds * 1e3:8.1f}", file=stream)
+        print(f"  {'total':<{width}}  {(self.last - self.start) * 1e3:8.1f}", file=stream)
+        print("  (per-module import times: python -X importtime -m todo_list_tk)", file=stream)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="todo-list-tk", description="To-Do List (Tkinter)")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print how long imports and each init phase took once tasks are loaded",
+    )
+    args = parser.parse_args(argv)
+    profile = StartupProfile() if args.profile_startup else None
+
+    def mark(phase: str) -> None:
+        if profile is not None:
+            profile.mark(phase)
+            if phase == "tasks loaded":
+                profile.report(sys.stderr)
+
+    # Imported here rather than at module level so the profile can time them.
+    import tkinter as tk
+
+    mark("import tkinter")
+    from .ui import App
+
+    mark("import ui")
     root = tk.Tk()
-    App(root)
-    root.mainloop()
+    mark("Tk()")
+    app = App(root, on_phase=mark)
+    try:
+        root.mainloop()
+    finally:
+        app.controller.close()
 
 
 if __name__ == "__main__":
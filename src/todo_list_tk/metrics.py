@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: metrics.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Opt-in instrumentation: latency histograms and counters for hot paths.
+
+Enable with `TODO_LIST_TK_METRICS=1` (or set it to a file path, which the
+app dumps the metrics to on exit). When disabled, every hook reduces to a
+single flag check, so instrumented code pays next to nothing.
+
+Histograms bucket durations by powers of two in microseconds, so recording
+is O(1) and memory stays constant; percentiles are reported as the upper
+edge of the bucket they fall in.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_ENV = os.environ.get("TODO_LIST_TK_METRICS", "").strip()
+_TRUTHY = {"1", "true", "yes", "on"}
+
+enabled = bool(_ENV) and _ENV.lower() not in {"0", "false", "no", "off"}
+# Where the app dumps metrics on exit, if the env var names a file.
+DUMP_PATH: Optional[Path] = Path(_ENV).expanduser() if enabled and _ENV.lower() not in _TRUTHY else None
+
+
+class Histogram:
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        # bucket b holds durations in [2**(b-1), 2**b) microseconds
+        self.buckets: Dict[int, int] = {}
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        b = int(seconds * 1e6).bit_length()
+        self.buckets[b] = self.buckets.get(b, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the `q`-th quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for b in sorted(self.buckets):
+            seen += self.buckets[b]
+            if seen >= rank:
+                return min((1 << b) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        ms = 1e3
+        return {
+            "count": self.count,
+            "total_ms": self.total * ms,
+            "mean_ms": self.total / self.count * ms if self.count else 0.0,
+            "min_ms": self.min * ms if self.count else 0.0,
+            "p50_ms": self.percentile(0.5) * ms,
+            "p90_ms": self.percentile(0.9) * ms,
+            "p99_ms": self.percentile(0.99) * ms,
+            "max_ms": self.max * ms,
+        }
+
+
+_lock = threading.Lock()  # the background writer records too
+_histograms: Dict[str, Histogram] = {}
+_counters: Dict[str, int] = {}
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def observe(name: str, seconds: float) -> None:
+    if not enabled:
+        return
+    with _lock:
+        h = _histograms.get(name)
+        if h is None:
+            h = _histograms[name] = Histogram()
+        h.observe(seconds)
+
+
+def count(name: str, n: int = 1) -> None:
+    if not enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator recording each call's duration under `name`."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def snapshot() -> Dict[str, Any]:
+    with _lock:
+        return {
+            "enabled": enabled,
+            "histograms": {k: h.to_dict() for k, h in sorted(_histograms.items())},
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+def dump(path: Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(snapshot(), indent=2), "utf-8")
+
+
+def format_report(snap: Optional[Dict[str, Any]] = None) -> str:
+    """Plain-text table of a `snapshot()`, as shown in the Diagnostics window."""
+    snap = snap or snapshot()
+    lines = [
+        f"{'timer':<32} {'count':>7} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    ]
+    for name, h in snap["histograms"].items():
+        lines.append(
+            f"{name:<32} {h['count']:>7} {h['mean_ms']:>9.3f} {h['p50_ms']:>9.3f} "
+            f"{h['p99_ms']:>9.3f} {h['max_ms']:>9.3f}"
+        )
+    lines.append("")
+    lines.append(f"{'counter':<32} {'value':>12}")
+    for name, value in snap["counters"].items():
+        lines.append(f"{name:<32} {value:>12}")
+    return "\n".join(lines)
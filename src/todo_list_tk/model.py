@@ -6,7 +6,7 @@ Project: To-Do List (Tkinter)
 File: model.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-10-25
-Updated: 2025-10-25
+Updated: 2026-10-18
 License: MIT License (see LICENSE file for details)
 ===========================================================================
 
@@ -18,10 +18,13 @@ Domain model entities for the To‑Do List app.
 from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
+from .recurrence import Completions, next_open, parse_rule
+from .utils import due_datetime
+
 
 class Priority(str, Enum):
     LOW = "low"
@@ -38,8 +41,16 @@ class Task:
     updated_at: str = field(default_factory=lambda: datetime.utcnow().isoformat(timespec="seconds"))
     priority: Priority = Priority.MEDIUM
     due: Optional[str] = None  # ISO date string
+    rank: Optional[str] = None  # position in the manual sort order (see ranks.py)
+    repeat: Optional[str] = None  # RRULE; `due` is the first occurrence (see recurrence.py)
+    repeat_done: Optional[str] = None  # completed occurrences, as `recurrence.Completions`
 
     def toggle(self) -> "Task":
+        """Flip `done`; for a recurring task, complete its next open occurrence instead."""
+        if self.repeat and not self.done:
+            occurrence = next_open(self)
+            if occurrence is not None:
+                return self.complete_occurrence(occurrence.index)
         return replace(self, done=not self.done, updated_at=datetime.utcnow().isoformat(timespec="seconds"))
 
     def rename(self, new_title: str) -> "Task":
@@ -48,5 +59,64 @@ class Task:
             raise ValueError("Title cannot be empty")
         return replace(self, title=new_title, updated_at=datetime.utcnow().isoformat(timespec="seconds"))
 
+    def set_due(self, due: Optional[str]) -> "Task":
+        """`due` is an ISO date or date-time (naive local time); empty or None clears it."""
+        due = (due or "").strip() or None
+        if due is not None and due_datetime(due) is None:
+            raise ValueError(f"Invalid due date: {due!r} (use YYYY-MM-DD or YYYY-MM-DDTHH:MM)")
+        if due is None and self.repeat:
+            raise ValueError("A repeating task needs a due date (its first occurrence)")
+        # Occurrence numbers count from the first one, so a new start begins a new series.
+        repeat_done = self.repeat_done if due == self.due else None
+        return replace(
+            self,
+            due=due,
+            repeat_done=repeat_done,
+            updated_at=datetime.utcnow().isoformat(timespec="seconds"),
+        )
+
+    def set_repeat(self, rule: Optional[str]) -> "Task":
+        """Make the task recur by `rule` from its due date (today if none); empty stops it."""
+        rule = (rule or "").strip() or None
+        if rule is None:
+            now = datetime.utcnow().isoformat(timespec="seconds")
+            return replace(self, repeat=None, repeat_done=None, updated_at=now)
+        rule = str(parse_rule(rule))
+        return replace(
+            self,
+            repeat=rule,
+            repeat_done=self.repeat_done if rule == self.repeat else None,
+            due=self.due or date.today().isoformat(),
+            done=False,
+            updated_at=datetime.utcnow().isoformat(timespec="seconds"),
+        )
+
+    def complete_occurrence(self, index: int, done: bool = True) -> "Task":
+        """Mark occurrence `index` done (or not); completing the last one finishes the task."""
+        completions = Completions.parse(self.repeat_done)
+        completions = completions.add(index) if done else completions.discard(index)
+        t = replace(
+            self,
+            repeat_done=str(completions) if completions else None,
+            done=False,
+            updated_at=datetime.utcnow().isoformat(timespec="seconds"),
+        )
+        return replace(t, done=next_open(t) is None)
+
+    def due_at(self) -> Optional[datetime]:
+        """When the task is due: its due date, or for a recurring task its next open occurrence."""
+        if not self.due:
+            return None
+        if self.repeat:
+            occurrence = next_open(replace(self, done=False) if self.done else self)
+            return occurrence.at if occurrence is not None else None
+        return due_datetime(self.due)
+
+    def set_rank(self, rank: Optional[str]) -> "Task":
+        return replace(self, rank=rank, updated_at=datetime.utcnow().isoformat(timespec="seconds"))
+
+    def touch(self) -> "Task":
+        return replace(self, updated_at=datetime.utcnow().isoformat(timespec="seconds"))
+
     def set_priority(self, p: Priority) -> "Task":
         return replace(self, priority=p, updated_at=datetime.utcnow().isoformat(timespec="seconds"))
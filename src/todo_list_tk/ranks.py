@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: ranks.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Fractional rank keys for the manual ("drag to reorder") sort order.
+
+A rank is a base-36 fraction written as its digits after the point
+("i" is 0.5, "9" a bit more than 0.25), so plain string comparison orders
+ranks and there is always another rank between any two. Moving a task
+therefore only rewrites that task. Ranks never end in "0", so each value
+has exactly one spelling.
+
+A task never placed by hand has no stored rank; it sorts by `created_rank`,
+its creation second written as a fixed-width rank ("00hx3k2l"), so tasks
+can be placed between such tasks without giving them ranks first.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_BASE = len(DIGITS)
+_VALUE = {d: i for i, d in enumerate(DIGITS)}
+_TIME_DIGITS = 8
+_EPOCH = datetime(1970, 1, 1)
+
+
+def rank_between(lo: Optional[str], hi: Optional[str]) -> str:
+    """A rank strictly between `lo` and `hi`; None stands for the start / end."""
+    lo = lo or ""
+    if hi is not None and not lo < hi:
+        raise ValueError(f"no rank between {lo!r} and {hi!r}")
+    out: List[str] = []
+    i = 0
+    while True:
+        a = _VALUE[lo[i]] if i < len(lo) else 0
+        b = (_VALUE[hi[i]] if i < len(hi) else 0) if hi is not None else _BASE
+        if a == b:
+            out.append(DIGITS[a])
+        else:
+            mid = (a + b) // 2
+            if mid > a:
+                out.append(DIGITS[mid])
+                return "".join(out)
+            # Adjacent digits: keep lo's, and anything above the rest of lo will do.
+            out.append(DIGITS[a])
+            hi = None
+        i += 1
+
+
+def ranks_between(lo: Optional[str], hi: Optional[str], n: int) -> List[str]:
+    """`n` increasing ranks between `lo` and `hi`, spread out so they stay short."""
+    if n <= 0:
+        return []
+    mid = rank_between(lo, hi)
+    left = (n - 1) // 2
+    return ranks_between(lo, mid, left) + [mid] + ranks_between(mid, hi, n - 1 - left)
+
+
+def time_rank(seconds: int) -> str:
+    """The rank standing for `seconds` since the epoch (clamped at 0)."""
+    n, digits = max(0, seconds), []
+    for _ in range(_TIME_DIGITS):
+        n, d = divmod(n, _BASE)
+        digits.append(DIGITS[d])
+    return "".join(reversed(digits)).rstrip("0")
+
+
+def created_seconds(created_at: str) -> Optional[int]:
+    """Epoch seconds of an ISO `created_at` (naive means UTC), or None if unreadable."""
+    try:
+        dt = datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return int((dt - _EPOCH).total_seconds())
+
+
+@lru_cache(maxsize=4096)
+def created_rank(created_at: str) -> str:
+    """The implicit rank of a task never placed by hand ("" if `created_at` is unreadable)."""
+    seconds = created_seconds(created_at)
+    return time_rank(seconds) if seconds is not None else ""
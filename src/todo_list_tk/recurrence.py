@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: recurrence.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Recurring tasks: rules, lazily generated occurrences and completions.
+
+A recurring task is one row: `Task.repeat` holds its rule and `Task.due`
+its first occurrence. The rule is a subset of iCalendar RRULE
+(`FREQ=DAILY|WEEKLY|MONTHLY|YEARLY`, `INTERVAL`, `BYDAY` for weekly rules,
+`COUNT`, `UNTIL`); shorthands such as "weekdays" or "every 2 weeks" are
+accepted on input. Monthly and yearly dates that do not exist (the 31st,
+29 February) fall on the last day of the month instead.
+
+Occurrences are never stored. They are numbered from 0, and a rule maps an
+occurrence number to its date-time in constant time (and a date-time to the
+first occurrence at or after it), so `occurrences()` can start anywhere in
+a window without walking the series from its start. Completed occurrences
+are kept in `Task.repeat_done` as `Completions`: a watermark below which
+every occurrence is done, plus the few completed out of order, e.g. "12" or
+"12;14,15".
+
+`RecurrenceIndex` tracks the open recurring tasks for the controller, and
+`upcoming()` merges their per-task generators with `heapq.merge`, so the
+next N occurrences across thousands of rules cost O(rules + N log rules).
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import calendar
+import heapq
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple,
+)
+
+from .utils import due_datetime
+
+if TYPE_CHECKING:
+    from .model import Task
+
+FREQS = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+_UNITS = {"day": "DAILY", "week": "WEEKLY", "month": "MONTHLY", "year": "YEARLY"}
+_SHORTHAND = {
+    "daily": "DAILY", "weekly": "WEEKLY", "monthly": "MONTHLY",
+    "yearly": "YEARLY", "annually": "YEARLY",
+}
+_EVERY = re.compile(r"every\s+(?:(\d+)\s+)?(day|week|month|year)s?")
+_END_OF_DAY = time(23, 59, 59)
+# Average period lengths in days, only used to estimate where to start looking.
+_PERIOD_DAYS = {"DAILY": 1.0, "WEEKLY": 7.0, "MONTHLY": 30.436875, "YEARLY": 365.2425}
+
+
+class Occurrence(NamedTuple):
+    at: datetime
+    task_id: str
+    index: int
+
+
+@dataclass(frozen=True)
+class Rule:
+    freq: str
+    interval: int = 1
+    weekdays: Tuple[int, ...] = ()  # Monday is 0; weekly rules only
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.weekdays:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[d] for d in self.weekdays))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            whole_day = self.until.time() == _END_OF_DAY
+            until = self.until.date().isoformat() if whole_day else self.until.isoformat()
+            parts.append("UNTIL=" + until)
+        return ";".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def parse_rule(text: str) -> Rule:
+    """Rule from RRULE-style text or a shorthand; raises ValueError if it is neither."""
+    text = text.strip()
+    if "=" not in text:
+        return _parse_shorthand(text)
+    fields: Dict[str, str] = {}
+    for part in text.upper().split(";"):
+        name, sep, value = part.partition("=")
+        if not sep or not value:
+            raise ValueError(f"Invalid repeat rule: {text!r}")
+        fields[name.strip()] = value.strip()
+    try:
+        freq = fields.pop("FREQ")
+        interval = int(fields.pop("INTERVAL", "1"))
+        days = fields.pop("BYDAY").split(",") if "BYDAY" in fields else []
+        weekdays = tuple(sorted({WEEKDAYS.index(d.strip()) for d in days}))
+        count = int(fields.pop("COUNT")) if "COUNT" in fields else None
+        until = _parse_until(fields.pop("UNTIL")) if "UNTIL" in fields else None
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid repeat rule: {text!r}") from None
+    if fields or freq not in FREQS or interval < 1 or (count is not None and count < 1):
+        raise ValueError(f"Invalid repeat rule: {text!r}")
+    if weekdays and freq != "WEEKLY":
+        raise ValueError(f"BYDAY is only supported for weekly rules: {text!r}")
+    return Rule(freq, interval, weekdays, count, until)
+
+
+def _parse_shorthand(text: str) -> Rule:
+    words = text.casefold()
+    if words in _SHORTHAND:
+        return Rule(_SHORTHAND[words])
+    if words in ("weekdays", "every weekday"):
+        return Rule("WEEKLY", weekdays=(0, 1, 2, 3, 4))
+    m = _EVERY.fullmatch(words)
+    if m is None or (m.group(1) is not None and int(m.group(1)) < 1):
+        raise ValueError(
+            f"Invalid repeat rule: {text!r} (try daily, weekly, weekdays, monthly, yearly, "
+            "every 2 weeks or FREQ=...)"
+        )
+    return Rule(_UNITS[m.group(2)], int(m.group(1) or 1))
+
+
+def _parse_until(value: str) -> datetime:
+    # A plain date includes that whole day, like a due date.
+    dt = due_datetime(value.strip())
+    if dt is None:
+        raise ValueError(value)
+    return dt
+
+
+class Series:
+    """The occurrences of `rule` starting at `start`, addressable by number."""
+
+    def __init__(self, rule: Rule, start: datetime) -> None:
+        self.rule = rule
+        self.start = start
+        self._per_period = len(rule.weekdays) or 1
+        # Weekly rules with days: the anchor week's days before the anchor do not occur.
+        self._skip = sum(1 for d in rule.weekdays if d < start.weekday())
+        self._week0 = start.date() - timedelta(days=start.weekday())
+        self._end = self._find_end()
+
+    @property
+    def end(self) -> Optional[int]:
+        """Number of occurrences, or None if the series never ends."""
+        return self._end
+
+    def at(self, index: int) -> Optional[datetime]:
+        """Date-time of occurrence `index`, or None if the series has ended by then."""
+        if index < 0 or (self._end is not None and index >= self._end):
+            return None
+        return self._at(index)
+
+    def index_from(self, when: datetime) -> int:
+        """Number of the first occurrence at or after `when` (may be past the end)."""
+        if when <= self.start:
+            return 0
+        rule = self.rule
+        periods = int((when - self.start).days / (_PERIOD_DAYS[rule.freq] * rule.interval))
+        i = max(0, periods * self._per_period - self._skip - 1)
+        while i > 0 and self._at(i - 1) >= when:
+            i -= 1
+        while self._at(i) < when:
+            i += 1
+        return i
+
+    def iter_from(self, index: int) -> Iterator[Tuple[int, datetime]]:
+        """`(index, date-time)` from occurrence `index` on, lazily, until the series ends."""
+        while self._end is None or index < self._end:
+            yield index, self._at(index)
+            index += 1
+
+    def _at(self, index: int) -> datetime:
+        rule, start = self.rule, self.start
+        period, slot = divmod(index + self._skip, self._per_period)
+        if rule.freq == "DAILY":
+            return start + timedelta(days=period * rule.interval)
+        if rule.freq == "WEEKLY":
+            if not rule.weekdays:
+                return start + timedelta(weeks=period * rule.interval)
+            day = self._week0 + timedelta(weeks=period * rule.interval, days=rule.weekdays[slot])
+            return datetime.combine(day, start.time())
+        months = period * rule.interval * (12 if rule.freq == "YEARLY" else 1)
+        year, month = divmod(start.month - 1 + months, 12)
+        year += start.year
+        if year > date.max.year:
+            return datetime.max
+        day = min(start.day, calendar.monthrange(year, month + 1)[1])
+        return start.replace(year=year, month=month + 1, day=day)
+
+    def _find_end(self) -> Optional[int]:
+        end = self.rule.count
+        if self.rule.until is not None:
+            past_until = self.index_from(self.rule.until + timedelta(seconds=1))
+            end = past_until if end is None else min(end, past_until)
+        return end
+
+
+@lru_cache(maxsize=4096)
+def series(rule: str, due: str) -> Optional[Series]:
+    """The series of a task's `repeat` and `due` (None if either is invalid)."""
+    start = due_datetime(due)
+    if start is None:
+        return None
+    try:
+        return Series(parse_rule(rule), start)
+    except (ValueError, OverflowError):
+        return None
+
+
+@dataclass(frozen=True)
+class Completions:
+    through: int = 0  # every occurrence before this one is done
+    extra: FrozenSet[int] = frozenset()  # done ones after it, completed out of order
+
+    @classmethod
+    def parse(cls, text: Optional[str]) -> "Completions":
+        if not text:
+            return cls()
+        head, _, tail = text.partition(";")
+        return cls(int(head), frozenset(int(i) for i in tail.split(",")) if tail else frozenset())
+
+    def __str__(self) -> str:
+        if not self.extra:
+            return str(self.through)
+        return f"{self.through};" + ",".join(map(str, sorted(self.extra)))
+
+    def __contains__(self, index: object) -> bool:
+        return isinstance(index, int) and (index < self.through or index in self.extra)
+
+    def add(self, index: int) -> "Completions":
+        if index in self:
+            return self
+        through, extra = self.through, set(self.extra)
+        extra.add(index)
+        while through in extra:
+            extra.remove(through)
+            through += 1
+        return Completions(through, frozenset(extra))
+
+    def discard(self, index: int) -> "Completions":
+        if index not in self:
+            return self
+        if index in self.extra:
+            return Completions(self.through, self.extra - {index})
+        return Completions(index, self.extra | frozenset(range(index + 1, self.through)))
+
+    def __bool__(self) -> bool:
+        return bool(self.through or self.extra)
+
+    def first_open(self, index: int = 0) -> int:
+        index = max(index, self.through)
+        while index in self.extra:
+            index += 1
+        return index
+
+
+def format_when(at: datetime) -> str:
+    """An occurrence for display: just the date when it falls due at the end of a day."""
+    return at.date().isoformat() if at.time() == _END_OF_DAY else at.isoformat(" ", "minutes")
+
+
+def task_series(t: "Task") -> Optional[Series]:
+    return series(t.repeat, t.due) if t.repeat and t.due else None
+
+
+def next_open(t: "Task") -> Optional[Occurrence]:
+    """The task's first occurrence not yet completed, or None if there is none left."""
+    s = task_series(t)
+    if s is None or t.done:
+        return None
+    index = Completions.parse(t.repeat_done).first_open()
+    at = s.at(index)
+    return Occurrence(at, t.id, index) if at is not None else None
+
+
+def occurrences(
+    t: "Task",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    *,
+    include_done: bool = False,
+) -> Iterator[Occurrence]:
+    """The task's occurrences from `start` (default: its first) up to `end`, lazily and in order.
+
+    Completed occurrences are skipped unless `include_done`; a task marked
+    done has no open occurrences left.
+    """
+    s = task_series(t)
+    if s is None or (t.done and not include_done):
+        return
+    done = Completions.parse(t.repeat_done)
+    first = s.index_from(start) if start is not None else 0
+    for index, at in s.iter_from(first if include_done else done.first_open(first)):
+        if end is not None and at >= end:
+            return
+        if include_done or index not in done:
+            yield Occurrence(at, t.id, index)
+
+
+def merge_occurrences(
+    tasks: Iterable["Task"], start: Optional[datetime] = None, end: Optional[datetime] = None
+) -> Iterator[Occurrence]:
+    """Open occurrences of all `tasks` in `[start, end)`, in date order, merged lazily."""
+    return heapq.merge(*(occurrences(t, start, end) for t in tasks))
+
+
+class RecurrenceIndex:
+    """Open recurring tasks, kept current through `update(before, after)`."""
+
+    def __init__(self, tasks: Iterable["Task"] = ()) -> None:
+        self._tasks: Dict[str, "Task"] = {t.id: t for t in tasks if _is_open_series(t)}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def update(self, before: Optional["Task"], after: Optional["Task"]) -> None:
+        if before is not None:
+            self._tasks.pop(before.id, None)
+        if after is not None and _is_open_series(after):
+            self._tasks[after.id] = after
+
+    def upcoming(self, n: int, start: Optional[datetime] = None) -> List[Occurrence]:
+        """The next `n` open occurrences from `start` (default: now) across every rule."""
+        return list(islice(merge_occurrences(self._tasks.values(), start or datetime.now()), n))
+
+    def between(self, start: datetime, end: datetime) -> Iterator[Occurrence]:
+        return merge_occurrences(self._tasks.values(), start, end)
+
+
+def _is_open_series(t: "Task") -> bool:
+    return not t.done and task_series(t) is not None
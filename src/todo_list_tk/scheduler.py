@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: scheduler.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Upcoming deadlines of active tasks, for due-date reminders.
+
+`DueScheduler` is a controller index: it receives every
+`update(before, after)` and keeps a min-heap of `(deadline, task id)` for
+deadlines that have not passed yet, so a change costs O(log N) and the next
+deadline is always at the top. Entries for tasks that changed or went away
+are left in the heap and skipped when they surface (the heap is rebuilt
+once they outnumber the live ones).
+
+A deadline is only scheduled while it lies in the future, so each one is
+reported once by `pop_due`; tasks already past due are the "overdue"
+filter's business, not the reminder's.
+
+A recurring task's deadline is its next open occurrence, so completing one
+schedules the next.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import heapq
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .model import Task
+
+
+class DueScheduler:
+    def __init__(self, tasks: Iterable[Task] = (), now: Optional[datetime] = None) -> None:
+        now = now or datetime.now()
+        self._pending: Dict[str, datetime] = {}
+        for t in tasks:
+            deadline = _deadline(t)
+            if deadline is not None and deadline > now:
+                self._pending[t.id] = deadline
+        self._heap: List[Tuple[datetime, str]] = [(d, i) for i, d in self._pending.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def update(self, before: Optional[Task], after: Optional[Task]) -> None:
+        old = self._pending.pop(before.id, None) if before is not None else None
+        deadline = _deadline(after) if after is not None else None
+        if deadline is None:
+            return
+        if deadline == old:
+            self._pending[after.id] = deadline  # type: ignore[union-attr]  # still in the heap
+        elif deadline > datetime.now():
+            self._pending[after.id] = deadline  # type: ignore[union-attr]
+            heapq.heappush(self._heap, (deadline, after.id))  # type: ignore[union-attr]
+            if len(self._heap) > 2 * len(self._pending) + 64:
+                self._heap = [(d, i) for i, d in self._pending.items()]
+                heapq.heapify(self._heap)
+
+    def next_deadline(self) -> Optional[datetime]:
+        """The earliest deadline not yet reported, or None."""
+        heap = self._heap
+        while heap and self._pending.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[str]:
+        """Ids of tasks whose deadline has come by `now`, earliest first; each is reported once."""
+        now = now or datetime.now()
+        heap, pending = self._heap, self._pending
+        due = []
+        while heap and heap[0][0] <= now:
+            deadline, task_id = heapq.heappop(heap)
+            if pending.get(task_id) == deadline:
+                del pending[task_id]
+                due.append(task_id)
+        return due
+
+
+def _deadline(t: Task) -> Optional[datetime]:
+    if t.done or not t.due:
+        return None
+    return t.due_at()
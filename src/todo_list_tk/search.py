@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: search.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Incremental inverted index over task titles.
+
+Titles are split into lower-case word tokens. Each token maps to the set of
+task ids containing it, and a sorted token list answers prefix lookups with
+two bisects, so "gro" finds "groceries" while the user is still typing.
+A result must match every query term; results are ranked by exact-vs-prefix
+term matches, then by how early the match starts in the title.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .model import Task
+from .sortedlist import SortedList
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class SearchIndex:
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._tokens = SortedList()
+        self._titles: Dict[str, str] = {}
+        for t in tasks:
+            self.add(t)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    # --- maintenance ---
+    def add(self, t: Task) -> None:
+        self._titles[t.id] = t.title.casefold()
+        for token in set(tokenize(t.title)):
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                self._tokens.add(token)
+            ids.add(t.id)
+
+    def remove(self, t: Task) -> None:
+        self._titles.pop(t.id, None)
+        for token in set(tokenize(t.title)):
+            ids = self._postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(t.id)
+            if not ids:
+                del self._postings[token]
+                self._tokens.remove(token)
+
+    def update(self, before: Optional[Task], after: Optional[Task]) -> None:
+        if before is not None and after is not None and before.title == after.title:
+            return
+        if before is not None:
+            self.remove(before)
+        if after is not None:
+            self.add(after)
+
+    # --- queries ---
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Ids of tasks matching every term of `query`, best first."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        # term -> {task_id: 2 for an exact token match, 1 for a prefix match}
+        matches: List[Dict[str, int]] = []
+        for term in sorted(set(terms), key=len, reverse=True):
+            hits: Dict[str, int] = {}
+            for token in self._prefixed(term):
+                weight = 2 if token == term else 1
+                for task_id in self._postings[token]:
+                    if hits.get(task_id, 0) < weight:
+                        hits[task_id] = weight
+            if not hits:
+                return []
+            matches.append(hits)
+        matches.sort(key=len)
+        candidates = set(matches[0]).intersection(*matches[1:])
+        phrase = query.strip().casefold()
+
+        def rank(task_id: str) -> Tuple[int, int, int]:
+            title = self._titles[task_id]
+            pos = title.find(phrase)
+            return (
+                sum(m[task_id] for m in matches),
+                -(pos if pos >= 0 else len(title)),
+                -len(title),
+            )
+
+        if limit is None:
+            return sorted(candidates, key=rank, reverse=True)
+        return heapq.nlargest(limit, candidates, key=rank)
+
+    def _prefixed(self, prefix: str) -> Iterable[str]:
+        start = self._tokens.bisect_left(prefix)
+        end = self._tokens.bisect_left(prefix + "\U0010ffff")
+        return self._tokens[start:end]
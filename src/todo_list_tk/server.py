@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: server.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Local HTTP/JSON API over a `Controller`, for widgets and scripts.
+
+One asyncio event loop speaks just enough HTTP/1.1 (keep-alive,
+Content-Length bodies), so hundreds of clients cost a socket each rather
+than a thread, and the controller is only ever touched from the loop.
+Saves go through the background writer, so requests never wait on disk.
+There is no authentication: bind it to localhost.
+
+    GET    /tasks?filter=&order=&q=&offset=&limit=   a page of a filter view
+    GET    /tasks/<id>
+    POST   /tasks             {"title", "priority"?, "due"?}
+    PATCH  /tasks/<id>        any of {"title", "done", "priority", "due", "repeat"}
+    DELETE /tasks/<id>
+    GET    /changes?since=N[&wait=S]
+
+Every change the controller publishes (through the API, or read from the
+file after another process wrote it) bumps a generation counter, and
+`ChangeLog` keeps the generation each task last changed at in order, so
+`/changes?since=N` returns just the tasks changed or deleted after N. With
+`wait` the request is held until something changes (long polling). A client
+syncs by paging `/tasks`, then following `/changes` from the generation the
+first page reported. Deletions are remembered for the last `TOMBSTONES`
+deletes, and generations restart with the server (each response carries
+the server's `epoch`); a client that falls behind either gets
+`"reset": true` and pages `/tasks` again.
+
+GET responses carry an ETag naming the generation they reflect (for one
+task, the generation it last changed at), and a matching `If-None-Match`
+gets a 304 without touching the tasks. Encoded bodies are cached until the
+next change, so many clients polling the same page cost one encoding, and
+each task's JSON is cached until the task changes, so rebuilding a page
+after a change only encodes the tasks that did.
+
+Usage:
+todo-list-server [--host 127.0.0.1] [--port 8765] [--path tasks.json] [--backend json]
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from collections import deque
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from uuid import uuid4
+
+from . import metrics
+from .controller import Controller
+from .events import TaskEvent
+from .model import Priority, Task
+from .sortedlist import SortedList
+from .storage import open_store, task_to_dict
+from .views import FILTERS, ORDERS
+from .watcher import Watcher, open_watcher
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_WAIT_S = 60.0
+TOMBSTONES = 10_000
+IDLE_TIMEOUT_S = 300.0
+WATCH_POLL_S = 1.0
+WATCH_SETTLE_S = 0.05
+_MAX_LINE = 1 << 16
+_MAX_HEADERS = 100
+_MAX_BODY = 1 << 20
+_BODY_CACHE_SIZE = 256
+_TASK_CACHE_SIZE = 8192
+logger = logging.getLogger("todo-list-server")
+
+Response = Tuple[int, bytes, Dict[str, str]]
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str = "") -> None:
+        super().__init__(message or HTTPStatus(status).phrase)
+        self.status = status
+
+
+class ChangeLog:
+    """The generation at which each task last changed, ordered for `since` queries."""
+
+    def __init__(self, max_tombstones: int = TOMBSTONES) -> None:
+        self.generation = 0
+        self.floor = 0  # deletes up to this generation may have been forgotten
+        self.max_tombstones = max_tombstones
+        self._changed: Dict[str, int] = {}
+        self._order = SortedList()  # (generation, task id)
+        self._tombstones: Deque[Tuple[int, str]] = deque()  # deletes, oldest first
+
+    def record(self, events: Iterable[TaskEvent]) -> int:
+        """Start a new generation holding `events`; returns it."""
+        self.generation += 1
+        g = self.generation
+        for e in events:
+            old = self._changed.get(e.task_id)
+            if old is not None:
+                self._order.remove((old, e.task_id))
+            self._changed[e.task_id] = g
+            self._order.add((g, e.task_id))
+            if e.task is None:
+                self._tombstones.append((g, e.task_id))
+        while len(self._tombstones) > self.max_tombstones:
+            g, task_id = self._tombstones.popleft()
+            if self._changed.get(task_id) == g:  # still deleted
+                del self._changed[task_id]
+                self._order.remove((g, task_id))
+            self.floor = g
+        return self.generation
+
+    def changed_at(self, task_id: str) -> int:
+        """Generation of the task's last change (0: not since the log started)."""
+        return self._changed.get(task_id, 0)
+
+    def since(self, generation: int) -> List[str]:
+        """Ids of the tasks changed after `generation`, oldest change first."""
+        order = self._order
+        return [task_id for _, task_id in order[order.bisect_left((generation + 1, "")) :]]
+
+
+class ApiServer:
+    def __init__(self, controller: Controller) -> None:
+        self.controller = controller
+        self.log = ChangeLog()
+        self.epoch = uuid4().hex[:12]
+        self._cache: Dict[str, bytes] = {}  # request target -> body at the current generation
+        self._encoded: Dict[str, Tuple[Task, bytes]] = {}  # task id -> (task, its JSON), oldest first
+        self._changed: Optional["asyncio.Future[None]"] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._watcher: Optional[Watcher] = None
+        self._watch_task: Optional["asyncio.Task[None]"] = None
+        self._reload: Optional[asyncio.TimerHandle] = None
+        self._unsubscribe = controller.subscribe(self._on_changes)
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        self._server = await asyncio.start_server(self._serve, host, port, limit=_MAX_LINE)
+        self._start_watching()
+
+    async def close(self) -> None:
+        self._stop_watching()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._unsubscribe()
+
+    # --- changes ---
+    def _on_changes(self, events: List[TaskEvent]) -> None:
+        self.log.record(events)
+        self._cache.clear()
+        waiters, self._changed = self._changed, None
+        if waiters is not None and not waiters.done():
+            waiters.set_result(None)
+
+    def _start_watching(self) -> None:
+        store = self.controller.store
+        path = getattr(store, "path", None)
+        if path is None or not hasattr(store, "poll_changes"):
+            return
+        self._watcher = open_watcher(path)
+        fd = self._watcher.fileno()
+        if fd is not None:
+            asyncio.get_running_loop().add_reader(fd, self._on_file_event)
+        else:
+            self._watch_task = asyncio.create_task(self._poll_file())
+
+    def _stop_watching(self) -> None:
+        if self._reload is not None:
+            self._reload.cancel()
+            self._reload = None
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+        if self._watcher is not None:
+            fd = self._watcher.fileno()
+            if fd is not None:
+                asyncio.get_running_loop().remove_reader(fd)
+            self._watcher.close()
+            self._watcher = None
+
+    def _on_file_event(self) -> None:
+        # A save is a write plus a rename; settle briefly so bursts cost one reload.
+        if self._watcher is not None and self._watcher.changed() and self._reload is None:
+            self._reload = asyncio.get_running_loop().call_later(WATCH_SETTLE_S, self._reload_external)
+
+    async def _poll_file(self) -> None:
+        while self._watcher is not None:
+            await asyncio.sleep(WATCH_POLL_S)
+            if self._watcher is not None and self._watcher.changed():
+                self._reload_external()
+
+    def _reload_external(self) -> None:
+        self._reload = None
+        try:
+            self.controller.reload_external()
+        except (OSError, ValueError, TypeError, TimeoutError):
+            pass  # half-written by a non-locking writer, or gone; the next change retries
+
+    # --- connections ---
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        metrics.count("server.connections")
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), IDLE_TIMEOUT_S)
+                except HttpError as ex:
+                    writer.write(_response(ex.status, _error_body(ex), {}, keep_alive=False))
+                    await writer.drain()
+                    return
+                if request is None:
+                    return
+                method, target, version, headers, body = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                with metrics.timer("server.request"):
+                    try:
+                        status, payload, extra = await self._handle(method, target, headers, body)
+                    except HttpError as ex:
+                        status, payload, extra = ex.status, _error_body(ex), {}
+                    except Exception:  # a bug or a failed save: answer, keep serving
+                        logger.exception("%s %s failed", method, target)
+                        status, payload, extra = 500, _error_body(HttpError(500)), {}
+                writer.write(_response(status, payload, extra, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    # --- routes ---
+    async def _handle(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Response:
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        if path == "/tasks":
+            if method == "GET":
+                return self._list(target, query, headers)
+            if method == "POST":
+                return self._create(_json_body(body))
+            raise HttpError(405)
+        if path.startswith("/tasks/"):
+            task_id = unquote(path[len("/tasks/") :])
+            if task_id not in self.controller:
+                raise HttpError(404, f"no task {task_id!r}")
+            if method == "GET":
+                return self._get(task_id, headers)
+            if method == "PATCH":
+                return self._update(task_id, _json_body(body))
+            if method == "DELETE":
+                self.controller.delete_task(task_id)
+                return 204, b"", {}
+            raise HttpError(405)
+        if path == "/changes":
+            if method != "GET":
+                raise HttpError(405)
+            return await self._changes(target, query)
+        raise HttpError(404, f"no route {url.path!r}")
+
+    def _list(self, target: str, query: Dict[str, str], headers: Dict[str, str]) -> Response:
+        name = query.get("filter", "all")
+        order = query.get("order", "added")
+        if name not in FILTERS + ("overdue", "archive"):
+            raise HttpError(400, f"unknown filter {name!r}")
+        if order not in ORDERS:
+            raise HttpError(400, f"unknown order {order!r}")
+        offset = _int_param(query, "offset", 0, 0)
+        limit = min(_int_param(query, "limit", PAGE_SIZE, 1), MAX_PAGE_SIZE)
+        text = query.get("q", "").strip()
+
+        def build() -> bytes:
+            if text:
+                tasks: Sequence[Task] = self.controller.search(text, within=name)  # type: ignore[arg-type]
+            else:
+                tasks = self.controller.view(name, order)  # type: ignore[arg-type]
+            page = [self._task_json(t) for t in tasks[offset : offset + limit]]
+            return _encode(self._envelope(total=len(tasks), offset=offset), tasks=page)
+
+        if name == "overdue":  # follows the clock, so it is neither cached nor tagged
+            return 200, build(), {}
+        return self._cached(target, headers, self._etag(self.log.generation), build)
+
+    def _get(self, task_id: str, headers: Dict[str, str]) -> Response:
+        etag = self._etag(self.log.changed_at(task_id))
+        if _etag_matches(headers.get("if-none-match"), etag):
+            return 304, b"", {"ETag": etag}
+        return 200, _encode(self._envelope(task=task_to_dict(self.controller.get(task_id)))), {"ETag": etag}
+
+    def _create(self, data: Dict[str, Any]) -> Response:
+        unknown = set(data) - {"title", "priority", "due"}
+        if unknown or not isinstance(data.get("title"), str):
+            raise HttpError(400, "expected {\"title\": ..., \"priority\"?: ..., \"due\"?: ...}")
+        c = self.controller
+        try:
+            with c.batch():
+                t = c.add_task(data["title"])
+                if "priority" in data:
+                    t = c.set_priority(t.id, Priority(data["priority"]))
+                if data.get("due"):
+                    t = c.set_due(t.id, data["due"])
+        except (ValueError, TypeError) as ex:
+            raise HttpError(400, str(ex)) from None
+        return 201, _encode(self._envelope(task=task_to_dict(t))), {"Location": f"/tasks/{t.id}"}
+
+    def _update(self, task_id: str, data: Dict[str, Any]) -> Response:
+        unknown = set(data) - {"title", "done", "priority", "due", "repeat"}
+        if unknown:
+            raise HttpError(400, f"unknown fields: {', '.join(sorted(unknown))}")
+        c = self.controller
+        try:
+            with c.batch():
+                if "title" in data:
+                    c.rename_task(task_id, data["title"])
+                if "done" in data and bool(data["done"]) != c.get(task_id).done:
+                    c.toggle_task(task_id)
+                if "priority" in data:
+                    c.set_priority(task_id, Priority(data["priority"]))
+                # A repeating task needs a due date: stop repeating before clearing it,
+                # start after setting it.
+                if "repeat" in data and not data["repeat"]:
+                    c.set_repeat(task_id, None)
+                if "due" in data:
+                    c.set_due(task_id, data["due"])
+                if data.get("repeat"):
+                    c.set_repeat(task_id, data["repeat"])
+        except (ValueError, TypeError, AttributeError) as ex:
+            raise HttpError(400, str(ex)) from None
+        return 200, _encode(self._envelope(task=task_to_dict(c.get(task_id)))), {}
+
+    async def _changes(self, target: str, query: Dict[str, str]) -> Response:
+        since = _int_param(query, "since", 0, 0)
+        wait = min(float(_int_param(query, "wait", 0, 0)), MAX_WAIT_S)
+        log = self.log
+        if query.get("epoch", self.epoch) != self.epoch or not log.floor <= since <= log.generation:
+            return 200, _encode(self._envelope(reset=True)), {}
+        if wait and since == log.generation:
+            if self._changed is None:
+                self._changed = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._changed), wait)
+            except asyncio.TimeoutError:
+                pass
+
+        def delta() -> bytes:
+            c = self.controller
+            ids = log.since(since)
+            envelope = self._envelope(since=since, deleted=[i for i in ids if i not in c])
+            return _encode(envelope, upserted=[self._task_json(c.get(i)) for i in ids if i in c])
+
+        # The long-poll wait is not part of the answer, so it is not part of the cache key.
+        return self._cached(f"/changes?since={since}", {}, None, delta)
+
+    # --- helpers ---
+    def _envelope(self, **fields: Any) -> Dict[str, Any]:
+        return {"epoch": self.epoch, "generation": self.log.generation, **fields}
+
+    def _task_json(self, t: Task) -> bytes:
+        hit = self._encoded.get(t.id)
+        if hit is not None and hit[0] == t:
+            return hit[1]
+        data = self._encoded[t.id] = (t, _encode(task_to_dict(t)))
+        if len(self._encoded) > _TASK_CACHE_SIZE:
+            del self._encoded[next(iter(self._encoded))]
+        return data[1]
+
+    def _etag(self, generation: int) -> str:
+        return f'"{self.epoch}.{generation}"'
+
+    def _cached(
+        self, key: str, headers: Dict[str, str], etag: Optional[str], build: Callable[[], bytes]
+    ) -> Response:
+        extra = {"ETag": etag} if etag is not None else {}
+        if etag is not None and _etag_matches(headers.get("if-none-match"), etag):
+            metrics.count("server.not_modified")
+            return 304, b"", extra
+        body = self._cache.get(key)
+        if body is None:
+            body = self._cache[key] = build()
+            if len(self._cache) > _BODY_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+        else:
+            metrics.count("server.cache_hits")
+        return 200, body, extra
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, str, Dict[str, str], bytes]]:
+    """Method, target, version, headers (lower-case names) and body; None at end of stream."""
+    try:
+        line = await reader.readline()
+    except (asyncio.LimitOverrunError, ValueError):
+        raise HttpError(414) from None
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "malformed request line") from None
+    headers: Dict[str, str] = {}
+    while True:
+        try:
+            line = await reader.readline()
+        except (asyncio.LimitOverrunError, ValueError):
+            raise HttpError(431) from None
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= _MAX_HEADERS:
+            raise HttpError(431)
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HttpError(411)
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HttpError(400, "bad Content-Length") from None
+    if not 0 <= length <= _MAX_BODY:
+        raise HttpError(413)
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, version.upper(), headers, body
+
+
+def _response(status: int, body: bytes, headers: Dict[str, str], keep_alive: bool) -> bytes:
+    lines = [
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if body:
+        lines.append("Content-Type: application/json; charset=utf-8")
+    lines.extend(f"{k}: {v}" for k, v in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def _encode(data: Dict[str, Any], **encoded: List[bytes]) -> bytes:
+    """Compact JSON for `data`, plus arrays of already encoded values (`name=[b"{...}", ...]`)."""
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if not encoded:
+        return body
+    arrays = [b'"%s":[%s]' % (name.encode(), b",".join(items)) for name, items in encoded.items()]
+    return b"".join((body[:-1], b"," if data else b"", b",".join(arrays), b"}"))
+
+
+def _error_body(ex: HttpError) -> bytes:
+    return _encode({"error": str(ex)})
+
+
+def _json_body(body: bytes) -> Dict[str, Any]:
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        raise HttpError(400, "body is not JSON") from None
+    if not isinstance(data, dict):
+        raise HttpError(400, "body must be a JSON object")
+    return data
+
+
+def _int_param(query: Dict[str, str], name: str, default: int, minimum: int) -> int:
+    try:
+        value = int(query.get(name, default))
+    except ValueError:
+        raise HttpError(400, f"{name} must be an integer") from None
+    if value < minimum:
+        raise HttpError(400, f"{name} must be at least {minimum}")
+    return value
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def serve(host: str, port: int, controller: Controller) -> None:
+    server = ApiServer(controller)
+    await server.start(host, port)
+    print(f"Serving on http://{host}:{server.port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="todo-list-server", description="Local To-Do List JSON API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0 picks a free port")
+    parser.add_argument("--path", type=Path, help="tasks.json location (default: TODO_LIST_TK_PATH)")
+    parser.add_argument("--backend", help="storage backend (default: TODO_LIST_TK_STORAGE)")
+    args = parser.parse_args(argv)
+
+    def report(ex: BaseException) -> None:
+        print(f"todo-list-server: save failed: {ex}", file=sys.stderr)
+
+    try:
+        controller = Controller(
+            open_store(args.path, args.backend), async_writes=True, on_save_error=report, history_steps=0
+        )
+    except (OSError, ValueError) as ex:
+        print(f"todo-list-server: {ex}", file=sys.stderr)
+        return 1
+    try:
+        asyncio.run(serve(args.host, args.port, controller))
+    except KeyboardInterrupt:
+        pass
+    except OSError as ex:
+        print(f"todo-list-server: {ex}", file=sys.stderr)
+        return 1
+    finally:
+        controller.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: sortedlist.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+A small bucketed sorted list.
+
+Values are kept in sorted buckets of at most `2 * load` items, so `add` and
+`remove` cost a bisect over the bucket maxima plus a short in-bucket insort
+instead of shifting one big list. Positional access uses a lazily rebuilt
+prefix-sum over bucket lengths.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain
+from typing import Any, Iterable, Iterator, List, Optional
+
+DEFAULT_LOAD = 512
+
+
+class SortedList:
+    def __init__(self, values: Iterable[Any] = (), load: int = DEFAULT_LOAD) -> None:
+        self._load = load
+        self._reset(sorted(values))
+
+    def _reset(self, values: List[Any]) -> None:
+        load = self._load
+        self._lists: List[List[Any]] = [values[i : i + load] for i in range(0, len(values), load)]
+        self._maxes: List[Any] = [lst[-1] for lst in self._lists]
+        self._len = len(values)
+        self._offsets: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return chain.from_iterable(reversed(lst) for lst in reversed(self._lists))
+
+    def __contains__(self, value: Any) -> bool:
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        lst = self._lists[pos]
+        i = bisect_left(lst, value)
+        return i < len(lst) and lst[i] == value
+
+    def clear(self) -> None:
+        self._reset([])
+
+    def add(self, value: Any) -> None:
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+        else:
+            pos = bisect_right(maxes, value)
+            if pos == len(maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            if len(self._lists[pos]) > 2 * self._load:
+                lst = self._lists[pos]
+                half = lst[self._load :]
+                del lst[self._load :]
+                maxes[pos] = lst[-1]
+                self._lists.insert(pos + 1, half)
+                maxes.insert(pos + 1, half[-1])
+        self._len += 1
+        self._offsets = None
+
+    def remove(self, value: Any) -> None:
+        """Remove `value`; raise ValueError if it is not present."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            raise ValueError(value)
+        lst = self._lists[pos]
+        i = bisect_left(lst, value)
+        if i == len(lst) or lst[i] != value:
+            raise ValueError(value)
+        del lst[i]
+        if not lst:
+            del self._lists[pos]
+            del self._maxes[pos]
+        elif i == len(lst):
+            self._maxes[pos] = lst[-1]
+        self._len -= 1
+        self._offsets = None
+
+    def discard(self, value: Any) -> None:
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def bisect_left(self, value: Any) -> int:
+        """Number of items strictly smaller than `value`."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value: Any) -> int:
+        """Number of items smaller than or equal to `value`."""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_right(self._lists[pos], value)
+
+    def index(self, value: Any) -> int:
+        i = self.bisect_left(value)
+        if i == self._len or self[i] != value:
+            raise ValueError(value)
+        return i
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._len))]
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("SortedList index out of range")
+        offsets = self._offsets_list()
+        pos = bisect_right(offsets, i) - 1
+        return self._lists[pos][i - offsets[pos]]
+
+    def _offset(self, pos: int) -> int:
+        return self._offsets_list()[pos]
+
+    def _offsets_list(self) -> List[int]:
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(len(lst) for lst in self._lists)]
+        return self._offsets
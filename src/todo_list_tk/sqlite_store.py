@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: sqlite_store.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+SQLite storage backend.
+
+Each commit performs per-row UPSERT/DELETE statements inside a single
+transaction, so the cost of a mutation does not depend on the size of the
+store. Rows keep their implicit `rowid`, which preserves insertion order.
+Filters and counts are answered by indexed queries. The connection may be
+used from the background writer thread, so access is serialized by a lock.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .model import Task, Priority
+from .storage import DEFAULT_PATH, task_from_dict
+
+SQLITE_SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    due TEXT,
+    rank TEXT,
+    repeat TEXT,
+    repeat_done TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_done ON tasks(done);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(due);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks(updated_at);
+"""
+
+_COLUMNS = "id, title, done, created_at, updated_at, priority, due, rank, repeat, repeat_done"
+# Columns added after version 1, for older databases.
+_ADDED_COLUMNS = ("rank", "repeat", "repeat_done")
+
+_UPSERT = f"""
+INSERT INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    done = excluded.done,
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    priority = excluded.priority,
+    due = excluded.due,
+    rank = excluded.rank,
+    repeat = excluded.repeat,
+    repeat_done = excluded.repeat_done
+"""
+
+
+def sqlite_path_for(path: Path) -> Path:
+    return path.with_suffix(".sqlite3")
+
+
+class SQLiteStore:
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path is not None else sqlite_path_for(DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            columns = {r[1] for r in self.conn.execute("PRAGMA table_info(tasks)")}
+            for name in _ADDED_COLUMNS:
+                if name not in columns:
+                    self.conn.execute(f"ALTER TABLE tasks ADD COLUMN {name} TEXT")
+            self.conn.execute(f"PRAGMA user_version={SQLITE_SCHEMA_VERSION}")
+
+    # --- store API ---
+    def load(self) -> List[Task]:
+        with self._lock:
+            rows = self.conn.execute(f"SELECT {_COLUMNS} FROM tasks ORDER BY rowid")
+            return [_row_to_task(r) for r in rows]
+
+    def commit(
+        self,
+        tasks: Iterable[Task],
+        upserted: Iterable[Task] = (),
+        deleted: Iterable[str] = (),
+    ) -> None:
+        with self._lock, self.conn:
+            self.conn.executemany(_UPSERT, (_task_to_row(t) for t in upserted))
+            self.conn.executemany("DELETE FROM tasks WHERE id = ?", ((i,) for i in deleted))
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    # --- queries ---
+    def get(self, task_id: str) -> Optional[Task]:
+        with self._lock:
+            sql = f"SELECT {_COLUMNS} FROM tasks WHERE id = ?"
+            row = self.conn.execute(sql, (task_id,)).fetchone()
+        return _row_to_task(row) if row else None
+
+    def count(self, done: Optional[bool] = None, priority: Optional[Priority] = None) -> int:
+        where, params = _where(done, priority)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM tasks{where}", params).fetchone()[0]
+
+    def query(
+        self,
+        done: Optional[bool] = None,
+        priority: Optional[Priority] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Task]:
+        where, params = _where(done, priority)
+        sql = f"SELECT {_COLUMNS} FROM tasks{where} ORDER BY rowid LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self.conn.execute(sql, (*params, -1 if limit is None else limit, offset))
+            return [_row_to_task(r) for r in rows]
+
+
+def migrate_json_to_sqlite(json_path: Path, db_path: Path) -> int:
+    """Copy a `{"version": 1, "tasks": [...]}` file into a SQLite store. Returns rows written.
+
+    The database is built under a temporary name and moved into place once
+    complete, so an interrupted migration leaves no empty `db_path` behind
+    (which would otherwise be opened, and shown, as an empty list next time).
+    """
+    data = json.loads(Path(json_path).read_text("utf-8"))
+    tasks = [task_from_dict(t) for t in data.get("tasks", [])]
+    db_path = Path(db_path)
+    tmp_path = db_path.with_suffix(db_path.suffix + ".tmp")
+    for leftover in (tmp_path, Path(f"{tmp_path}-wal"), Path(f"{tmp_path}-shm")):
+        leftover.unlink(missing_ok=True)  # from an earlier, interrupted migration
+    store = SQLiteStore(tmp_path)
+    try:
+        store.commit(tasks, upserted=tasks)
+    finally:
+        store.close()
+    os.replace(tmp_path, db_path)
+    return len(tasks)
+
+
+# --- helpers ---
+def _task_to_row(t: Task) -> Tuple[Any, ...]:
+    return (
+        t.id, t.title, int(t.done), t.created_at, t.updated_at, Priority(t.priority).value,
+        t.due, t.rank, t.repeat, t.repeat_done,
+    )
+
+
+def _row_to_task(r: Tuple[Any, ...]) -> Task:
+    return Task(
+        id=r[0],
+        title=r[1],
+        done=bool(r[2]),
+        created_at=r[3],
+        updated_at=r[4],
+        priority=Priority(r[5]),
+        due=r[6],
+        rank=r[7],
+        repeat=r[8],
+        repeat_done=r[9],
+    )
+
+
+def _where(done: Optional[bool], priority: Optional[Priority]) -> Tuple[str, Tuple[Any, ...]]:
+    clauses: List[str] = []
+    params: List[Any] = []
+    if done is not None:
+        clauses.append("done = ?")
+        params.append(int(done))
+    if priority is not None:
+        clauses.append("priority = ?")
+        params.append(Priority(priority).value)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(params)
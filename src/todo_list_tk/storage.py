@@ -6,49 +6,397 @@ Project: To-Do List (Tkinter)
 File: storage.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-10-25
-Updated: 2025-10-25
+Updated: 2026-10-18
 License: MIT License (see LICENSE file for details)
 ===========================================================================
 
 Description:
 Persistent JSON storage for tasks with simple schema versioning.
 
+Besides the free functions `load_tasks` / `save_tasks` (and the streaming
+`iter_tasks`), this module defines
+the `TaskStore` protocol the controller depends on. A store receives every
+mutation as a delta (`upserted` tasks and `deleted` ids) together with the
+full ordered task sequence, so each backend can choose to rewrite everything
+(JSON) or only persist what changed (journal, SQLite).
+
+Whole-file stores are safe to share between processes: writes happen under
+an advisory lock, and a store that finds the file changed since it last read
+or wrote it (stat signature) re-reads it and merges its own delta into the
+current contents task by task, newest `updated_at` winning, instead of
+overwriting the other writer's work. JSON snapshots carry a `generation`
+counter that every write increments.
+
 ===========================================================================
 """
 from __future__ import annotations
 
 import json
 import os
+import re
+from abc import ABC, abstractmethod
 from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, List
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple, runtime_checkable,
+)
 
-from .model import Task
+from . import metrics
+from .locking import LOCK_TIMEOUT, FileLock, lock_path_for
+from .model import Task, Priority
 
 SCHEMA_VERSION = 1
 
 DEFAULT_DIR = Path(os.environ.get("TODO_LIST_TK_HOME", Path.home() / ".todo_list_tk"))
 DEFAULT_PATH = Path(os.environ.get("TODO_LIST_TK_PATH", DEFAULT_DIR / "tasks.json"))
+DEFAULT_BACKEND = os.environ.get("TODO_LIST_TK_STORAGE", "json")
+LOAD_CHUNK_SIZE = 500
+
+_TASKS_ARRAY_RE = re.compile(r'"tasks"\s*:\s*\[')
+_GENERATION_RE = re.compile(r'"generation"\s*:\s*(\d+)')
 
 
 def ensure_storage(path: Path = DEFAULT_PATH) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
     if not path.exists():
-        path.write_text(json.dumps({"version": SCHEMA_VERSION, "tasks": []}, ensure_ascii=False, indent=2), "utf-8")
+        text = json.dumps({"version": SCHEMA_VERSION, "tasks": []}, ensure_ascii=False, indent=2)
+        atomic_write_text(path, text)
     return path
 
 
+def task_to_dict(t: Task) -> Dict[str, Any]:
+    d = asdict(t)
+    d["priority"] = Priority(t.priority).value
+    # Only tasks placed by hand have a rank, and only recurring ones the rest.
+    for name in ("rank", "repeat", "repeat_done"):
+        if d[name] is None:
+            del d[name]
+    return d
+
+
+def task_from_dict(d: Dict[str, Any]) -> Task:
+    d = dict(d)
+    d["priority"] = Priority(d.get("priority", Priority.MEDIUM))
+    return Task(**d)
+
+
+@metrics.timed("storage.load_tasks")
 def load_tasks(path: Path = DEFAULT_PATH) -> List[Task]:
+    return load_snapshot(path)[0]
+
+
+def load_snapshot(path: Path = DEFAULT_PATH) -> Tuple[List[Task], int]:
+    """Tasks and generation counter (0 for files written before it existed)."""
     ensure_storage(path)
     data = json.loads(path.read_text("utf-8"))
     _ = data.get("version", 1)
-    tasks = [Task(**t) for t in data.get("tasks", [])]
-    return tasks
+    tasks = [task_from_dict(t) for t in data.get("tasks", [])]
+    return tasks, int(data.get("generation", 0))
+
 
+def iter_tasks(
+    path: Path = DEFAULT_PATH, chunk_size: int = LOAD_CHUNK_SIZE, block_size: int = 1 << 16
+) -> Iterator[List[Task]]:
+    """Stream the `tasks` array in chunks without reading the whole file.
 
-def save_tasks(tasks: Iterable[Task], path: Path = DEFAULT_PATH) -> None:
+    The file is read `block_size` characters at a time and each array element
+    is decoded as soon as it is complete, so peak memory stays around one
+    block plus one chunk of `Task` objects.
+    """
     ensure_storage(path)
-    data = {"version": SCHEMA_VERSION, "tasks": [asdict(t) for t in tasks]}
-    tmp_path = path.with_suffix(".json.tmp")
-    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), "utf-8")
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as fh:
+        buf = ""
+        while True:
+            m = _TASKS_ARRAY_RE.search(buf)
+            if m:
+                buf = buf[m.end() :]
+                break
+            block = fh.read(block_size)
+            if not block:
+                return
+            buf += block
+        chunk: List[Task] = []
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) and buf[pos] == "]":
+                break
+            try:
+                if pos == len(buf):
+                    raise json.JSONDecodeError("need more data", buf, pos)
+                obj, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                block = fh.read(block_size)
+                if not block:
+                    raise ValueError(f"{path}: truncated tasks array") from None
+                buf = buf[pos:] + block
+                pos = 0
+                continue
+            chunk.append(task_from_dict(obj))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+@metrics.timed("storage.save_tasks")
+def save_tasks(
+    tasks: Iterable[Task],
+    path: Path = DEFAULT_PATH,
+    *,
+    fsync: bool = False,
+    generation: Optional[int] = None,
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data: Dict[str, Any] = {"version": SCHEMA_VERSION}
+    if generation is not None:
+        data["generation"] = generation
+    data["tasks"] = [task_to_dict(t) for t in tasks]
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=2), fsync=fsync)
+
+
+def atomic_write_text(path: Path, text: str, *, fsync: bool = False) -> None:
+    """Write `text` to a sibling temp file and rename it over `path`."""
+    atomic_write_bytes(path, text.encode("utf-8"), fsync=fsync)
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, fsync: bool = False) -> None:
+    # Per-process temp name: two processes may be writing the same file.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(data)
+        if fsync:
+            fh.flush()
+            with metrics.timer("storage.fsync"):
+                os.fsync(fh.fileno())
     tmp_path.replace(path)
+    metrics.count("storage.bytes_written", len(data))
+
+
+# --- stores ---
+@runtime_checkable
+class TaskStore(Protocol):
+    def load(self) -> List[Task]: ...
+
+    def commit(
+        self,
+        tasks: Iterable[Task],
+        upserted: Iterable[Task] = (),
+        deleted: Iterable[str] = (),
+    ) -> None: ...
+
+    def close(self) -> None: ...
+
+
+@runtime_checkable
+class QueryableStore(TaskStore, Protocol):
+    """A store that can answer filters and counts without a full scan."""
+
+    def count(self, done: Optional[bool] = None, priority: Optional[Priority] = None) -> int: ...
+
+    def query(
+        self,
+        done: Optional[bool] = None,
+        priority: Optional[Priority] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Task]: ...
+
+
+class SharedFileStore(ABC):
+    """Base for stores that rewrite one whole file, shared safely between processes.
+
+    Keeps the file's contents as last read or written (`id -> Task`, sharing
+    the task objects with the controller) and the file's stat signature.
+    `commit` ignores the caller's full task list and applies the delta to the
+    current file contents under the lock, re-reading them first if another
+    process has written since. Whatever such a re-read brings in is kept as
+    pending until `poll_changes` hands it out, so a local save never swallows
+    another process's changes. Subclasses provide `_read` and `_write`.
+    """
+
+    def __init__(self, path: Path, lock_timeout: Optional[float] = LOCK_TIMEOUT) -> None:
+        self.path = Path(path)
+        self.lock = FileLock(lock_path_for(self.path), lock_timeout)
+        self.generation = 0
+        self._disk: Optional[Dict[str, Task]] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        # Ids changed by other processes and not yet polled -> our version before that.
+        self._pending: Dict[str, Optional[Task]] = {}
+
+    @abstractmethod
+    def _read(self) -> Tuple[List[Task], int]:
+        """The file's tasks and generation."""
+
+    @abstractmethod
+    def _write(self, tasks: Iterable[Task], generation: int) -> None:
+        """Replace the file's contents with `tasks`."""
+
+    def load(self) -> List[Task]:
+        with self.lock:
+            tasks = list(self._refresh().values())
+            self._pending.clear()  # the caller gets everything
+            return tasks
+
+    def poll_changes(self) -> Optional[Tuple[List[Task], List[Task]]]:
+        """Tasks another process added/changed and removed since this store last synced.
+
+        Returns `(upserted, removed)` with the new versions of changed tasks
+        and the last known versions of removed ones, or None if the file is
+        untouched, which costs a single `stat`. Changes picked up by a
+        `commit` in the meantime are included.
+        """
+        if self._disk is None or (not self._pending and not self.changed_on_disk()):
+            return None
+        with self.lock:
+            after = self._refresh()
+            pending, self._pending = self._pending, {}
+        upserted = [after[task_id] for task_id in pending if task_id in after]
+        removed = [old for task_id, old in pending.items() if old is not None and task_id not in after]
+        return (upserted, removed) if upserted or removed else None
+
+    def changed_on_disk(self) -> bool:
+        """True if another writer has replaced the file since this store last synced."""
+        return self._signature is None or self._stat() != self._signature
+
+    def commit(
+        self,
+        tasks: Iterable[Task],
+        upserted: Iterable[Task] = (),
+        deleted: Iterable[str] = (),
+    ) -> None:
+        with self.lock:
+            base = self._disk or {}
+            current = self._refresh()
+            for t in upserted:
+                cur = current.get(t.id)
+                # Another process's newer edit of the same task wins; ties go to us.
+                if cur is None or cur == base.get(t.id) or cur.updated_at <= t.updated_at:
+                    current[t.id] = t
+            for task_id in deleted:
+                cur = current.get(task_id)
+                old = base.get(task_id)
+                if cur is None:
+                    continue
+                # Keep the task if another process edited it after the version we deleted.
+                if old is None or cur == old or cur.updated_at <= old.updated_at:
+                    del current[task_id]
+            self._write(current.values(), self.generation + 1)
+            self.generation += 1
+            self._signature = self._stat()
+
+    def close(self) -> None:
+        pass
+
+    def _refresh(self) -> Dict[str, Task]:
+        """The file's tasks, re-read only if it changed since we last synced."""
+        signature = self._stat()
+        if self._disk is None or signature != self._signature:
+            tasks, self.generation = self._read()
+            disk = {t.id: t for t in tasks}
+            if self._disk is not None:
+                for task_id in self._disk.keys() | disk.keys():
+                    old = self._disk.get(task_id)
+                    if old != disk.get(task_id):
+                        self._pending.setdefault(task_id, old)
+            self._disk = disk
+            self._signature = signature
+        return self._disk
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class JsonStore(SharedFileStore):
+    """Whole-file JSON store: every commit rewrites `path` atomically."""
+
+    def __init__(self, path: Path = DEFAULT_PATH, lock_timeout: Optional[float] = LOCK_TIMEOUT) -> None:
+        super().__init__(path, lock_timeout)
+
+    def iter_load(self, chunk_size: int = LOAD_CHUNK_SIZE) -> Iterator[List[Task]]:
+        ensure_storage(self.path)
+        # Taken before opening: if the file is replaced in between, the next
+        # commit sees a stale signature and re-reads, which is the safe side.
+        signature = self._stat()
+        generation = _read_generation(self.path)
+        disk: Dict[str, Task] = {}
+        for chunk in iter_tasks(self.path, chunk_size):
+            disk.update((t.id, t) for t in chunk)
+            yield chunk
+        self._disk, self._signature, self.generation = disk, signature, generation
+        self._pending.clear()
+
+    def _read(self) -> Tuple[List[Task], int]:
+        return load_snapshot(self.path)
+
+    def _write(self, tasks: Iterable[Task], generation: int) -> None:
+        save_tasks(tasks, self.path, generation=generation)
+
+
+def _read_generation(path: Path) -> int:
+    with open(path, "r", encoding="utf-8") as fh:
+        head = fh.read(4096)
+    tasks_at = _TASKS_ARRAY_RE.search(head)
+    m = _GENERATION_RE.search(head, 0, tasks_at.start() if tasks_at else len(head))
+    return int(m.group(1)) if m else 0
+
+
+class MemoryStore:
+    """Non-persistent store, handy for tests, benchmarks and scripting."""
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self.tasks = list(tasks)
+
+    def load(self) -> List[Task]:
+        return list(self.tasks)
+
+    def commit(
+        self,
+        tasks: Iterable[Task],
+        upserted: Iterable[Task] = (),
+        deleted: Iterable[str] = (),
+    ) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def open_store(path: Optional[Path] = None, backend: Optional[str] = None) -> TaskStore:
+    """Create the store selected by `backend` (or `TODO_LIST_TK_STORAGE`).
+
+    `path` is always the JSON location; the SQLite and binary backends keep
+    their file next to it and migrate an existing JSON file on first open.
+    """
+    path = Path(path) if path is not None else DEFAULT_PATH
+    backend = (backend or DEFAULT_BACKEND).lower()
+    if backend == "json":
+        return JsonStore(path)
+    if backend == "memory":
+        return MemoryStore()
+    if backend == "journal":
+        from .journal import JournalStore
+
+        return JournalStore(path)
+    if backend == "sqlite":
+        from .sqlite_store import SQLiteStore, migrate_json_to_sqlite, sqlite_path_for
+
+        db_path = sqlite_path_for(path)
+        if not db_path.exists() and path.exists():
+            migrate_json_to_sqlite(path, db_path)
+        return SQLiteStore(db_path)
+    if backend == "binary":
+        from .binary_store import BinaryStore, binary_path_for, import_json
+
+        bin_path = binary_path_for(path)
+        if not bin_path.exists() and path.exists():
+            import_json(path, bin_path)
+        return BinaryStore(bin_path)
+    raise ValueError(f"Unknown storage backend: {backend!r}")
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tables.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+In-memory task tables the `Controller` keeps its tasks in.
+
+Both are `id -> Task` mappings that also hand out the insertion sequence
+numbers ordering the controller's views. `vacate(id)` removes a task but
+keeps its sequence number, so a rolled-back delete returns the task to its
+place; `forget(id)` then releases the number.
+
+`TaskDict` is a plain dict plus two small dicts for the sequence numbers.
+
+`TaskTable` stores tasks column-wise for very large lists: ids as 16 raw
+bytes, timestamps as int64 epoch seconds, the due date as an int64 day
+ordinal, done/priority as uint8 columns, titles interned and manual-order
+ranks as they are. Row numbers are the sequence numbers, ids are found
+through an open-addressing hash table of row numbers, and `Task` objects
+are only built when read, which takes about a third of the memory of
+`TaskDict`. The price is a few microseconds per read; a small cache of
+recently read or written tasks keeps repeated reads of the rows on screen
+cheap. Filters and counts over done/priority run as C-level scans of the
+byte columns (`rows`, `count`). Tasks that do not pack losslessly (ids
+that are not uuid hex, timestamps that are not canonical ISO seconds) and
+tasks with recurrence fields are kept whole on the side.
+
+Rows are append-only, so deleting leaves a ~50 byte hole until the table
+is rebuilt (the controller rebuilds it on every full reload).
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import os
+import re
+import sys
+from array import array
+from collections.abc import ValuesView
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional
+
+from .model import Priority, Task
+from .views import Filter, matches
+
+# Opt in to `TaskTable` for the app's controller.
+COMPACT = os.environ.get("TODO_LIST_TK_COMPACT", "").strip().lower() not in {"", "0", "false", "no", "off"}
+
+_PRIORITIES = tuple(Priority)
+_PRIORITY_INDEX = {p: i for i, p in enumerate(_PRIORITIES)}
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+# The only timestamp shape that survives packing unchanged.
+_CANONICAL_TIME = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d", re.ASCII)
+_ID_SIZE = 16
+# `_state` column: no task in the row, or the task's done flag.
+_EMPTY, _ACTIVE, _DONE = 0, 1, 2
+# hash table slots
+_FREE_SLOT, _DELETED_SLOT = -1, -2
+_CACHE_SIZE = 1024
+
+
+class TaskDict(Dict[str, Task]):
+    """`id -> Task` dict with insertion sequence numbers."""
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        super().__init__((t.id, t) for t in tasks)
+        self._seqs: Dict[str, int] = {task_id: i for i, task_id in enumerate(self)}
+        self._ids: Dict[int, str] = dict(enumerate(self))
+        self._next = len(self._ids)
+
+    def __setitem__(self, task_id: str, t: Task) -> None:
+        if task_id not in self._seqs:
+            self._seqs[task_id] = self._next
+            self._ids[self._next] = task_id
+            self._next += 1
+        super().__setitem__(task_id, t)
+
+    def __delitem__(self, task_id: str) -> None:
+        self.vacate(task_id)
+        self.forget(task_id)
+
+    def seq(self, task_id: str) -> int:
+        return self._seqs[task_id]
+
+    def at(self, seq: int) -> Task:
+        return self[self._ids[seq]]
+
+    def vacate(self, task_id: str) -> None:
+        super().__delitem__(task_id)
+
+    def forget(self, task_id: str) -> None:
+        if task_id not in self:
+            self._ids.pop(self._seqs.pop(task_id), None)
+
+    def reserve(self, task_id: str, seq: int) -> None:
+        """Give a forgotten `task_id` its old sequence number back, if still unused."""
+        if task_id not in self._seqs and seq < self._next and seq not in self._ids:
+            self._seqs[task_id] = seq
+            self._ids[seq] = task_id
+
+    def rows(self, name: Filter = "all") -> Iterator[int]:
+        """Sequence numbers of the tasks matching filter `name`, in order."""
+        seqs = self._seqs
+        return (seqs[task_id] for task_id, t in self.items() if matches(name, t))
+
+
+class TaskTable(MutableMapping[str, Task]):
+    """Column-wise `id -> Task` mapping; row numbers are the sequence numbers."""
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self._ids = bytearray()
+        self._titles: List[Optional[str]] = []
+        self._ranks: List[Optional[str]] = []
+        self._created = array("q")
+        self._updated = array("q")
+        self._due = array("q")  # date ordinal, 0 for none
+        self._state = bytearray()
+        self._priority = bytearray()
+        self._whole: Dict[int, Task] = {}  # rows holding a task that does not pack
+        self._cache: Dict[int, Task] = {}  # row -> Task, oldest first
+        self._odd_ids: Dict[str, int] = {}  # ids that are not uuid hex -> row
+        self._slots = array("q", [_FREE_SLOT]) * 8
+        self._used_slots = 0  # live and deleted slots
+        self._len = 0
+        for t in tasks:
+            self[t.id] = t
+
+    # --- mapping ---
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, task_id: object) -> bool:
+        row = self._row(task_id) if isinstance(task_id, str) else -1
+        return row >= 0 and self._state[row] != _EMPTY
+
+    def __iter__(self) -> Iterator[str]:
+        for row in self.rows():
+            yield self._id_at(row)
+
+    def __getitem__(self, task_id: str) -> Task:
+        row = self._row(task_id)
+        if row < 0 or self._state[row] == _EMPTY:
+            raise KeyError(task_id)
+        return self._task(row)
+
+    def __setitem__(self, task_id: str, t: Task) -> None:
+        if t.id != task_id:
+            raise ValueError(f"task {t.id!r} stored under {task_id!r}")
+        row = self._row(task_id)
+        if row < 0:
+            row = self._append(task_id)
+        if self._state[row] == _EMPTY:
+            self._len += 1
+        self._whole.pop(row, None)
+        created, updated, due = _pack_time(t.created_at), _pack_time(t.updated_at), _pack_due(t.due)
+        # Recurrence fields are rare enough to keep such tasks whole rather than add columns.
+        if (
+            created is None or updated is None or due is None
+            or t.repeat or t.repeat_done or task_id in self._odd_ids
+        ):
+            self._whole[row] = t
+            created = updated = due = 0
+        self._titles[row] = sys.intern(t.title)
+        self._ranks[row] = t.rank
+        self._created[row] = created
+        self._updated[row] = updated
+        self._due[row] = due
+        self._state[row] = _DONE if t.done else _ACTIVE
+        self._priority[row] = _PRIORITY_INDEX[Priority(t.priority)] + 1
+        self._cache.pop(row, None)
+        self._remember(row, t)
+
+    def __delitem__(self, task_id: str) -> None:
+        self.vacate(task_id)
+        self.forget(task_id)
+
+    def values(self) -> ValuesView[Task]:
+        return _Values(self)
+
+    # --- sequence numbers ---
+    def seq(self, task_id: str) -> int:
+        row = self._row(task_id)
+        if row < 0:
+            raise KeyError(task_id)
+        return row
+
+    def at(self, seq: int) -> Task:
+        if not 0 <= seq < len(self._state) or self._state[seq] == _EMPTY:
+            raise KeyError(seq)
+        return self._task(seq)
+
+    def vacate(self, task_id: str) -> None:
+        row = self._row(task_id)
+        if row < 0 or self._state[row] == _EMPTY:
+            raise KeyError(task_id)
+        self._len -= 1
+        self._state[row] = self._priority[row] = 0
+        self._titles[row] = self._ranks[row] = None
+        self._whole.pop(row, None)
+        self._cache.pop(row, None)
+
+    def forget(self, task_id: str) -> None:
+        if task_id in self:
+            return
+        if task_id in self._odd_ids:
+            del self._odd_ids[task_id]
+            return
+        key = _pack_id(task_id)
+        slot = self._find(key) if key is not None else -1
+        if slot >= 0:
+            self._slots[slot] = _DELETED_SLOT
+
+    def reserve(self, task_id: str, seq: int) -> None:
+        """Give a forgotten `task_id` its old row back, if still unused."""
+        if self._row(task_id) >= 0 or not 0 <= seq < len(self._state) or self._state[seq] != _EMPTY:
+            return
+        key = _pack_id(task_id)
+        if key is None:
+            self._odd_ids[task_id] = seq
+            return
+        if self._ids[seq * _ID_SIZE : (seq + 1) * _ID_SIZE] != key:
+            return  # rows are never reused, so this was some other task's
+        if (self._used_slots + 1) * 2 > len(self._slots):
+            self._rehash()
+        self._place(key, seq)
+        self._used_slots += 1
+
+    # --- column scans ---
+    def rows(self, name: Filter = "all") -> Iterator[int]:
+        """Rows of the tasks matching filter `name`, in order."""
+        state = self._state
+        if name in ("active", "done"):
+            target = bytes((_ACTIVE if name == "active" else _DONE,))
+            row = state.find(target)
+            while row >= 0:
+                yield row
+                row = state.find(target, row + 1)
+        elif name == "all":
+            yield from (row for row, s in enumerate(state) if s)
+        else:
+            yield from (row for row in self.rows() if matches(name, self._task(row)))
+
+    def count(self, done: Optional[bool] = None, priority: Optional[Priority] = None) -> int:
+        """Number of tasks with the given done flag and/or priority."""
+        if priority is not None:
+            p = _PRIORITY_INDEX[Priority(priority)] + 1
+            if done is None:
+                return self._priority.count(p)
+            s = _DONE if done else _ACTIVE
+            return sum(1 for ps, ss in zip(self._priority, self._state) if ps == p and ss == s)
+        if done is None:
+            return self._len
+        return self._state.count(_DONE if done else _ACTIVE)
+
+    # --- internals ---
+    def _task(self, row: int) -> Task:
+        t = self._cache.get(row)
+        if t is not None:
+            return t
+        if self._whole and row in self._whole:
+            return self._whole[row]
+        due = self._due[row]
+        t = Task(
+            id=self._id_at(row),
+            title=self._titles[row],  # type: ignore[arg-type]
+            done=self._state[row] == _DONE,
+            created_at=_unpack_time(self._created[row]),
+            updated_at=_unpack_time(self._updated[row]),
+            priority=_PRIORITIES[self._priority[row] - 1],
+            due=date.fromordinal(due).isoformat() if due else None,
+            rank=self._ranks[row],
+        )
+        self._remember(row, t)
+        return t
+
+    def _remember(self, row: int, t: Task) -> None:
+        cache = self._cache
+        cache[row] = t
+        if len(cache) > _CACHE_SIZE:
+            del cache[next(iter(cache))]
+
+    def _id_at(self, row: int) -> str:
+        if self._whole and row in self._whole:
+            return self._whole[row].id
+        return self._ids[row * _ID_SIZE : (row + 1) * _ID_SIZE].hex()
+
+    def _row(self, task_id: str) -> int:
+        key = _pack_id(task_id)
+        if key is None:
+            return self._odd_ids.get(task_id, -1)
+        slot = self._find(key)
+        return self._slots[slot] if slot >= 0 else -1
+
+    def _find(self, key: bytes) -> int:
+        """Slot holding the row with id `key`, or -1."""
+        slots, ids = self._slots, self._ids
+        mask = len(slots) - 1
+        i = hash(key) & mask
+        while True:
+            row = slots[i]
+            if row == _FREE_SLOT:
+                return -1
+            if row >= 0 and ids[row * _ID_SIZE : (row + 1) * _ID_SIZE] == key:
+                return i
+            i = (i + 1) & mask
+
+    def _append(self, task_id: str) -> int:
+        row = len(self._state)
+        key = _pack_id(task_id)
+        self._ids += key or bytes(_ID_SIZE)
+        self._titles.append(None)
+        self._ranks.append(None)
+        self._created.append(0)
+        self._updated.append(0)
+        self._due.append(0)
+        self._state.append(_EMPTY)
+        self._priority.append(0)
+        if key is None:
+            self._odd_ids[task_id] = row
+            return row
+        if (self._used_slots + 1) * 2 > len(self._slots):
+            self._rehash()
+        self._place(key, row)
+        self._used_slots += 1
+        return row
+
+    def _place(self, key: bytes, row: int) -> None:
+        slots = self._slots
+        mask = len(slots) - 1
+        i = hash(key) & mask
+        while slots[i] >= 0:
+            i = (i + 1) & mask
+        slots[i] = row
+
+    def _rehash(self) -> None:
+        rows = [row for row in self._slots if row >= 0]
+        size = 8
+        while size < len(rows) * 4 + 4:
+            size *= 2
+        self._slots = array("q", [_FREE_SLOT]) * size
+        ids = self._ids
+        for row in rows:
+            self._place(bytes(ids[row * _ID_SIZE : (row + 1) * _ID_SIZE]), row)
+        self._used_slots = len(rows)
+
+
+class _Values(ValuesView):  # type: ignore[type-arg]
+    # Walks rows directly instead of looking every id up again.
+    _mapping: TaskTable
+
+    def __iter__(self) -> Iterator[Task]:
+        table = self._mapping
+        return (table._task(row) for row in table.rows())
+
+
+def _pack_id(task_id: str) -> Optional[bytes]:
+    if len(task_id) != 2 * _ID_SIZE:
+        return None
+    try:
+        key = bytes.fromhex(task_id)
+    except ValueError:
+        return None
+    return key if key.hex() == task_id else None
+
+
+@lru_cache(maxsize=4096)  # created_at and updated_at are often equal
+def _pack_time(s: str) -> Optional[int]:
+    if not isinstance(s, str) or not _CANONICAL_TIME.fullmatch(s):
+        return None
+    try:
+        return (datetime.fromisoformat(s) - _EPOCH) // _SECOND
+    except ValueError:  # e.g. month 13
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _unpack_time(seconds: int) -> str:
+    return (_EPOCH + seconds * _SECOND).isoformat(timespec="seconds")
+
+
+def _pack_due(due: Optional[str]) -> Optional[int]:
+    if not due:
+        return 0 if due is None else None
+    try:
+        d = date.fromisoformat(due)
+    except (TypeError, ValueError):
+        return None
+    return d.toordinal() if d.isoformat() == due else None
@@ -6,37 +6,113 @@ Project: To-Do List (Tkinter)
 File: ui.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-10-25
-Updated: 2025-10-25
+Updated: 2026-10-18
 License: MIT License (see LICENSE file for details)
 ===========================================================================
 
 Description:
 Tkinter UI for the To‑Do List application.
 
+Startup is kept short: widgets are built before the store is touched, tasks
+are loaded in chunks from the event loop once the window is up (the first
+screenful appears as soon as it is parsed), and the dialog modules are only
+imported when a dialog is first shown.
+
+Task changes patch the list rather than rebuild it: an edit that leaves a
+task in place re-renders its row, and additions, removals and moves shift
+the rows on screen. Switching lists and merging in changes from disk reset
+the list instead.
+
+The View menu picks the sort order; in "Manual" order rows can be dragged
+by their handle to reorder them.
+
+Due-date reminders keep a single `after` timer armed for the next deadline
+(re-armed as tasks change, none at all when nothing is due) and show a
+banner when it passes.
+
+Once loaded, the app watches the task file and merges in changes made by
+other processes (another window, the `todo-list` CLI): inotify wakes the
+event loop where available, otherwise the file is stat-polled.
+
 ===========================================================================
 """
 from __future__ import annotations
 
+import queue
+import time
+from datetime import datetime, timedelta
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox
-from typing import Dict, List, Literal, Optional
+from tkinter import ttk
+from typing import Callable, List, Optional, Sequence
 
+from . import metrics
+from .archive import ARCHIVE_DAYS
 from .controller import Controller
+from .events import TaskEvent
+from .lists import DEFAULT_LIST, ListManifest
+from .listview import TaskListView
 from .model import Task, Priority
+from .recurrence import format_when
+from .storage import TaskStore
 from .theming import setup_theme, apply_theme, Theme
-
-Filter = Literal["all", "active", "done"]
+from .views import Filter, Order
+from .watcher import Watcher, open_watcher
+
+SAVE_POLL_MS = 100
+SEARCH_DELAY_MS = 150
+SEARCH_LIMIT = 1000
+UPCOMING_LIMIT = 20
+LOAD_SLICE_MS = 20
+WATCH_POLL_MS = 1000
+WATCH_SETTLE_MS = 50
+SORT_ORDERS = (
+    ("added", "Date Added"),
+    ("priority", "Priority"),
+    ("due", "Due Date"),
+    ("title", "Title"),
+    ("updated", "Recently Changed"),
+    ("manual", "Manual (drag to reorder)"),
+)
+# Far-off deadlines are re-checked this often, in case the clock jumped (e.g. after a suspend).
+REMINDER_MAX_MS = 6 * 60 * 60 * 1000
 
 
 class App(ttk.Frame):
-    def __init__(self, master: tk.Tk | tk.Toplevel | None = None) -> None:
+    def __init__(
+        self,
+        master: tk.Tk | tk.Toplevel | None = None,
+        *,
+        store: Optional[TaskStore] = None,
+        on_phase: Optional[Callable[[str], None]] = None,
+    ) -> None:
         self.root = master or tk.Tk()
         super().__init__(self.root, padding=10, style="Task.TFrame")
         self.root.title("To‑Do List — Tkinter")
-        self.controller = Controller()
+        # `on_phase(name)` is called as each startup phase ends (see `--profile-startup`).
+        self._on_phase = on_phase or (lambda phase: None)
+        self._save_errors: "queue.SimpleQueue[BaseException]" = queue.SimpleQueue()
+        self._save_poll: Optional[str] = None
         self.filter: Filter = "all"
+        self.order: Order = "added"
+        self.query = ""
+        self._search_job: Optional[str] = None
+        self._menu_task_id: Optional[str] = None
+        self._watcher: Optional[Watcher] = None
+        self._watch_job: Optional[str] = None
+        self._watch_fd: Optional[int] = None
+        self._reminder_job: Optional[str] = None
+        self._reminder_at: Optional[datetime] = None
+        # Set while a list switch or reload applies changes the list is then reset for.
+        self._resetting = False
         self.theme = setup_theme(self.root, Theme.LIGHT)
-        self._task_widgets: Dict[str, ttk.Checkbutton] = {}
+        self._on_phase("theme")
+        # Named lists only make sense for the default location; an explicit store is used alone.
+        self.lists: Optional[ListManifest] = None
+        if store is None:
+            try:
+                self.lists = ListManifest()
+            except ValueError:
+                pass  # unreadable manifest: carry on with the default list only
 
         self._build_menu()
         self._build_header()
@@ -44,23 +120,59 @@ class App(ttk.Frame):
         self._build_footer()
         self._bind_keys()
         self.pack(fill="both", expand=True)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_exit)
+        self._on_phase("widgets")
+
+        # Opening the store is cheap; reading it starts from the first idle callback.
+        self.controller = Controller(
+            store, async_writes=True, on_save_error=self._save_errors.put, streaming=True, lists=self.lists
+        )
+        self.controller.subscribe(self._on_tasks_changed)
+        self._update_title()
         self.refresh()
+        self._on_phase("controller")
+        self._first_paint = True
+        self._load_job: Optional[str] = self.root.after_idle(self._load_step)
 
     # --- UI ---
     def _build_menu(self) -> None:
         menubar = tk.Menu(self.root)
 
         file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Exit", command=self.root.destroy, accelerator="Alt+F4")
+        file_menu.add_command(label="Exit", command=self._on_exit, accelerator="Alt+F4")
         menubar.add_cascade(label="File", menu=file_menu)
 
+        edit_menu = tk.Menu(menubar, tearoff=0)
+        edit_menu.add_command(label="Undo", command=self._on_undo, accelerator="Ctrl+Z")
+        edit_menu.add_command(label="Redo", command=self._on_redo, accelerator="Ctrl+Y")
+        menubar.add_cascade(label="Edit", menu=edit_menu)
+
         view_menu = tk.Menu(menubar, tearoff=0)
         view_menu.add_command(label="Light Theme", command=lambda: apply_theme(ttk.Style(self.root), Theme.LIGHT))
         view_menu.add_command(label="Dark Theme", command=lambda: apply_theme(ttk.Style(self.root), Theme.DARK))
+        view_menu.add_separator()
+        self.order_var = tk.StringVar(value=self.order)
+        for order, label in SORT_ORDERS:
+            view_menu.add_radiobutton(
+                label=f"Sort by {label}", value=order, variable=self.order_var,
+                command=lambda o=order: self._set_order(o),
+            )
+        view_menu.add_separator()
+        view_menu.add_command(label="Upcoming Occurrences…", command=self._show_upcoming)
         menubar.add_cascade(label="View", menu=view_menu)
 
+        if self.lists is not None:
+            self.list_var = tk.StringVar()
+            # Filled in each time it opens, so the counts are current.
+            self.lists_menu = tk.Menu(menubar, tearoff=0, postcommand=self._fill_lists_menu)
+            menubar.add_cascade(label="Lists", menu=self.lists_menu)
+
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="About", command=self._about)
+        if metrics.enabled:
+            help_menu.add_command(
+                label="Diagnostics", command=self._show_diagnostics, accelerator="Ctrl+Shift+D"
+            )
         menubar.add_cascade(label="Help", menu=help_menu)
 
         self.root.config(menu=menubar)
@@ -76,26 +188,51 @@ class App(ttk.Frame):
         add_btn = ttk.Button(header, text="Add", command=self._on_add)
         add_btn.pack(side="left", padx=(8, 0))
 
-        # Filters
+        # Filters + live search
         filters = ttk.Frame(header)
-        filters.pack(side="right")
-        for name in ["all", "active", "done"]:
-            b = ttk.Radiobutton(filters, text=name.capitalize(), value=name, command=lambda n=name: self._set_filter(n))
-            b.configure(variable=tk.StringVar(value=self.filter))
-            # We manage filter state manually in _set_filter
+        filters.pack(side="right", padx=(8, 0))
+        self.filter_var = tk.StringVar(value=self.filter)
+        for name in ["all", "active", "done", "overdue", "archive"]:
+            b = ttk.Radiobutton(
+                filters, text=name.capitalize(), value=name, variable=self.filter_var,
+                command=lambda n=name: self._set_filter(n),
+            )
+            b.pack(side="left")
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(filters, textvariable=self.search_var, width=18)
+        self.search_entry.pack(side="left", padx=(8, 0))
+        self.search_var.trace_add("write", lambda *_: self._schedule_search())
+        self.search_entry.bind("<Escape>", lambda e: self.search_var.set(""))
 
     def _build_list(self) -> None:
-        self.canvas = tk.Canvas(self, highlightthickness=0)
-        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.list_frame = ttk.Frame(self.canvas)
-
-        self.canvas.configure(yscrollcommand=self.scroll.set)
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.scroll.pack(side="right", fill="y")
+        # Reminder banner, shown above the list when a task falls due.
+        self.banner = ttk.Frame(self, padding=(8, 4))
+        self.banner_label = ttk.Label(self.banner)
+        self.banner_label.pack(side="left", fill="x", expand=True)
+        ttk.Button(self.banner, text="✕", width=2, command=self._hide_banner).pack(side="right")
+        ttk.Button(self.banner, text="Show overdue", command=lambda: self._set_filter("overdue")).pack(
+            side="right", padx=(0, 4)
+        )
 
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.list_frame, anchor="nw")
-        self.list_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.bind("<Configure>", self._on_canvas_resize)
+        self.list_view = TaskListView(
+            self, on_toggle=self._on_row_toggle, on_menu=self._on_row_menu, on_move=self._on_row_move
+        )
+        self.list_view.pack(fill="both", expand=True)
+
+        # One context menu shared by every row; it acts on `_menu_task_id`.
+        self.row_menu = tk.Menu(self, tearoff=0)
+        self.row_menu.add_command(label="Rename", command=lambda: self._menu_action(self._on_rename))
+        self.row_menu.add_command(label="Set Due Date…", command=lambda: self._menu_action(self._on_set_due))
+        self.row_menu.add_command(
+            label="Repeat…", command=lambda: self._menu_action(self._on_set_repeat)
+        )
+        for p in Priority:
+            self.row_menu.add_command(
+                label=f"Set Priority → {p.value.capitalize()}",
+                command=lambda p=p: self._menu_action(lambda: self._on_set_priority(p)),
+            )
+        self.row_menu.add_separator()
+        self.row_menu.add_command(label="Delete", command=lambda: self._menu_action(self._on_delete))
 
     def _build_footer(self) -> None:
         footer = ttk.Frame(self)
@@ -111,14 +248,62 @@ class App(ttk.Frame):
     def _bind_keys(self) -> None:
         self.root.bind("<Return>", lambda e: self._on_add())
         self.root.bind("<KP_Enter>", lambda e: self._on_add())
-        self.root.bind("<Delete>", lambda e: self._on_delete())
-        self.root.bind("<BackSpace>", lambda e: self._on_delete())
-        self.root.bind("<space>", lambda e: self._on_toggle())
+        self.root.bind("<Delete>", lambda e: self._typing(e) or self._on_delete())
+        self.root.bind("<BackSpace>", lambda e: self._typing(e) or self._on_delete())
+        self.root.bind("<space>", lambda e: self._typing(e) or self._on_toggle())
+        self.root.bind("<Control-f>", lambda e: self.search_entry.focus_set())
         self.root.bind("<F2>", lambda e: self._on_rename())
         self.root.bind("<Control-l>", lambda e: self._on_clear_completed())
+        self.root.bind("<Control-D>", lambda e: self._show_diagnostics())
+        self.root.bind("<Control-z>", lambda e: self._on_undo())
+        self.root.bind("<Control-y>", lambda e: self._on_redo())
+        self.root.bind("<Control-Z>", lambda e: self._on_redo())
+        self.root.bind("<Control-Next>", lambda e: self._cycle_list(1))
+        self.root.bind("<Control-Prior>", lambda e: self._cycle_list(-1))
+
+    @staticmethod
+    def _typing(event: tk.Event) -> bool:
+        """True if the key went to a text entry, where it must not act on tasks."""
+        return isinstance(event.widget, (tk.Entry, ttk.Entry))
+
+    def _on_row_toggle(self, task_id: str) -> None:
+        if task_id in self.controller:  # archived rows are read-only
+            self.controller.toggle_task(task_id)
+        else:
+            self.refresh()  # put the checkbox back
+
+    def _on_row_move(self, task_id: str, before_id: Optional[str]) -> None:
+        if task_id in self.controller and (before_id is None or before_id in self.controller):
+            self.controller.move_task(task_id, before_id, within=self.filter)
+            self._select(task_id)
+
+    def _on_row_menu(self, task_id: str, x: int, y: int) -> None:
+        if task_id not in self.controller:
+            return
+        self._menu_task_id = task_id
+        try:
+            self.row_menu.tk_popup(x, y)
+        finally:
+            self.row_menu.grab_release()
+
+    def _menu_action(self, action: Callable[[], None]) -> None:
+        if self._menu_task_id is not None:
+            self._select(self._menu_task_id)
+            action()
+
+    def _on_undo(self) -> None:
+        if not self.controller.undo():
+            self.root.bell()
 
-    def _on_canvas_resize(self, event: tk.Event) -> None:
-        self.canvas.itemconfigure(self.canvas_window, width=event.width)
+    def _on_redo(self) -> None:
+        if not self.controller.redo():
+            self.root.bell()
+
+    def _on_set_priority(self, p: Priority) -> None:
+        task = self._selected_task()
+        if not task:
+            return
+        self.controller.set_priority(task.id, p)
 
     def _on_add(self) -> None:
         title = self.entry.get().strip()
@@ -127,29 +312,30 @@ class App(ttk.Frame):
         try:
             self.controller.add_task(title)
         except ValueError as ex:
+            from tkinter import messagebox
+
             messagebox.showerror("Invalid title", str(ex))
             return
         self.entry.delete(0, "end")
-        self.refresh()
 
     def _on_delete(self) -> None:
         task = self._selected_task()
         if not task:
             return
         self.controller.delete_task(task.id)
-        self.refresh()
 
     def _on_toggle(self) -> None:
         task = self._selected_task()
         if not task:
             return
         self.controller.toggle_task(task.id)
-        self.refresh()
 
     def _on_rename(self) -> None:
         task = self._selected_task()
         if not task:
             return
+        from tkinter import messagebox, simpledialog
+
         new_title = simpledialog.askstring("Rename task", "New title:", initialvalue=task.title, parent=self.root)
         if new_title is None:
             return
@@ -157,19 +343,356 @@ class App(ttk.Frame):
             self.controller.rename_task(task.id, new_title)
         except ValueError as ex:
             messagebox.showerror("Invalid title", str(ex))
-        self.refresh()
+
+    def _on_set_due(self) -> None:
+        task = self._selected_task()
+        if not task:
+            return
+        from tkinter import messagebox, simpledialog
+
+        due = simpledialog.askstring(
+            "Due date", "Due (YYYY-MM-DD or YYYY-MM-DDTHH:MM, empty for none):",
+            initialvalue=task.due or "", parent=self.root,
+        )
+        if due is None:
+            return
+        try:
+            self.controller.set_due(task.id, due)
+        except ValueError as ex:
+            messagebox.showerror("Invalid due date", str(ex))
+
+    def _on_set_repeat(self) -> None:
+        task = self._selected_task()
+        if not task:
+            return
+        from tkinter import messagebox, simpledialog
+
+        rule = simpledialog.askstring(
+            "Repeat",
+            "Repeat (daily, weekdays, weekly, every 2 weeks, monthly, yearly or FREQ=…; "
+            "empty for never), starting from the due date:",
+            initialvalue=task.repeat or "", parent=self.root,
+        )
+        if rule is None:
+            return
+        try:
+            self.controller.set_repeat(task.id, rule)
+        except ValueError as ex:
+            messagebox.showerror("Invalid repeat rule", str(ex))
+
+    def _show_upcoming(self) -> None:
+        from tkinter import messagebox
+
+        lines = []
+        for occurrence in self.controller.upcoming(UPCOMING_LIMIT):
+            title = self.controller.get(occurrence.task_id).title
+            lines.append(f"{format_when(occurrence.at)}   {title}")
+        messagebox.showinfo("Upcoming", "\n".join(lines) or "No repeating tasks.", parent=self.root)
 
     def _on_clear_completed(self) -> None:
         removed = self.controller.clear_completed()
         if removed:
+            from tkinter import messagebox
+
             messagebox.showinfo("Cleared", f"Removed {removed} completed task(s)")
+
+    def _on_exit(self) -> None:
+        self.close()
+        self.root.destroy()
+
+    def close(self) -> None:
+        """Flush queued writes; safe to call more than once."""
+        if self._load_job is not None:
+            self.root.after_cancel(self._load_job)
+            self._load_job = None
+        if self._save_poll is not None:
+            self.root.after_cancel(self._save_poll)
+            self._save_poll = None
+        self._stop_watching()
+        if self._reminder_job is not None:
+            self.root.after_cancel(self._reminder_job)
+            self._reminder_job = None
+        self.controller.close()
+        self._report_save_errors()
+        if metrics.DUMP_PATH is not None:
+            try:
+                metrics.dump(metrics.DUMP_PATH)
+            except OSError:
+                pass
+
+    def _load_step(self) -> None:
+        # Apply chunks for one time slice, then yield so input and redraws stay live.
+        self._load_job = None
+        if self._first_paint:
+            # Idle callbacks run in order, so the initial redraw queued by building
+            # the widgets has been done by now.
+            self._first_paint = False
+            self._on_phase("first paint")
+        deadline = time.perf_counter() + LOAD_SLICE_MS / 1000
+        try:
+            while self.controller.load_next_chunk():
+                if time.perf_counter() >= deadline:
+                    self._load_job = self.root.after(1, self._load_step)
+                    return
+        except (OSError, ValueError, TypeError) as ex:
+            from tkinter import messagebox
+
+            messagebox.showerror(
+                "Load failed",
+                f"Could not load tasks:\n{ex}\n\nChanges made in this session will not be saved.",
+                parent=self.root,
+            )
+        else:
+            self._start_watching()
+            self._auto_archive()
+        self._update_stats()
+        self._arm_reminder()
+        self._on_phase("tasks loaded")
+        self._on_phase = lambda phase: None  # lists opened later are not part of start-up
+
+    def _auto_archive(self) -> None:
+        if ARCHIVE_DAYS <= 0:
+            return
+        try:
+            self.controller.archive_completed(timedelta(days=ARCHIVE_DAYS))
+        except (OSError, TimeoutError, ValueError):
+            pass  # the tasks stay in the store; try again next start
+
+    # --- lists ---
+    def _fill_lists_menu(self) -> None:
+        menu = self.lists_menu
+        menu.delete(0, "end")
+        self.list_var.set(self.controller.list_id or DEFAULT_LIST)
+        for info in self.controller.lists or ():
+            active = self.controller.stats.active if info.id == self.controller.list_id else info.active
+            menu.add_radiobutton(
+                label=f"{info.name} ({active})", value=info.id, variable=self.list_var,
+                command=lambda i=info.id: self._switch_list(i),
+            )
+        menu.add_separator()
+        menu.add_command(label="New List…", command=self._on_new_list)
+        menu.add_command(label="Rename List…", command=self._on_rename_list)
+        menu.add_command(label="Delete List", command=self._on_delete_list)
+
+    def _switch_list(self, list_id: str) -> None:
+        c = self.controller
+        if c.lists is None or list_id == c.list_id:
+            return
+        self._stop_watching()
+        if self._load_job is not None:  # a list still loading resumes when it is opened again
+            self.root.after_cancel(self._load_job)
+            self._load_job = None
+        self._resetting = True
+        try:
+            c.open_list(list_id)
+            # A list restored from the cache missed whatever others wrote meanwhile.
+            c.reload_external()
+        except (OSError, ValueError, TypeError, TimeoutError) as ex:
+            from tkinter import messagebox
+
+            messagebox.showerror("Open failed", f"Could not open the list:\n{ex}", parent=self.root)
+        finally:
+            self._resetting = False
+        self._hide_banner()
+        self._update_title()
         self.refresh()
+        if c.loading:
+            self._load_job = self.root.after_idle(self._load_step)
+        else:
+            self._start_watching()
+            self._arm_reminder()
+
+    def _cycle_list(self, step: int) -> None:
+        lists = self.controller.lists
+        if lists is None or len(lists) < 2:
+            return
+        ids = [info.id for info in lists]
+        self._switch_list(ids[(ids.index(self.controller.list_id) + step) % len(ids)])
+
+    def _on_new_list(self) -> None:
+        from tkinter import messagebox, simpledialog
+
+        name = simpledialog.askstring("New list", "Name:", parent=self.root)
+        if name is None:
+            return
+        try:
+            info = self.controller.lists.create(name)  # type: ignore[union-attr]
+        except (OSError, ValueError, TimeoutError) as ex:
+            messagebox.showerror("Invalid list", str(ex))
+            return
+        self._switch_list(info.id)
+
+    def _on_rename_list(self) -> None:
+        lists, list_id = self.controller.lists, self.controller.list_id
+        if lists is None or list_id is None:
+            return
+        from tkinter import messagebox, simpledialog
+
+        name = simpledialog.askstring("Rename list", "New name:", initialvalue=lists[list_id].name, parent=self.root)
+        if name is None:
+            return
+        try:
+            lists.rename(list_id, name)
+        except (OSError, ValueError, TimeoutError) as ex:
+            messagebox.showerror("Invalid list", str(ex))
+            return
+        self._update_title()
+
+    def _on_delete_list(self) -> None:
+        lists, list_id = self.controller.lists, self.controller.list_id
+        if lists is None or list_id is None:
+            return
+        from tkinter import messagebox
+
+        if list_id == DEFAULT_LIST:
+            messagebox.showinfo("Delete list", f"{lists[list_id].name} is the default list and cannot be deleted.")
+            return
+        if not messagebox.askyesno(
+            "Delete list", f"Delete {lists[list_id].name} and all its tasks?", parent=self.root
+        ):
+            return
+        self._switch_list(DEFAULT_LIST)
+        if self.controller.list_id == DEFAULT_LIST:
+            try:
+                self.controller.delete_list(list_id)
+            except (OSError, TimeoutError) as ex:
+                messagebox.showerror("Delete failed", str(ex))
+
+    def _update_title(self) -> None:
+        c = self.controller
+        if c.lists is not None and c.list_id is not None:
+            self.root.title(f"{c.lists[c.list_id].name} — To‑Do List")
+
+    # --- reminders ---
+    def _arm_reminder(self) -> None:
+        deadline = self.controller.next_deadline()
+        if deadline == self._reminder_at and (deadline is None or self._reminder_job is not None):
+            return
+        if self._reminder_job is not None:
+            self.root.after_cancel(self._reminder_job)
+            self._reminder_job = None
+        self._reminder_at = deadline
+        if deadline is not None:
+            delay = max(0, int((deadline - datetime.now()).total_seconds() * 1000) + 1)
+            self._reminder_job = self.root.after(min(delay, REMINDER_MAX_MS), self._on_reminder)
+
+    def _on_reminder(self) -> None:
+        self._reminder_job = None
+        self._reminder_at = None
+        due = self.controller.pop_due()
+        if due:
+            more = f" and {len(due) - 1} more" if len(due) > 1 else ""
+            self.banner_label.config(text=f"⏰ Due now: {due[0].title}{more}")
+            self.banner.pack(fill="x", pady=(0, 6), before=self.list_view)
+            self.root.bell()
+            self.refresh()  # the overdue filter and count follow the clock
+        self._arm_reminder()
+
+    def _hide_banner(self) -> None:
+        self.banner.pack_forget()
+
+    # --- external changes ---
+    def _start_watching(self) -> None:
+        store = self.controller.store
+        path = getattr(store, "path", None)
+        if path is None or not hasattr(store, "poll_changes"):
+            return
+        self._watcher = open_watcher(path)
+        fd = self._watcher.fileno()
+        create = getattr(getattr(self.root, "tk", None), "createfilehandler", None)
+        if fd is not None and create is not None:  # Tk on Windows has no file handlers
+            create(fd, tk.READABLE, lambda *_: self._on_file_event())
+            self._watch_fd = fd
+        else:
+            self._watch_job = self.root.after(WATCH_POLL_MS, self._poll_file)
+
+    def _stop_watching(self) -> None:
+        if self._watch_job is not None:
+            self.root.after_cancel(self._watch_job)
+            self._watch_job = None
+        if self._watch_fd is not None:
+            self.root.tk.deletefilehandler(self._watch_fd)
+            self._watch_fd = None
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def _on_file_event(self) -> None:
+        # A save is a write plus a rename; settle briefly so bursts cost one reload.
+        if self._watcher is not None and self._watcher.changed() and self._watch_job is None:
+            self._watch_job = self.root.after(WATCH_SETTLE_MS, self._reload_external)
+
+    def _poll_file(self) -> None:
+        self._watch_job = None
+        if self._watcher is None:
+            return
+        if self._watcher.changed():
+            self._reload_external(reschedule=False)
+        self._watch_job = self.root.after(WATCH_POLL_MS, self._poll_file)
+
+    def _reload_external(self, reschedule: bool = True) -> None:
+        if reschedule:
+            self._watch_job = None
+        self._resetting = True
+        try:
+            # Our own saves leave the store's signature current, so they cost one stat here.
+            changed = self.controller.reload_external()
+        except (OSError, ValueError, TypeError, TimeoutError):
+            changed = 0  # half-written by a non-locking writer, or gone; the next change retries
+        finally:
+            self._resetting = False
+        if changed:
+            self.refresh()
+
+    def _watch_saves(self) -> None:
+        # Poll only while background writes are outstanding, so an idle app never wakes up.
+        if self._save_poll is None:
+            self._save_poll = self.root.after(SAVE_POLL_MS, self._check_saves)
+
+    def _check_saves(self) -> None:
+        self._save_poll = None
+        self._report_save_errors()
+        if self.controller.saving:
+            self._watch_saves()
+
+    def _report_save_errors(self) -> None:
+        errors: List[BaseException] = []
+        while not self._save_errors.empty():
+            errors.append(self._save_errors.get())
+        if errors:
+            from tkinter import messagebox
+
+            messagebox.showerror("Save failed", f"Could not save tasks:\n{errors[-1]}", parent=self.root)
 
     def _set_filter(self, f: Filter) -> None:
         self.filter = f
+        self.filter_var.set(f)
+        self.refresh()
+
+    def _set_order(self, order: Order) -> None:
+        self.order = order
+        self.order_var.set(order)
+        self.refresh()
+
+    def _schedule_search(self) -> None:
+        # Debounce keystrokes: only search once typing pauses.
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self) -> None:
+        self._search_job = None
+        self.query = self.search_var.get().strip()
         self.refresh()
 
+    def _show_diagnostics(self) -> None:
+        from .diagnostics import DiagnosticsWindow
+
+        DiagnosticsWindow(self.root)
+
     def _about(self) -> None:
+        from tkinter import messagebox
+
         messagebox.showinfo(
             "About",
             "To‑Do List — Tkinter\n\n"
@@ -178,58 +701,65 @@ class App(ttk.Frame):
         )
 
     # --- render ---
+    @metrics.timed("ui.refresh")
     def refresh(self) -> None:
-        # Clear existing widgets
-        for child in self.list_frame.winfo_children():
-            child.destroy()
-        self._task_widgets.clear()
-
-        tasks = self._filtered(self.controller.tasks)
-        for t in tasks:
-            self._render_task(t)
-
-        total = len(self.controller.tasks)
-        active = len([t for t in self.controller.tasks if not t.done])
-        self.stats_label.config(text=f"{active} active / {total} total")
-
-    def _render_task(self, t: Task) -> None:
-        row = ttk.Frame(self.list_frame, padding=(4, 6, 4, 6), style="Task.TFrame")
-        row.pack(fill="x")
-
-        var = tk.BooleanVar(value=t.done)
-        cb = ttk.Checkbutton(row, text=t.title, variable=var, command=lambda i=t.id: (self.controller.toggle_task(i), self.refresh()))
-        cb.pack(side="left", fill="x", expand=True)
-        self._task_widgets[t.id] = cb
-
-        menu_btn = ttk.Menubutton(row, text="⋮")
-        menu = tk.Menu(menu_btn, tearoff=0)
-        menu.add_command(label="Rename", command=lambda i=t.id: (self._select(i), self._on_rename()))
-        menu.add_command(label="Set Priority → Low", command=lambda i=t.id: (self.controller.set_priority(i, Priority.LOW), self.refresh()))
-        menu.add_command(label="Set Priority → Medium", command=lambda i=t.id: (self.controller.set_priority(i, Priority.MEDIUM), self.refresh()))
-        menu.add_command(label="Set Priority → High", command=lambda i=t.id: (self.controller.set_priority(i, Priority.HIGH), self.refresh()))
-        menu.add_separator()
-        menu.add_command(label="Delete", command=lambda i=t.id: (self._select(i), self._on_delete()))
-        menu_btn["menu"] = menu
-        menu_btn.pack(side="right")
+        """Point the list at the current filter view or search results."""
+        # Search results are ranked by relevance, "overdue" by deadline and "archive" by
+        # date: no manual placing there.
+        self.list_view.set_reorderable(
+            self.order == "manual" and not self.query and self.filter not in ("overdue", "archive")
+        )
+        self.list_view.set_items(self._visible())
+        self._update_stats()
+
+    @metrics.timed("ui.patch")
+    def _on_tasks_changed(self, events: List[TaskEvent]) -> None:
+        if not self._resetting:
+            self._patch_rows(events)
+        self._update_stats()
+        self._arm_reminder()
+        if self.controller.saving:
+            self._watch_saves()
+
+    def _patch_rows(self, events: List[TaskEvent]) -> None:
+        if self.query:
+            # Results are a ranked snapshot, not a live view: search again.
+            self.list_view.set_items(self._visible())
+            return
+        view = self.controller.view(self.filter, self.order)
+        if any(view.repositions(e.previous, e.task) for e in events):
+            self.list_view.rows_changed()
+            return
+        for e in events:
+            if e.task is not None:
+                self.list_view.update_task(e.task)
+
+    def _update_stats(self) -> None:
+        stats = self.controller.stats
+        text = f"{stats.active} active / {stats.total} total"
+        overdue = stats.overdue()
+        if overdue:
+            text += f" · {overdue} overdue"
+        if self.controller.loading:
+            text += " · loading…"
+        self.stats_label.config(text=text)
 
     # --- helpers ---
-    def _filtered(self, tasks: List[Task]) -> List[Task]:
-        if self.filter == "active":
-            return [t for t in tasks if not t.done]
-        if self.filter == "done":
-            return [t for t in tasks if t.done]
-        return tasks
+    def _visible(self) -> Sequence[Task]:
+        if self.query:
+            return self.controller.search(self.query, limit=SEARCH_LIMIT, within=self.filter)
+        return self.controller.view(self.filter, self.order)
 
     def _selected_task(self) -> Optional[Task]:
-        # Choose the first visible task whose checkbutton currently has focus or last interacted
-        for t_id, widget in self._task_widgets.items():
-            if str(self.root.focus_get()) == str(widget):
-                return next((t for t in self.controller.tasks if t.id == t_id), None)
+        # The row whose checkbutton has focus, else the last row interacted with
+        task_id = self.list_view.focused_task_id()
+        if task_id is not None and task_id in self.controller:
+            return self.controller.get(task_id)
+        if self.filter == "archive":
+            return None
         # Fallback: return first task under current filter
-        tasks = self._filtered(self.controller.tasks)
-        return tasks[0] if tasks else None
+        visible = self._visible()
+        return visible[0] if len(visible) else None
 
     def _select(self, task_id: str) -> None:
-        widget = self._task_widgets.get(task_id)
-        if widget:
-            widget.focus_set()
+        self.list_view.select(task_id)
@@ -6,7 +6,7 @@ Project: To-Do List (Tkinter)
 File: utils.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-10-25
-Updated: 2025-10-25
+Updated: 2026-10-18
 License: MIT License (see LICENSE file for details)
 ===========================================================================
 
@@ -18,7 +18,25 @@ Utility helpers.
 from __future__ import annotations
 
 import uuid
+from datetime import date, datetime, time
+from typing import Optional
 
 
 def new_id() -> str:
     return uuid.uuid4().hex
+
+
+def due_datetime(due: str) -> Optional[datetime]:
+    """Deadline for a `Task.due` string (naive local time), or None if unparsable.
+
+    A plain date means "by the end of that day".
+    """
+    try:
+        if len(due) == 10:
+            return datetime.combine(date.fromisoformat(due), time(23, 59, 59))
+        dt = datetime.fromisoformat(due)
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: views.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Aggregate counters and ordered filter views maintained by the controller.
+
+Both are updated per mutation (O(1) for counters, O(log N) for the sorted
+views), so rendering stats or switching filters never rescans the store.
+
+Each filter view is kept in one sort order. The default, "added", orders
+by sequence number; the others key each task by a tuple ending in its
+sequence number (so ties keep insertion order and keys stay unique), and
+the controller builds a view for an order the first time it is asked for
+and maintains it from then on. "manual" sorts by the task's `rank` (see
+ranks.py); tasks never placed by hand sort by creation time instead, which
+keeps them in insertion order.
+
+"overdue" depends on the clock as well as on the tasks, so it is not a
+maintained view: `OverdueView` reads the prefix of the stats' deadline
+index that lies before now, most overdue first.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple
+
+from .model import Task, Priority
+from .ranks import created_rank
+from .sortedlist import SortedList
+
+Filter = Literal["all", "active", "done", "overdue", "archive"]
+# Filters with a maintained view; "overdue" is computed (see `OverdueView`) and
+# "archive" reads the archive (see archive.py).
+FILTERS: Tuple[Filter, ...] = ("all", "active", "done")
+
+Order = Literal["added", "priority", "due", "title", "updated", "manual"]
+ORDERS: Tuple[Order, ...] = ("added", "priority", "due", "title", "updated", "manual")
+# Orders whose view lists the largest key first.
+DESCENDING = frozenset({"updated"})
+
+_PRIORITY_RANK = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
+
+
+class TaskStats:
+    """Live counters: total, active, done, per priority and overdue."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.done = 0
+        self.by_priority: Dict[Priority, int] = {p: 0 for p in Priority}
+        # Active tasks with a due date, ordered by deadline; drives `overdue()`.
+        self._due = SortedList()
+
+    @property
+    def active(self) -> int:
+        return self.total - self.done
+
+    def overdue(self, now: Optional[datetime] = None) -> int:
+        """Active tasks whose deadline is before `now`, in O(log N)."""
+        return self._due.bisect_left((now or datetime.now(), ""))
+
+    def overdue_ids(self, start: int, stop: int) -> List[str]:
+        """Ids of the overdue tasks at positions `start:stop`, most overdue first."""
+        return [task_id for _, task_id in self._due[start:stop]]
+
+    def add(self, t: Task) -> None:
+        self.total += 1
+        self.done += t.done
+        self.by_priority[Priority(t.priority)] += 1
+        key = _due_key(t)
+        if key is not None:
+            self._due.add(key)
+
+    def remove(self, t: Task) -> None:
+        self.total -= 1
+        self.done -= t.done
+        self.by_priority[Priority(t.priority)] -= 1
+        key = _due_key(t)
+        if key is not None:
+            self._due.discard(key)
+
+    def update(self, before: Optional[Task], after: Optional[Task]) -> None:
+        if before is not None:
+            self.remove(before)
+        if after is not None:
+            self.add(after)
+
+
+class TaskView(Sequence[Task]):
+    """Ordered, read-only sequence of tasks matching one filter, in one sort order.
+
+    Holds order keys only (see `order_key`); tasks are resolved by sequence
+    number through `get` on access, so the view always reflects the
+    controller's current state.
+    """
+
+    def __init__(
+        self, name: Filter, get: Callable[[int], Task], keys: Iterable = (), order: Order = "added"
+    ) -> None:
+        self.name = name
+        self.order = order
+        self.keys = SortedList(keys)
+        self._descending = order in DESCENDING
+        self._get = get if order == "added" else (lambda key: get(key[-1]))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        keys = self.keys
+        if not self._descending:
+            if isinstance(i, slice):
+                return [self._get(k) for k in keys[i]]
+            return self._get(keys[i])
+        n = len(keys)
+        if isinstance(i, slice):
+            start, stop, step = i.indices(n)
+            if step != 1:
+                return [self[k] for k in range(start, stop, step)]
+            return [self._get(k) for k in reversed(keys[n - stop : n - start])] if start < stop else []
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return self._get(keys[n - 1 - i])
+
+    def __iter__(self) -> Iterator[Task]:
+        keys = reversed(self.keys) if self._descending else self.keys
+        return (self._get(k) for k in keys)
+
+    def key(self, t: Task, seq: int) -> object:
+        return order_key(self.order, t, seq)
+
+    def matches(self, t: Task) -> bool:
+        return matches(self.name, t)
+
+    def repositions(self, before: Optional[Task], after: Optional[Task]) -> bool:
+        """True if a change from `before` to `after` (None: absent) adds, removes or moves a row."""
+        inside = before is not None and self.matches(before)
+        if inside != (after is not None and self.matches(after)):
+            return True
+        if not inside or before is None or after is None:
+            return False
+        return order_key(self.order, before, 0) != order_key(self.order, after, 0)
+
+
+class OverdueView(Sequence[Task]):
+    """Active tasks past their deadline, most overdue first; follows the clock."""
+
+    name: Filter = "overdue"
+
+    def __init__(self, stats: TaskStats, get: Callable[[str], Task]) -> None:
+        self._stats = stats
+        self._get = get
+
+    def __len__(self) -> int:
+        return self._stats.overdue()
+
+    def __getitem__(self, i):  # type: ignore[override]
+        n = len(self)
+        if isinstance(i, slice):
+            start, stop, step = i.indices(n)
+            ids = self._stats.overdue_ids(start, stop) if step == 1 else self._stats.overdue_ids(0, n)[i]
+            return [self._get(task_id) for task_id in ids]
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return self._get(self._stats.overdue_ids(i, i + 1)[0])
+
+    def matches(self, t: Task) -> bool:
+        return matches(self.name, t)
+
+    def repositions(self, before: Optional[Task], after: Optional[Task]) -> bool:
+        inside = before is not None and self.matches(before)
+        if inside != (after is not None and self.matches(after)):
+            return True
+        return inside and _due_key(before) != _due_key(after)  # type: ignore[arg-type]
+
+
+def matches(name: Filter, t: Task) -> bool:
+    if name == "active":
+        return not t.done
+    if name == "done":
+        return t.done
+    if name == "overdue":
+        key = _due_key(t)
+        return key is not None and key[0] < datetime.now()
+    if name == "archive":
+        return False  # archived tasks are no longer in the store
+    return True
+
+
+def manual_rank(t: Task) -> str:
+    """The task's place in the manual order: its rank, else its creation time as one."""
+    return t.rank if t.rank is not None else created_rank(t.created_at)
+
+
+def order_key(order: Order, t: Task, seq: int) -> object:
+    """Sort key of task `t` with sequence number `seq` in `order`."""
+    if order == "added":
+        return seq
+    if order == "manual":
+        return (manual_rank(t), seq)
+    if order == "priority":
+        return (_PRIORITY_RANK[Priority(t.priority)], *_due_sort_key(t), seq)
+    if order == "due":
+        return (*_due_sort_key(t), _PRIORITY_RANK[Priority(t.priority)], seq)
+    if order == "title":
+        return (t.title.casefold(), seq)
+    if order == "updated":
+        return (t.updated_at, seq)
+    raise ValueError(f"unknown sort order: {order!r}")
+
+
+def _due_sort_key(t: Task) -> Tuple[bool, datetime]:
+    # Soonest first, tasks without a (valid) due date last.
+    due = t.due_at()
+    return (due is None, due or datetime.min)
+
+
+def _due_key(t: Task) -> Optional[Tuple[datetime, str]]:
+    if t.done or not t.due:
+        return None
+    due = t.due_at()  # a recurring task's next open occurrence
+    return (due, t.id) if due is not None else None
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: watcher.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Notice when a task file is replaced by another process.
+
+On Linux, `InotifyWatcher` watches the file's directory through ctypes
+(saves replace the file by renaming a temp file over it, which a watch on
+the file itself would lose) and exposes a file descriptor the UI can wait
+on, so an idle app does no work at all. Elsewhere `StatWatcher` compares
+the file's stat signature, for polling from a timer.
+
+Both only say *that* the file changed; working out *what* changed is the
+store's job (`SharedFileStore.poll_changes`).
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+class StatWatcher:
+    """Polling watcher: `changed()` costs one `stat` call."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._signature = self._stat()
+
+    def fileno(self) -> Optional[int]:
+        return None
+
+    def changed(self) -> bool:
+        signature = self._stat()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        return True
+
+    def close(self) -> None:
+        pass
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class InotifyWatcher:
+    """inotify watch on the file's directory, filtered to the file's name."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._name = os.fsencode(self.path.name)
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(fd, os.fsencode(self.path.parent), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"cannot watch {self.path.parent}")
+        self._fd = fd
+
+    def fileno(self) -> Optional[int]:
+        return self._fd
+
+    def changed(self) -> bool:
+        """Drain pending events; True if any concerned the watched file."""
+        hit = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return hit
+            pos = 0
+            while pos < len(data):
+                _, mask, _, length = _EVENT.unpack_from(data, pos)
+                pos += _EVENT.size
+                name = data[pos : pos + length].rstrip(b"\0")
+                pos += length
+                if name == self._name or mask & _IN_Q_OVERFLOW:
+                    hit = True
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+Watcher = Union[InotifyWatcher, StatWatcher]
+
+
+def open_watcher(path: Path) -> Watcher:
+    """The cheapest watcher available here for `path`."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(path)
+        except (OSError, AttributeError):  # no inotify in this libc, or out of watches
+            pass
+    return StatWatcher(path)
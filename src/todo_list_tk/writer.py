@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: writer.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+
+Description:
+Debounced background writer.
+
+The controller hands each committed delta to `BackgroundWriter.submit`,
+which returns immediately. A single daemon thread coalesces everything that
+arrives within the debounce window (keeping only the latest version of each
+task) and issues one `store.commit` for it. The thread keeps its own mirror
+of the task set, so full-rewrite stores never read controller state from a
+second thread.
+
+===========================================================================
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, MutableMapping, Optional
+
+from . import metrics
+from .model import Task
+from .storage import TaskStore
+
+DEFAULT_WRITE_DELAY_MS = int(os.environ.get("TODO_LIST_TK_WRITE_DELAY_MS", "250"))
+
+
+class BackgroundWriter:
+    def __init__(
+        self,
+        store: TaskStore,
+        tasks: Iterable[Task],
+        delay: float = DEFAULT_WRITE_DELAY_MS / 1000,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        *,
+        mirror: Optional[MutableMapping[str, Task]] = None,
+    ) -> None:
+        self.store = store
+        self.delay = delay
+        self.on_error = on_error
+        self.last_error: Optional[BaseException] = None
+        # `mirror` lets a controller with a compact task table keep the copy compact too.
+        self._mirror: MutableMapping[str, Task] = mirror if mirror is not None else {}
+        self._mirror.update((t.id, t) for t in tasks)
+        self._pending: Dict[str, Optional[Task]] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._failed = False
+        self._flush_requested = False
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="todo-list-tk-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> bool:
+        """True while a write is queued or running (a failed write waits for the next submit)."""
+        with self._cond:
+            return self._busy or (bool(self._pending) and not self._failed)
+
+    def submit(self, upserted: Iterable[Task] = (), deleted: Iterable[str] = ()) -> None:
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("writer is closed")
+            for t in upserted:
+                self._pending[t.id] = t
+            for task_id in deleted:
+                self._pending[task_id] = None
+            self._failed = False
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Write everything submitted so far and wait for it (or for a failure)."""
+        with self._cond:
+            if not self._pending and not self._busy:
+                return
+            self._flush_requested = True
+            self._failed = False
+            self._cond.notify_all()
+            while self._busy or (self._pending and not self._failed):
+                self._cond.wait()
+
+    def close(self) -> None:
+        self.flush()
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    # --- thread ---
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closing and (not self._pending or self._failed):
+                    self._cond.wait()
+                if self._closing and (not self._pending or self._failed):
+                    return
+                deadline = time.monotonic() + self.delay
+                while not self._flush_requested and not self._closing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch, self._pending = self._pending, {}
+                self._flush_requested = False
+                self._busy = True
+            try:
+                self._write(batch)
+            except Exception as ex:
+                with self._cond:
+                    for task_id, t in batch.items():
+                        self._pending.setdefault(task_id, t)
+                    self._failed = True
+                self.last_error = ex
+                if self.on_error is not None:
+                    self.on_error(ex)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _write(self, batch: Dict[str, Optional[Task]]) -> None:
+        upserted = [t for t in batch.values() if t is not None]
+        deleted = [i for i, t in batch.items() if t is None and i in self._mirror]
+        removed = {task_id: self._mirror.pop(task_id) for task_id in deleted}
+        for t in upserted:
+            self._mirror[t.id] = t
+        if not (upserted or deleted):
+            return
+        try:
+            with metrics.timer("writer.commit"):
+                self.store.commit(self._mirror.values(), upserted=upserted, deleted=deleted)
+        except Exception:
+            # Keep deleted ids known so the retry still sends their deletion.
+            self._mirror.update(removed)
+            raise
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_archive.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+
+from todo_list_tk.archive import Archive
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task
+from todo_list_tk.storage import JsonStore
+from todo_list_tk.utils import new_id
+
+
+def _done(title: str, updated_at: str) -> Task:
+    return Task(id=new_id(), title=title, done=True, updated_at=updated_at)
+
+
+def test_archive_pages_newest_first_across_segments(tmp_path):
+    a = Archive(tmp_path / "tasks.archive")
+    assert len(a) == 0 and a.page(0, 10) == []
+    a.append([_done("Old", "2026-01-05T10:00:00"), _done("Newer", "2026-03-02T10:00:00")])
+    a.append([_done("Newest", "2026-03-09T10:00:00"), _done("Undated", "")])
+
+    fresh = Archive(tmp_path / "tasks.archive")  # everything from the index and segments
+    assert len(fresh) == 4
+    assert fresh.buckets() == [("2026-03", 2), ("2026-01", 1), ("undated", 1)]
+    assert [t.title for t in fresh.page(0, 10)] == ["Newest", "Newer", "Old", "Undated"]
+    assert [t.title for t in fresh.page(1, 3)] == ["Newer", "Old"]
+    assert [t.title for t in fresh.search("new")] == ["Newest", "Newer"]
+    assert [t.title for t in fresh.search("ne", limit=1)] == ["Newest"]
+    assert fresh.search("older") == []
+
+
+def test_torn_append_is_recounted_and_cut_off(tmp_path):
+    a = Archive(tmp_path / "tasks.archive")
+    a.append([_done("Kept", "2026-02-01T00:00:00")])
+    segment = tmp_path / "tasks.archive" / "2026-02.jsonl.gz"
+    good = segment.read_bytes()
+    segment.write_bytes(good + good[: len(good) // 2])  # a crash halfway through the next append
+
+    b = Archive(tmp_path / "tasks.archive")
+    assert [t.title for t in b.page(0, 5)] == ["Kept"]
+    b.append([_done("Next", "2026-02-03T00:00:00")])
+    assert [t.title for t in Archive(tmp_path / "tasks.archive").page(0, 5)] == ["Next", "Kept"]
+
+
+def test_controller_archives_old_done_tasks_in_one_save(tmp_path):
+    store = JsonStore(tmp_path / "tasks.json")
+    c = Controller(store)
+    old, recent, _ = (c.add_task(title) for title in ("Old chore", "Recent chore", "Open"))
+    c.put_tasks([replace(old, done=True, updated_at="2020-01-01T00:00:00")])
+    c.toggle_task(recent.id)
+    saves = store.generation
+
+    assert c.archive_completed(timedelta(days=30)) == 1
+    assert store.generation == saves + 1
+    assert [t.title for t in c.view("all")] == ["Recent chore", "Open"]
+    assert [t.title for t in c.view("archive")] == ["Old chore"]
+    assert [t.title for t in c.search("chore", within="archive")] == ["Old chore"]
+    assert not c.can_undo
+
+    assert c.archive_completed() == 1
+    assert [t.title for t in Controller(JsonStore(tmp_path / "tasks.json")).view("archive")] == [
+        "Recent chore", "Old chore",
+    ]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_binary_store.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from todo_list_tk.binary_store import (
+    BinarySnapshot,
+    BinaryStore,
+    export_json,
+    import_json,
+    load_binary,
+    save_binary,
+)
+from todo_list_tk.model import Task, Priority
+from todo_list_tk.storage import load_tasks, open_store, save_tasks
+
+TASKS = [
+    Task(id="1", title="Alpha", created_at="2025-10-25T09:30:00", updated_at="2025-10-25T09:30:00"),
+    Task(id="2", title="Beta ✓", done=True, priority=Priority.HIGH, due="2025-11-01", rank="i"),
+    Task(id="4", title="Water plants", due="2025-11-03", repeat="FREQ=WEEKLY", repeat_done="2;4"),
+    Task(id="5", title="Stretch", due="2025-11-03T07:30", repeat="FREQ=DAILY"),
+    Task(id="3", title="Alpha", created_at="2025-10-25T09:30:00.123456", updated_at="yesterday"),
+]
+
+
+def test_roundtrip_and_random_access(tmp_path: Path):
+    path = tmp_path / "tasks.bin"
+    save_binary(TASKS, path)
+    assert load_binary(path) == TASKS
+    with BinarySnapshot(path) as snap:
+        assert len(snap) == len(TASKS)
+        assert snap[-1] == TASKS[-1]
+        assert snap[1:2] == [TASKS[1]]
+
+
+def test_corruption_is_detected(tmp_path: Path):
+    path = tmp_path / "tasks.bin"
+    save_binary(TASKS, path)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="checksum"):
+        BinarySnapshot(path)
+
+
+def test_json_import_export(tmp_path: Path):
+    src, bin_path, dst = tmp_path / "in.json", tmp_path / "tasks.bin", tmp_path / "out.json"
+    save_tasks(TASKS, src)
+    assert import_json(src, bin_path) == len(TASKS)
+    assert bin_path.stat().st_size < src.stat().st_size
+    assert export_json(bin_path, dst) == len(TASKS)
+    assert load_tasks(dst) == TASKS
+
+    store = BinaryStore(bin_path)
+    assert [t for chunk in store.iter_load(2) for t in chunk] == TASKS
+
+
+def test_open_store_migrates_json(tmp_path: Path):
+    json_path = tmp_path / "tasks.json"
+    save_tasks(TASKS, json_path)
+    store = open_store(json_path, backend="binary")
+    assert isinstance(store, BinaryStore)
+    assert store.path == tmp_path / "tasks.bin"
+    assert store.load() == TASKS
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_cli.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from todo_list_tk.cli import main
+from todo_list_tk.storage import load_tasks
+
+
+def test_add_toggle_delete(tmp_path: Path, capsys):
+    path = tmp_path / "tasks.json"
+    assert main(["--path", str(path), "add", "Alpha", "Beta", "--priority", "high"]) == 0
+    alpha_id, beta_id = capsys.readouterr().out.split()
+    assert main(["--path", str(path), "toggle", alpha_id[:6]]) == 0
+    assert main(["--path", str(path), "delete", beta_id]) == 0
+    [task] = load_tasks(path)
+    assert (task.title, task.done, task.priority.value) == ("Alpha", True, "high")
+    assert main(["--path", str(path), "toggle", "no-such-id"]) == 1
+
+    capsys.readouterr()
+    assert main(["--path", str(path), "archive"]) == 0
+    assert load_tasks(path) == []
+    assert main(["--path", str(path), "list", "--filter", "archive", "--format", "jsonl"]) == 0
+    assert [json.loads(line)["title"] for line in capsys.readouterr().out.splitlines()[1:]] == ["Alpha"]
+
+
+def test_lists_are_separate_stores(tmp_path: Path, capsys):
+    path = tmp_path / "tasks.json"
+    assert main(["--path", str(path), "lists", "--create", "Work"]) == 0
+    assert capsys.readouterr().out.split() == ["work"]
+    assert main(["--path", str(path), "--list", "Work", "add", "Report"]) == 0
+    assert main(["--path", str(path), "add", "Groceries"]) == 0
+    assert [t.title for t in load_tasks(tmp_path / "lists" / "work.json")] == ["Report"]
+    assert [t.title for t in load_tasks(path)] == ["Groceries"]
+    capsys.readouterr()
+    assert main(["--path", str(path), "lists"]) == 0
+    assert "Work  (1 active / 1 total)" in capsys.readouterr().out
+    assert main(["--path", str(path), "--list", "nope", "list"]) == 1
+
+
+def test_repeat_and_upcoming(tmp_path: Path, capsys):
+    path, src = tmp_path / "tasks.json", tmp_path / "in.csv"
+    src.write_text("title,due\nStandup,2030-01-07T09:30\n", "utf-8")  # a Monday
+    assert main(["--path", str(path), "import", str(src)]) == 0
+    task_id = load_tasks(path)[0].id
+    assert main(["--path", str(path), "repeat", task_id, "weekdays"]) == 0
+    assert main(["--path", str(path), "toggle", task_id]) == 0
+    capsys.readouterr()
+    assert main(["--path", str(path), "upcoming", "--limit", "2"]) == 0
+    assert [line.split("  ")[0] for line in capsys.readouterr().out.splitlines()] == [
+        "2030-01-08 09:30", "2030-01-09 09:30",
+    ]
+    assert main(["--path", str(path), "repeat", task_id]) == 0
+    [task] = load_tasks(path)
+    assert (task.repeat, task.repeat_done, task.done) == (None, None, False)
+    assert main(["--path", str(path), "repeat", task_id, "sometimes"]) == 1
+
+
+def test_csv_import_and_jsonl_export(tmp_path: Path, capsys):
+    path, src = tmp_path / "tasks.json", tmp_path / "in.csv"
+    src.write_text("title,done,priority,due\nAlpha,1,low,\nBeta,,,2026-01-01\n", "utf-8")
+    assert main(["--path", str(path), "import", str(src)]) == 0
+    capsys.readouterr()
+    assert main(["--path", str(path), "export", "-"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["title"], r["done"], r["priority"], r["due"]) for r in records] == [
+        ("Alpha", True, "low", None),
+        ("Beta", False, "medium", "2026-01-01"),
+    ]
+
+    src.write_text("title\nGamma\n,\n", "utf-8")  # second row has no title: nothing is imported
+    assert main(["--path", str(path), "import", str(src)]) == 1
+    assert len(load_tasks(path)) == 2
+
+
+def test_cli_does_not_import_tkinter():
+    code = "import sys, todo_list_tk.cli; sys.exit('tkinter' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_concurrency.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task
+from todo_list_tk.storage import JsonStore, load_snapshot, open_store
+
+WRITERS = 4
+TASKS_PER_WRITER = 25
+
+# Each writer adds its tasks one save at a time, then completes every other one.
+WORKER = """
+import sys
+from pathlib import Path
+from todo_list_tk.controller import Controller
+from todo_list_tk.storage import open_store
+
+path, backend, worker, n = Path(sys.argv[1]), sys.argv[2], sys.argv[3], int(sys.argv[4])
+c = Controller(open_store(path, backend))
+added = [c.add_task(f"w{worker}-{i}") for i in range(n)]
+for t in added[::2]:
+    c.toggle_task(t.id)
+c.close()
+"""
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "binary", "sqlite"])
+def test_concurrent_writers_lose_no_updates(tmp_path: Path, backend: str):
+    path = tmp_path / "tasks.json"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER, str(path), backend, str(w), str(TASKS_PER_WRITER)],
+            env=env,
+        )
+        for w in range(WRITERS)
+    ]
+    assert [p.wait(timeout=120) for p in procs] == [0] * WRITERS
+
+    store = open_store(path, backend)
+    tasks = {t.title: t for t in store.load()}
+    store.close()
+    assert len(tasks) == WRITERS * TASKS_PER_WRITER
+    for w in range(WRITERS):
+        for i in range(TASKS_PER_WRITER):
+            assert tasks[f"w{w}-{i}"].done is (i % 2 == 0)
+
+
+def test_stale_writer_merges_instead_of_overwriting(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    a = Controller(JsonStore(path))
+    x = a.add_task("Alpha")
+    y = a.add_task("Beta")
+
+    b = Controller(JsonStore(path))
+    b.rename_task(x.id, "Alpha (from B)")
+    b.add_task("Gamma")
+
+    a.toggle_task(y.id)  # A has not seen B's changes
+    tasks, generation = load_snapshot(path)
+    assert {t.title: t.done for t in tasks} == {"Alpha (from B)": False, "Beta": True, "Gamma": False}
+    assert generation == 5
+
+
+def test_newer_edit_wins_per_task(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    old = Task(id="1", title="Original", updated_at="2026-01-01T00:00:00")
+    a, b = JsonStore(path), JsonStore(path)
+    a.commit([old], upserted=[old])
+    a.load()
+    b.load()
+
+    newer = Task(id="1", title="Newer", updated_at="2026-01-02T00:00:00")
+    older = Task(id="1", title="Older", updated_at="2026-01-01T12:00:00")
+    b.commit([newer], upserted=[newer])
+    a.commit([older], upserted=[older])  # conflicts with B's newer edit
+    assert [t.title for t in JsonStore(path).load()] == ["Newer"]
+
+    newest = Task(id="1", title="Newest", updated_at="2026-01-03T00:00:00")
+    b.commit([newest], upserted=[newest])
+    a.commit([], deleted=["1"])  # A deletes the version it last saw; B's edit is newer
+    assert [t.title for t in JsonStore(path).load()] == ["Newest"]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_controller.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task
+from todo_list_tk.storage import MemoryStore
+
+
+def test_index_follows_add_delete_and_clear():
+    c = Controller(MemoryStore())
+    a, b, d = (c.add_task(title) for title in ("Alpha", "Beta", "Delta"))
+    c.toggle_task(b.id)
+    assert c.get(b.id).done is True
+
+    c.delete_task(a.id)
+    with pytest.raises(KeyError):
+        c.get(a.id)
+
+    assert c.clear_completed() == 1
+    assert b.id not in c
+    assert [t.id for t in c.tasks] == [d.id]
+    assert c.rename_task(d.id, "Gamma").title == "Gamma"
+
+
+class CountingStore(MemoryStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.commits = 0
+
+    def commit(self, tasks, upserted=(), deleted=()) -> None:
+        self.commits += 1
+
+
+def test_batch_saves_once():
+    store = CountingStore()
+    c = Controller(store)
+    tasks = c.add_tasks(f"Task {i}" for i in range(50))
+    c.toggle_many(t.id for t in tasks[:10])
+    assert c.delete_many(t.id for t in tasks[40:]) == 10
+    assert store.commits == 3
+    assert c.count() == 40
+    assert c.count(done=True) == 10
+
+
+def test_batch_rolls_back_on_error():
+    c = Controller(MemoryStore())
+    a, b, _ = c.add_tasks(["Alpha", "Beta", "Delta"])
+    with pytest.raises(KeyError):
+        with c.batch():
+            c.toggle_task(a.id)
+            c.delete_task(b.id)
+            c.add_task("Gamma")
+            c.delete_task("missing")
+    assert [(t.title, t.done) for t in c.tasks] == [("Alpha", False), ("Beta", False), ("Delta", False)]
+
+
+def test_events_published_per_operation():
+    c = Controller(MemoryStore())
+    seen = []
+    c.subscribe(lambda events: seen.append([(e.kind, e.task_id) for e in events]))
+    a = c.add_task("Alpha")
+    with c.batch():
+        c.toggle_task(a.id)
+        b = c.add_task("Beta")
+    with pytest.raises(KeyError):
+        c.delete_many([b.id, "missing"])
+    c.clear_completed()
+    assert seen == [
+        [("added", a.id)],
+        [("updated", a.id), ("added", b.id)],
+        [("removed", a.id)],
+    ]
+
+
+def test_streaming_load_defers_writes_until_loaded():
+    store = CountingStore()
+    store.tasks = [Task(id=str(i), title=f"Task {i}") for i in range(10)]
+    c = Controller(store, streaming=True, chunk_size=4)
+    events = []
+    c.subscribe(events.append)
+    assert c.loading and len(c) == 0
+
+    assert c.load_next_chunk()
+    assert [e.kind for e in events[0]] == ["added"] * 4
+    added = c.add_task("New")
+    c.delete_task("0")
+    assert store.commits == 0
+
+    c.load_all()
+    assert not c.loading
+    assert store.commits == 1
+    assert len(c) == 10 and added.id in c and "0" not in c
+
+
+def test_undo_redo_restores_tasks_in_place_with_one_save():
+    class CountingStore(MemoryStore):
+        commits = 0
+
+        def commit(self, tasks, upserted=(), deleted=()):
+            self.commits += 1
+
+    store = CountingStore()
+    c = Controller(store)
+    tasks = c.add_tasks([f"Task {i}" for i in range(2000)])
+    c.toggle_many([t.id for t in tasks[::2]])
+    c.rename_task(tasks[1].id, "Renamed")
+    assert c.clear_completed() == 1000
+
+    before = store.commits
+    assert c.undo()
+    assert store.commits == before + 1
+    assert [t.title for t in c.view("all")][:3] == ["Task 0", "Renamed", "Task 2"]
+    assert c.stats.done == 1000
+
+    assert c.undo()  # the rename
+    assert c.get(tasks[1].id).title == "Task 1"
+    assert c.redo() and c.redo()
+    assert c.get(tasks[1].id).title == "Renamed" and len(c) == 1000
+    assert not c.redo()
+
+    assert c.undo() and c.can_redo
+    c.add_task("New")  # a new operation drops what was undone
+    assert not c.can_redo
+
+
+def test_history_caps_steps_and_memory():
+    c = Controller(MemoryStore(), history_steps=3)
+    t = c.add_task("A")
+    for title in "BCDE":
+        c.rename_task(t.id, title)
+    assert c.undo() and c.undo() and c.undo() and not c.undo()
+    assert c.get(t.id).title == "B"
+
+    c = Controller(MemoryStore(), history_bytes=10_000)
+    c.add_tasks([f"Task {i}" for i in range(100)])
+    c.toggle_many([t.id for t in c.tasks])
+    c.clear_completed()  # too big to keep: the history is dropped
+    assert not c.can_undo
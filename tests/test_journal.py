@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_journal.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.journal import JournalStore, journal_path_for
+from todo_list_tk.storage import load_tasks
+
+
+def test_replay_and_compact(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    c = Controller(JournalStore(path, compact_threshold=100, fsync=False))
+    a = c.add_task("Alpha")
+    b = c.add_task("Beta")
+    c.toggle_task(b.id)
+    c.delete_task(a.id)
+    c.close()
+
+    assert load_tasks(path) == []  # snapshot untouched, everything is in the journal
+    loaded = JournalStore(path, fsync=False).load()
+    assert [(t.title, t.done) for t in loaded] == [("Beta", True)]
+
+    store = JournalStore(path, fsync=False)
+    store.compact()
+    assert journal_path_for(path).read_text("utf-8") == ""
+    assert [t.title for t in load_tasks(path)] == ["Beta"]
+
+
+def test_compact_keeps_records_of_other_processes(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    store = JournalStore(path, fsync=False)
+    c = Controller(store)
+    c.add_task("Ours")
+
+    other = Controller(JournalStore(path, fsync=False))
+    other.add_task("Theirs")
+    other.close()
+
+    store.compact()
+    assert journal_path_for(path).read_text("utf-8") == ""
+    assert sorted(t.title for t in load_tasks(path)) == ["Ours", "Theirs"]
+    c.close()
+
+
+def test_torn_tail_is_discarded(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    c = Controller(JournalStore(path, fsync=False))
+    c.add_task("Alpha")
+    c.close()
+    with open(journal_path_for(path), "a", encoding="utf-8") as fh:
+        fh.write('{"op":"put","task":{"id":"x"')
+
+    store = JournalStore(path, fsync=False)
+    assert [t.title for t in store.load()] == ["Alpha"]
+    assert journal_path_for(path).read_text("utf-8").endswith("}\n")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_lists.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.lists import DEFAULT_LIST, ListManifest
+from todo_list_tk.storage import load_tasks
+
+
+def _manifest(home: Path) -> ListManifest:
+    return ListManifest(home, home / "tasks.json")
+
+
+def test_manifest_merges_lists_from_other_processes(tmp_path):
+    a, b = _manifest(tmp_path), _manifest(tmp_path)
+    assert [info.id for info in a] == [DEFAULT_LIST]
+    work = a.create("Work stuff")
+    other = b.create("Work  Stuff!")  # b has not seen "work-stuff" yet
+    assert (work.id, other.id) == ("work-stuff", "work-stuff-2")
+    a.rename(work.id, "Office")
+    assert [info.name for info in _manifest(tmp_path)] == ["Tasks", "Office", "Work  Stuff!"]
+    assert a.find("office") is a[work.id] and a.path_for(work.id) == tmp_path / "lists" / "work-stuff.json"
+    with pytest.raises(ValueError):
+        a.remove(DEFAULT_LIST)
+    with pytest.raises(ValueError):
+        a.create("  ")
+
+
+def test_lists_load_lazily_and_only_changed_lists_are_written(tmp_path):
+    lists = _manifest(tmp_path)
+    home_id, work_id, errands_id = DEFAULT_LIST, lists.create("Work").id, lists.create("Errands").id
+    c = Controller(lists=lists, list_cache=2)
+    c.add_task("Home chore")
+    c.open_list(work_id)
+    assert [t.title for t in c.tasks] == []
+    c.add_task("Report")
+    c.toggle_task(c.add_task("Email").id)
+    assert c.undo() and [(t.title, t.done) for t in c.tasks] == [("Report", False), ("Email", False)]
+
+    c.open_list(home_id)  # still cached: the same controller state comes back
+    assert [t.title for t in c.tasks] == ["Home chore"] and list(c._shards) == [work_id]
+    home_file = tmp_path / "tasks.json"
+    written = home_file.stat().st_mtime_ns
+    c.open_list(errands_id)  # evicts "work", the least recently used
+    assert list(c._shards) == [home_id]
+    assert [t.title for t in load_tasks(lists.path_for(work_id))] == ["Report", "Email"]
+    c.open_list(work_id)  # read back from disk
+    assert [(t.title, t.done) for t in c.tasks] == [("Report", False), ("Email", False)]
+    assert not c.can_undo  # history went with the evicted list
+    c.close()
+
+    assert home_file.stat().st_mtime_ns == written
+    counts = {info.id: (info.total, info.active) for info in _manifest(tmp_path)}
+    assert counts == {home_id: (1, 1), work_id: (2, 2), errands_id: (0, 0)}
+    assert _manifest(tmp_path).current == work_id
+
+
+def test_cached_list_catches_up_with_other_writers(tmp_path):
+    lists = _manifest(tmp_path)
+    work_id = lists.create("Work").id
+    c = Controller(lists=lists)
+    gone = c.add_task("Stale")
+    c.open_list(work_id)
+
+    other = Controller(lists=_manifest(tmp_path), list_id=DEFAULT_LIST)
+    other.delete_task(gone.id)
+    other.add_task("Added elsewhere")
+    other.close()
+
+    c.open_list(DEFAULT_LIST)  # from the cache, as it was
+    assert [t.title for t in c.tasks] == ["Stale"]
+    assert c.reload_external() == 2
+    assert [t.title for t in c.tasks] == ["Added elsewhere"]
+    c.close()
+
+
+def test_deleting_a_list_removes_its_files(tmp_path):
+    lists = _manifest(tmp_path)
+    old = lists.create("Old")
+    c = Controller(lists=lists, list_id=old.id)
+    c.add_task("Gone soon")
+    with pytest.raises(ValueError):
+        c.delete_list(old.id)
+    c.open_list(DEFAULT_LIST)
+    c.delete_list(old.id)
+    c.close()
+    assert old.id not in _manifest(tmp_path)
+    assert list((tmp_path / "lists").iterdir()) == []
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_metrics.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from todo_list_tk import metrics
+from todo_list_tk.controller import Controller
+from todo_list_tk.storage import JsonStore, MemoryStore
+
+
+@pytest.fixture
+def recording():
+    was = metrics.enabled
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.enable(was)
+    metrics.reset()
+
+
+def test_histogram_percentiles():
+    h = metrics.Histogram()
+    for us in (1, 3, 3, 100, 5000):
+        h.observe(us / 1e6)
+    d = h.to_dict()
+    assert d["count"] == 5
+    assert d["p50_ms"] == pytest.approx(0.004)  # 3 us falls in the [2, 4) us bucket
+    assert d["max_ms"] == pytest.approx(5.0)
+
+
+def test_disabled_records_nothing():
+    was = metrics.enabled
+    metrics.enable(False)
+    try:
+        Controller(MemoryStore()).add_task("Alpha")
+        assert metrics.snapshot()["histograms"] == {}
+    finally:
+        metrics.enable(was)
+
+
+def test_records_controller_and_storage(tmp_path: Path, recording):
+    c = Controller(JsonStore(tmp_path / "tasks.json"))
+    t = c.add_task("Alpha")
+    c.toggle_task(t.id)
+    snap = metrics.snapshot()
+    assert snap["histograms"]["controller.add_task"]["count"] == 1
+    assert snap["histograms"]["storage.save_tasks"]["count"] == 2
+    assert snap["counters"]["storage.bytes_written"] > 0
+
+    metrics.dump(tmp_path / "metrics.json")
+    assert "controller.toggle_task" in json.loads((tmp_path / "metrics.json").read_text())["histograms"]
+    assert "controller.add_task" in metrics.format_report()
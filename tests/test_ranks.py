@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_ranks.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from todo_list_tk.ranks import rank_between, ranks_between
+
+
+def test_rank_between_always_fits():
+    rng = random.Random(7)
+    ranks = [rank_between(None, None)]
+    for _ in range(2_000):
+        i = rng.randrange(len(ranks) + 1)
+        lo = ranks[i - 1] if i else None
+        hi = ranks[i] if i < len(ranks) else None
+        r = rank_between(lo, hi)
+        assert (lo is None or lo < r) and (hi is None or r < hi) and not r.endswith("0")
+        ranks.insert(i, r)
+    assert ranks == sorted(ranks)
+    # Repeatedly inserting at the same spot grows the key slowly.
+    r = "i"
+    for _ in range(100):
+        r = rank_between(None, r)
+    assert len(r) <= 25
+    with pytest.raises(ValueError):
+        rank_between("b", "a")
+
+
+def test_ranks_between_are_short_and_ordered():
+    ranks = ranks_between(None, None, 100_000)
+    assert ranks == sorted(set(ranks)) and len(ranks) == 100_000
+    assert max(map(len, ranks)) <= 6
+    assert ranks_between("a", "b", 3) == sorted(ranks_between("a", "b", 3))
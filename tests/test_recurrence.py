@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_recurrence.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import islice
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task
+from todo_list_tk.recurrence import Completions, Series, occurrences, parse_rule
+from todo_list_tk.storage import MemoryStore
+
+
+@pytest.mark.parametrize(
+    "text, canonical",
+    [
+        ("daily", "FREQ=DAILY"),
+        ("Every 2 weeks", "FREQ=WEEKLY;INTERVAL=2"),
+        ("weekdays", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"),
+        ("freq=weekly;byday=th,mo;count=4", "FREQ=WEEKLY;BYDAY=MO,TH;COUNT=4"),
+        ("FREQ=MONTHLY;UNTIL=2027-01-31", "FREQ=MONTHLY;UNTIL=2027-01-31"),
+    ],
+)
+def test_rules_parse_to_canonical_form(text, canonical):
+    assert str(parse_rule(text)) == canonical
+    assert parse_rule(canonical) == parse_rule(text)
+
+
+@pytest.mark.parametrize(
+    "text", ["sometimes", "every 0 days", "FREQ=HOURLY", "FREQ=DAILY;BYDAY=MO", "FREQ=DAILY;X=1"]
+)
+def test_invalid_rules_are_rejected(text):
+    with pytest.raises(ValueError):
+        parse_rule(text)
+
+
+def test_occurrences_are_addressable_without_walking_the_series():
+    start = datetime(2026, 1, 31, 9, 0)  # a Saturday
+    monthly = Series(parse_rule("monthly"), start)
+    assert [monthly.at(i).date().isoformat() for i in range(4)] == [
+        "2026-01-31", "2026-02-28", "2026-03-31", "2026-04-30",
+    ]
+    weekly = Series(parse_rule("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,SA,SU;COUNT=5"), start)
+    assert [weekly.at(i).strftime("%a %d") for i in range(5)] == [
+        "Sat 31", "Sun 01", "Mon 09", "Sat 14", "Sun 15",
+    ]
+    assert weekly.at(5) is None and weekly.end == 5
+
+    rules = ("daily", "every 3 days", "weekdays", "FREQ=WEEKLY;INTERVAL=3;BYDAY=TU,FR", "monthly")
+    for rule in rules:
+        s = Series(parse_rule(rule), start)
+        dates = [s.at(i) for i in range(400)]
+        later = start + timedelta(days=59, hours=10)
+        for when in (start, start + timedelta(days=1), later, dates[-1]):
+            i = s.index_from(when)
+            assert dates[i] >= when and (i == 0 or dates[i - 1] < when), (rule, when)
+
+
+def test_completions_stay_compact():
+    c = Completions()
+    for i in (0, 1, 3, 2, 6):
+        c = c.add(i)
+    assert str(c) == "4;6" and Completions.parse(str(c)) == c
+    assert c.first_open() == 4 and c.first_open(5) == 5 and 6 in c and 5 not in c
+    assert str(c.discard(6)) == "4" and str(c.discard(1)) == "1;2,3,6"
+
+
+def test_toggling_a_recurring_task_completes_one_occurrence():
+    c = Controller(MemoryStore())
+    t = c.add_task("Stretch")
+    c.set_due(t.id, "2000-01-03T07:30")  # a Monday, long ago
+    t = c.set_repeat(t.id, "FREQ=DAILY;COUNT=3")
+    assert c.view("overdue")[0].id == t.id and c.stats.overdue() == 1
+
+    for expected in ("1", "2"):
+        t = c.toggle_task(t.id)
+        assert (t.done, t.repeat_done) == (False, expected)
+    assert t.due_at() == datetime(2000, 1, 5, 7, 30)
+    t = c.toggle_task(t.id)  # the last one: the task is finished
+    assert t.done and t.due_at() is None and c.upcoming() == []
+    assert c.undo() and not c.get(t.id).done and c.get(t.id).repeat_done == "2"
+    with pytest.raises(ValueError):
+        c.set_due(t.id, None)
+
+
+def test_upcoming_merges_occurrences_across_many_rules():
+    c = Controller(MemoryStore())
+    start = datetime(2026, 3, 1)
+    rules = ["daily", "every 2 days", "weekdays", "weekly", "monthly", "FREQ=WEEKLY;BYDAY=TU,SA"]
+    with c.batch():
+        for k in range(300):
+            t = c.add_task(f"Chore {k}")
+            c.set_due(t.id, (start + timedelta(hours=k)).isoformat(timespec="minutes"))
+            c.set_repeat(t.id, rules[k % len(rules)])
+    done = c.add_task("Finished")
+    c.set_repeat(done.id, "daily")
+    c.toggle_many([done.id] * 3)
+    c.set_due(done.id, "2026-03-01")
+
+    window_start = start + timedelta(days=40)
+    expected = sorted(
+        o for t in c.tasks for o in islice(occurrences(t, window_start), 60)
+    )[:500]
+    assert c.upcoming(500, window_start) == expected
+    end = window_start + timedelta(days=2)
+    assert list(c.occurrences(window_start, end)) == [o for o in expected if o.at < end]
+    assert all(c.get(o.task_id).repeat for o in expected)
+    one_off = Task(id="x", title="One-off", due="2026-03-01")
+    assert one_off.due_at() == datetime(2026, 3, 1, 23, 59, 59)
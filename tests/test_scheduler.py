@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_scheduler.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.scheduler import DueScheduler
+from todo_list_tk.storage import MemoryStore
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat(timespec="seconds")
+
+
+def test_scheduler_reports_each_deadline_once_in_order():
+    now = datetime.now()
+    c = Controller(MemoryStore())
+    a, b, gone, done = (c.add_task(title) for title in "ABCD")
+    c.set_due(b.id, _iso(now + timedelta(hours=1)))
+    c.set_due(a.id, _iso(now + timedelta(hours=2)))
+    c.set_due(gone.id, _iso(now + timedelta(minutes=30)))
+    c.set_due(done.id, _iso(now + timedelta(minutes=10)))
+    c.toggle_task(done.id)
+    c.delete_task(gone.id)
+    c.rename_task(b.id, "B renamed")  # same deadline: still scheduled once
+
+    assert c.next_deadline() == datetime.fromisoformat(c.get(b.id).due)
+    assert c.pop_due(now + timedelta(minutes=90)) == [c.get(b.id)]
+    assert c.pop_due(now + timedelta(days=1)) == [c.get(a.id)]
+    assert c.pop_due(now + timedelta(days=2)) == [] and c.next_deadline() is None
+
+
+def test_past_deadlines_are_overdue_not_scheduled():
+    c = Controller(MemoryStore())
+    late = c.add_task("Late")
+    later = c.add_task("Later")
+    c.add_task("No due")
+    c.set_due(later.id, "2000-01-02")
+    c.set_due(late.id, "2000-01-01")
+    assert c.next_deadline() is None
+    assert [t.title for t in c.view("overdue")] == ["Late", "Later"]
+    assert [t.title for t in c.view("overdue")[::-1]] == ["Later", "Late"]
+    assert [t.title for t in c.search("la", within="overdue")] == ["Late", "Later"]
+    c.toggle_task(late.id)
+    assert [t.title for t in c.view("overdue")] == ["Later"]
+    with pytest.raises(ValueError):
+        c.set_due(later.id, "tomorrow")
+
+
+def test_scheduler_heap_is_rebuilt_when_stale():
+    s = DueScheduler()
+    c = Controller(MemoryStore())
+    t = c.add_task("Moving target")
+    base = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    for k in range(500):
+        before, t = t, t.set_due(_iso(base + timedelta(minutes=k)))
+        s.update(before, t)
+    assert len(s) == 1 and len(s._heap) <= 2 * len(s) + 64
+    assert s.next_deadline() == base + timedelta(minutes=499)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_search.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.storage import MemoryStore
+
+
+def test_prefix_search_is_ranked_and_incremental():
+    c = Controller(MemoryStore())
+    milk, bread, mail = c.add_tasks(["Buy milk", "Buy bread and milk", "Answer mail"])
+    assert [t.id for t in c.search("mil")] == [milk.id, bread.id]
+    assert [t.id for t in c.search("buy milk")] == [milk.id, bread.id]
+    assert c.search("bu mai") == []
+
+    c.rename_task(mail.id, "Buy stamps for mail")
+    assert [t.id for t in c.search("bu mai")] == [mail.id]
+    c.toggle_task(bread.id)
+    assert [t.id for t in c.search("milk", within="active")] == [milk.id]
+    c.clear_completed()
+    c.delete_task(milk.id)
+    assert c.search("milk") == []
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_server.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.events import TaskEvent
+from todo_list_tk.model import Task
+from todo_list_tk.server import ApiServer, ChangeLog
+from todo_list_tk.storage import MemoryStore
+
+
+class Client:
+    """One keep-alive connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader, self.writer = reader, writer
+
+    async def request(
+        self, method: str, target: str, body: Any = None, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], Any]:
+        data = json.dumps(body).encode() if body is not None else b""
+        head = [f"{method} {target} HTTP/1.1", "Host: localhost", f"Content-Length: {len(data)}"]
+        head += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + data)
+        status = int((await self.reader.readline()).split()[1])
+        reply: Dict[str, str] = {}
+        while (line := await self.reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            reply[name.lower()] = value.strip()
+        payload = await self.reader.readexactly(int(reply["content-length"]))
+        return status, reply, json.loads(payload) if payload else None
+
+
+def run(scenario) -> None:
+    async def main() -> None:
+        c = Controller(MemoryStore([Task(id=f"t{i}", title=f"Task {i}") for i in range(250)]))
+        server = ApiServer(c)
+        await server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        try:
+            await scenario(c, Client(reader, writer))
+        finally:
+            writer.close()
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_paging_and_etags_over_one_connection():
+    async def scenario(c: Controller, client: Client) -> None:
+        status, headers, page = await client.request("GET", "/tasks?limit=100&offset=200")
+        assert status == 200 and page["total"] == 250 and len(page["tasks"]) == 50
+        assert page["tasks"][0]["title"] == "Task 200"
+        etag = headers["etag"]
+        status, _, _ = await client.request("GET", "/tasks?limit=100&offset=200", headers={"If-None-Match": etag})
+        assert status == 304
+
+        status, _, body = await client.request("PATCH", "/tasks/t200", {"done": True})
+        assert status == 200 and body["task"]["done"] is True and c.get("t200").done
+        status, headers, _ = await client.request("GET", "/tasks?limit=100&offset=200", headers={"If-None-Match": etag})
+        assert status == 200 and headers["etag"] != etag
+        status, _, page = await client.request("GET", "/tasks?filter=done")
+        assert [t["id"] for t in page["tasks"]] == ["t200"]
+
+        assert (await client.request("GET", "/tasks?filter=bogus"))[0] == 400
+        assert (await client.request("PATCH", "/tasks/t1", {"title": " "}))[0] == 400
+        assert (await client.request("GET", "/tasks/nope"))[0] == 404
+
+    run(scenario)
+
+
+def test_changes_since_returns_only_deltas_and_long_polls():
+    async def scenario(c: Controller, client: Client) -> None:
+        _, _, page = await client.request("GET", "/tasks?limit=1")
+        start = page["generation"]
+        status, _, created = await client.request("POST", "/tasks", {"title": "New", "priority": "high"})
+        assert status == 201 and created["task"]["priority"] == "high"
+        assert (await client.request("DELETE", "/tasks/t3"))[0] == 204
+
+        _, _, delta = await client.request("GET", f"/changes?since={start}")
+        assert [t["title"] for t in delta["upserted"]] == ["New"] and delta["deleted"] == ["t3"]
+        assert delta["generation"] == start + 2
+
+        # Nothing new: the request waits until another client changes something.
+        poll = asyncio.ensure_future(client.request("GET", f"/changes?since={delta['generation']}&wait=5"))
+        await asyncio.sleep(0.05)
+        assert not poll.done()
+        c.rename_task("t1", "Renamed")
+        _, _, delta = await asyncio.wait_for(poll, 2)
+        assert [t["title"] for t in delta["upserted"]] == ["Renamed"]
+
+        _, _, reset = await client.request("GET", "/changes?since=1&epoch=other")
+        assert reset["reset"] is True
+
+    run(scenario)
+
+
+def test_change_log_forgets_old_tombstones():
+    log = ChangeLog(max_tombstones=2)
+    for i in range(4):
+        t = Task(id=f"t{i}", title="x")
+        log.record([TaskEvent.from_change(t.id, None, t)])
+    for i in range(3):
+        t = Task(id=f"t{i}", title="x")
+        log.record([TaskEvent.from_change(t.id, t, None)])
+    assert log.floor == 5 and log.generation == 7
+    assert log.since(4) == ["t1", "t2"] and log.since(0) == ["t3", "t1", "t2"]
+    assert log.changed_at("t0") == 0 and log.changed_at("t3") == 4
+
+
+def test_an_unexpected_error_answers_500_and_keeps_the_connection(caplog):
+    async def scenario(c: Controller, client: Client) -> None:
+        def fail(task_id: str) -> None:
+            raise OSError("disk full")
+
+        c.delete_task = fail  # type: ignore[method-assign]
+        status, _, body = await client.request("DELETE", "/tasks/t1")
+        assert (status, body) == (500, {"error": "Internal Server Error"})
+        assert (await client.request("GET", "/tasks/t1"))[0] == 200
+
+    run(scenario)
+    assert "DELETE /tasks/t1 failed" in caplog.text and "disk full" in caplog.text
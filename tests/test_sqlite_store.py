@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_sqlite_store.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task, Priority
+from todo_list_tk.sqlite_store import SQLiteStore, sqlite_path_for
+from todo_list_tk.storage import open_store, save_tasks
+
+
+def test_upsert_delete_and_queries(tmp_path: Path):
+    c = Controller(SQLiteStore(tmp_path / "tasks.sqlite3"))
+    a = c.add_task("Alpha")
+    b = c.add_task("Beta")
+    c.toggle_task(a.id)
+    c.set_priority(b.id, Priority.HIGH)
+    c.add_task("Gamma")
+
+    assert c.count() == 3
+    assert c.count(done=False) == 2
+    assert [t.title for t in c.filtered(done=True)] == ["Alpha"]
+    assert c.store.count(priority=Priority.HIGH) == 1
+
+    c.delete_task(b.id)
+    c.close()
+    loaded = SQLiteStore(tmp_path / "tasks.sqlite3").load()
+    assert [(t.title, t.done) for t in loaded] == [("Alpha", True), ("Gamma", False)]
+
+
+def test_open_store_migrates_json(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    save_tasks([Task(id="1", title="Alpha"), Task(id="2", title="Beta", done=True)], path)
+
+    store = open_store(path, backend="sqlite")
+    assert sqlite_path_for(path).exists()
+    assert [t.id for t in store.load()] == ["1", "2"]
+    assert store.get("2").done is True
+    store.close()
+
+
+def test_interrupted_migration_is_retried(tmp_path: Path, monkeypatch):
+    path = tmp_path / "tasks.json"
+    save_tasks([Task(id="1", title="Alpha")], path)
+
+    def fail(self, *args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as m:
+        m.setattr(SQLiteStore, "commit", fail)
+        with pytest.raises(KeyboardInterrupt):
+            open_store(path, backend="sqlite")
+    assert not sqlite_path_for(path).exists()
+
+    store = open_store(path, backend="sqlite")
+    assert [t.title for t in store.load()] == ["Alpha"]
+    store.close()
+
+
+def test_version_1_database_gains_new_columns(tmp_path: Path):
+    path = tmp_path / "tasks.sqlite3"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE tasks (id TEXT PRIMARY KEY, title TEXT NOT NULL, done INTEGER NOT NULL DEFAULT 0,"
+            " created_at TEXT NOT NULL, updated_at TEXT NOT NULL, priority TEXT NOT NULL, due TEXT)"
+        )
+        conn.execute("INSERT INTO tasks VALUES ('1', 'Old', 0, 't', 't', 'low', NULL)")
+    conn.close()
+    store = SQLiteStore(path)
+    placed = Task(id="2", title="Placed", rank="i", due="2026-01-05", repeat="FREQ=DAILY")
+    store.commit([], upserted=[placed])
+    assert [(t.title, t.rank, t.repeat) for t in store.load()] == [
+        ("Old", None, None), ("Placed", "i", "FREQ=DAILY"),
+    ]
+    store.close()
@@ -6,7 +6,7 @@ Project: To-Do List (Tkinter)
 File: tests/test_storage.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-10-25
-Updated: 2025-10-25
+Updated: 2026-10-18
 License: MIT License (see LICENSE file for details)
 ===========================================================================
 """
@@ -14,8 +14,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from todo_list_tk.model import Task
-from todo_list_tk.storage import ensure_storage, load_tasks, save_tasks
+from todo_list_tk.storage import ensure_storage, iter_tasks, load_tasks, save_tasks
 
 
 def test_roundtrip(tmp_path: Path):
@@ -26,3 +28,20 @@ def test_roundtrip(tmp_path: Path):
     loaded = load_tasks(path)
     assert [t.title for t in loaded] == ["Alpha", "Beta"]
     assert loaded[1].done is True
+
+
+def test_iter_tasks_streams_in_chunks(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    titles = ['say "tasks": [', "a ] b }", "ünïcode ✓"] + [f"Task {i}" for i in range(20)]
+    save_tasks([Task(id=str(i), title=t) for i, t in enumerate(titles)], path)
+    chunks = list(iter_tasks(path, chunk_size=7, block_size=16))
+    assert [len(c) for c in chunks] == [7, 7, 7, 2]
+    assert [t for c in chunks for t in c] == load_tasks(path)
+
+
+def test_iter_tasks_rejects_truncated_file(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    save_tasks([Task(id="1", title="Alpha"), Task(id="2", title="Beta")], path)
+    path.write_text(path.read_text("utf-8")[:-20], "utf-8")
+    with pytest.raises(ValueError):
+        list(iter_tasks(path, block_size=8))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_tables.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Priority, Task
+from todo_list_tk.storage import MemoryStore
+from todo_list_tk.tables import TaskDict, TaskTable
+from todo_list_tk.utils import new_id
+
+
+def _tasks(n: int):
+    return [
+        Task(id=new_id(), title=f"Task {i % 7}", done=i % 3 == 0, priority=list(Priority)[i % 3],
+             due="2026-01-02" if i % 4 == 0 else None)
+        for i in range(n)
+    ]
+
+
+def test_table_round_trips_packed_and_unpacked_tasks():
+    odd = [
+        Task(id="not-a-uuid", title="Odd id"),
+        Task(id=new_id(), title="Odd time", created_at="2026-01-01T10:00:00.5+00:00"),
+        Task(id=new_id(), title="Odd due", due="next week"),
+        Task(id=new_id(), title="Repeats", due="2026-01-05", repeat="FREQ=DAILY", repeat_done="3"),
+        Task(id=new_id(), title="Stray completions", repeat_done="2;4"),
+    ]
+    tasks = _tasks(50) + odd
+    table = TaskTable(tasks)
+    assert len(table) == len(tasks)
+    assert list(table.values()) == tasks
+    assert [table[t.id] for t in tasks] == tasks
+    assert list(table) == [t.id for t in tasks]
+    assert "missing" not in table and new_id() not in table
+
+
+@pytest.mark.parametrize("cls", [TaskDict, TaskTable])
+def test_tables_keep_sequence_numbers_until_forgotten(cls):
+    tasks = _tasks(200)
+    table = cls(tasks)
+    t = tasks[10]
+    table.vacate(t.id)
+    assert t.id not in table and table.seq(t.id) == 10
+    table[t.id] = t  # a rolled-back delete returns to its place
+    assert table.seq(t.id) == 10 and table.at(10) == t
+    del table[t.id]
+    with pytest.raises(KeyError):
+        table.seq(t.id)
+    table[t.id] = t
+    assert table.seq(t.id) == 200
+    assert not t.done
+    assert list(table.rows("done")) == [i for i, x in enumerate(tasks) if x.done]
+    assert list(table.rows("active"))[-1] == 200
+
+
+def test_table_counts_scan_columns():
+    tasks = _tasks(300)
+    table = TaskTable(tasks)
+    for t in tasks[:30]:
+        del table[t.id]
+    live = tasks[30:]
+    assert table.count() == len(live)
+    assert table.count(done=True) == sum(t.done for t in live)
+    assert table.count(priority=Priority.HIGH) == sum(t.priority is Priority.HIGH for t in live)
+    assert table.count(done=False, priority=Priority.LOW) == sum(
+        not t.done and t.priority is Priority.LOW for t in live
+    )
+
+
+def test_compact_controller_matches_default():
+    tasks = _tasks(100)
+    results = []
+    for compact in (False, True):
+        c = Controller(MemoryStore(tasks), compact=compact)
+        added = c.add_task("New one")
+        c.toggle_task(tasks[1].id)
+        c.delete_task(tasks[2].id)
+        with pytest.raises(RuntimeError):
+            with c.batch():
+                c.delete_task(tasks[3].id)
+                raise RuntimeError
+        c.clear_completed()
+        results.append(([t.title for t in c.view("active")], c.stats.done, added.id in c))
+    assert results[0] == results[1]
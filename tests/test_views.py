@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_views.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import random
+from datetime import datetime
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.model import Task, Priority
+from todo_list_tk.sortedlist import SortedList
+from todo_list_tk.storage import MemoryStore
+
+
+def test_sorted_list_matches_sorted():
+    values = random.Random(1).sample(range(10_000), 3_000)
+    sl = SortedList(load=8)
+    for v in values:
+        sl.add(v)
+    for v in values[::3]:
+        sl.remove(v)
+    expected = sorted(set(values) - set(values[::3]))
+    assert list(sl) == expected
+    assert [sl[i] for i in range(0, len(sl), 97)] == expected[::97]
+    assert sl.bisect_left(5_000) == sum(v < 5_000 for v in expected)
+    with pytest.raises(ValueError):
+        sl.remove(values[0])
+
+
+def test_views_and_stats_follow_mutations():
+    store = MemoryStore([
+        Task(id="a", title="A", due="2000-01-01"),
+        Task(id="b", title="B", done=True),
+        Task(id="c", title="C", priority=Priority.HIGH),
+    ])
+    c = Controller(store)
+    assert [t.id for t in c.view("active")] == ["a", "c"]
+    assert c.stats.overdue(datetime(2026, 1, 1)) == 1
+
+    c.toggle_task("b")  # back to active: keeps its original position
+    c.toggle_task("a")
+    assert [t.id for t in c.view("active")] == ["b", "c"]
+    assert [t.id for t in c.view("done")] == ["a"]
+    assert (c.stats.total, c.stats.active, c.stats.done) == (3, 2, 1)
+    assert c.stats.by_priority[Priority.HIGH] == 1
+    assert c.stats.overdue(datetime(2026, 1, 1)) == 0
+
+    c.clear_completed()
+    assert [t.id for t in c.view()] == ["b", "c"]
+    assert c.count(done=True) == 0
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_sort_orders_follow_mutations(compact: bool):
+    store = MemoryStore([
+        Task(id="a", title="banana", due="2030-01-02"),
+        Task(id="b", title="Apple", priority=Priority.LOW, due="2030-01-01"),
+        Task(id="c", title="cherry", priority=Priority.HIGH),
+    ])
+    c = Controller(store, compact=compact)
+
+    def ids(view):
+        return [t.id for t in view]
+
+    assert ids(c.view("all", "title")) == ["b", "a", "c"]
+    assert ids(c.view("all", "due")) == ["b", "a", "c"]
+    assert ids(c.view("all", "priority")) == ["c", "a", "b"]
+
+    c.set_priority("b", Priority.HIGH)
+    c.rename_task("c", "Aardvark")
+    c.toggle_task("a")
+    assert ids(c.view("all", "priority")) == ["b", "c", "a"]
+    assert ids(c.view("all", "title")) == ["c", "b", "a"]
+    assert ids(c.view("active", "due")) == ["b", "c"]
+    # Rebuilding from scratch gives the same order as maintaining it.
+    fresh = Controller(MemoryStore(c.tasks), compact=compact)
+    for order in ("priority", "due", "title", "updated"):
+        assert ids(c.view("all", order)) == ids(fresh.view("all", order))
+    assert ids(c.view("all", "updated")[:1]) == [c.view("all", "updated")[0].id]
+
+
+class RecordingStore(MemoryStore):
+    def __init__(self, tasks=()) -> None:
+        super().__init__(tasks)
+        self.commits: list = []
+
+    def commit(self, tasks, upserted=(), deleted=()):
+        self.commits.append(sorted(t.title for t in upserted))
+
+
+def test_manual_order_rewrites_only_the_moved_task():
+    store = RecordingStore()
+    c = Controller(store)
+    a, b, d = c.add_tasks(["A", "B", "D"])
+    manual = c.view("all", "manual")
+    assert [t.title for t in manual] == ["A", "B", "D"]
+
+    c.move_task(d.id, before_id=a.id)
+    assert [t.title for t in manual] == ["D", "A", "B"]
+    e = c.add_task("E")  # new tasks go last
+    assert [t.title for t in manual] == ["D", "A", "B", "E"]
+
+    commits = store.commits
+    assert commits[-2:] == [["D"], ["E"]]
+    del commits[:]
+    c.move_task(a.id)  # to the end
+    c.move_task(b.id, before_id=d.id)
+    assert [t.title for t in manual] == ["B", "D", "E", "A"]
+    assert commits == [["A"], ["B"]]
+    c.move_task(b.id, before_id=d.id)  # already there
+    assert len(commits) == 2
+    f = c.add_task("F")  # in the same second as the move, still after A
+    assert [t.title for t in manual][-2:] == ["A", "F"]
+    reloaded = Controller(MemoryStore(c.tasks)).view("all", "manual")
+    assert [t.title for t in reloaded] == ["B", "D", "E", "A", "F"]
+
+    c.toggle_task(d.id)
+    c.move_task(e.id, before_id=b.id, within="active")
+    assert [t.title for t in c.view("active", "manual")] == ["E", "B", "A", "F"]
+    c.undo()
+    assert [t.title for t in manual] == ["B", "D", "E", "A", "F"]
+    assert f.id in c
+
+
+def test_a_move_in_a_large_list_writes_only_the_moved_task():
+    c = Controller(RecordingStore())
+    tasks = c.add_tasks([f"T{i}" for i in range(10_000)])  # one second: ranks spread over it
+    del c.store.commits[:]
+    c.move_task(tasks[0].id)
+    c.move_task(tasks[9_999].id, before_id=tasks[5_000].id)
+    assert c.store.commits == [["T0"], ["T9999"]]
+    assert max(len(t.rank or "") for t in c.tasks) < 20
+
+    # Never placed by hand and created in the same second, as after an older import.
+    old = "2020-01-01T00:00:00"
+    store = RecordingStore(
+        Task(id=str(i), title=f"T{i}", done=i % 2 == 0, created_at=old, updated_at=old)
+        for i in range(10_000)
+    )
+    c = Controller(store)
+    manual = c.view("all", "manual")
+    c.move_task("0")  # to the end
+    c.move_task("9998", before_id="1")  # to the start
+    c.move_task("5000", before_id="3")  # into the tie: "1" and "2" get ranks as well
+    assert store.commits == [["T0"], ["T9998"], ["T1", "T2", "T5000"]]
+    assert [t.id for t in manual[:5]] == ["9998", "1", "2", "5000", "3"]
+    assert manual[len(manual) - 1].id == "0"
+    assert c.get("1").updated_at == c.get("2").updated_at == old
+    assert {t.id for t in c.view("all", "updated")[:3]} == {"0", "9998", "5000"}
+
+
+def test_repositions_tells_in_place_edits_from_row_moves():
+    c = Controller(MemoryStore())
+    a = c.add_task("Alpha")
+    renamed, toggled = a.rename("Beta"), a.toggle()
+    assert not c.view("all").repositions(a, renamed)
+    assert c.view("all", "title").repositions(a, renamed)
+    assert c.view("active").repositions(a, toggled) and not c.view("all").repositions(a, toggled)
+    assert c.view("all").repositions(None, a) and c.view("all").repositions(a, None)
+    assert not c.view("overdue").repositions(a, renamed)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_watcher.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.storage import JsonStore, save_tasks
+from todo_list_tk.watcher import InotifyWatcher, StatWatcher
+
+
+def test_stat_watcher_sees_replaced_file(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    save_tasks([], path)
+    w = StatWatcher(path)
+    assert not w.changed()
+    c = Controller(JsonStore(tmp_path / "other.json"))
+    save_tasks([c.add_task("Milk")], path)
+    assert w.changed()
+    assert not w.changed()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_ignores_other_files(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    save_tasks([], path)
+    w = InotifyWatcher(path)
+    try:
+        assert w.fileno() is not None
+        assert not w.changed()
+        (tmp_path / "notes.txt").write_text("x")
+        assert not w.changed()
+        save_tasks([], path)  # temp file renamed over the watched name
+        assert w.changed()
+        assert not w.changed()
+    finally:
+        w.close()
+
+
+def test_reload_external_applies_only_deltas(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    a = Controller(JsonStore(path))
+    keep = a.add_task("Keep")
+    edit = a.add_task("Edit me")
+    gone = a.add_task("Delete me")
+    events = []
+    a.subscribe(events.extend)
+
+    assert a.reload_external() == 0  # only our own writes so far
+
+    b = Controller(JsonStore(path))
+    b.rename_task(edit.id, "Edited elsewhere")
+    b.delete_task(gone.id)
+    added = b.add_task("Added elsewhere")
+    b.close()
+
+    assert a.reload_external() == 3
+    assert sorted((e.kind, e.task_id) for e in events) == sorted(
+        [("updated", edit.id), ("removed", gone.id), ("added", added.id)]
+    )
+    assert a.get(edit.id).title == "Edited elsewhere"
+    assert gone.id not in a and keep.id in a
+    assert [t.title for t in a.view("all")] == ["Keep", "Edited elsewhere", "Added elsewhere"]
+    assert a.reload_external() == 0
+    a.close()
+
+
+def test_local_save_does_not_swallow_external_changes(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    a = Controller(JsonStore(path))
+    gone = a.add_task("Delete me")
+    a.add_task("Keep")
+
+    b = Controller(JsonStore(path))
+    added = b.add_task("Added elsewhere")
+    b.delete_task(gone.id)
+    b.close()
+
+    a.add_task("Added here")  # this save re-reads and merges b's write
+    assert a.reload_external() == 2
+    assert gone.id not in a and added.id in a
+    assert [t.title for t in a.view("all")] == ["Keep", "Added here", "Added elsewhere"]
+    assert a.reload_external() == 0
+    a.close()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================================
+Project: To-Do List (Tkinter)
+File: tests/test_writer.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-18
+Updated: 2026-10-18
+License: MIT License (see LICENSE file for details)
+===========================================================================
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from todo_list_tk.controller import Controller
+from todo_list_tk.storage import JsonStore, MemoryStore, load_tasks
+
+
+class FlakyStore(MemoryStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.commits: List[tuple] = []
+        self.fail = False
+
+    def commit(self, tasks, upserted=(), deleted=()) -> None:
+        if self.fail:
+            raise OSError("disk full")
+        self.commits.append(([t.title for t in upserted], list(deleted)))
+
+
+def test_bursts_are_coalesced(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    c = Controller(JsonStore(path), async_writes=True, write_delay_ms=10_000)
+    tasks = [c.add_task(f"Task {i}") for i in range(20)]
+    for t in tasks[:5]:
+        c.toggle_task(t.id)
+    c.delete_task(tasks[-1].id)
+    assert load_tasks(path) == []  # still inside the debounce window
+    c.close()
+    loaded = load_tasks(path)
+    assert len(loaded) == 19
+    assert sum(t.done for t in loaded) == 5
+
+
+def test_errors_are_reported_and_retried():
+    store = FlakyStore()
+    errors: List[BaseException] = []
+    c = Controller(store, async_writes=True, write_delay_ms=0, on_save_error=errors.append)
+    store.fail = True
+    a = c.add_task("Alpha")
+    c.flush()
+    assert isinstance(errors[0], OSError)
+    assert not c.saving
+
+    store.fail = False
+    c.rename_task(a.id, "Beta")
+    c.close()
+    assert store.commits == [(["Beta"], [])]